@@ -0,0 +1,125 @@
+#
+# furl - URL manipulation made simple.
+#
+# Arthur Grunseid
+# grunseid.com
+# grunseid@gmail.com
+#
+# License: Build Amazing Things (Unlicense)
+"""
+Differential conformance and speed of furl's parser against the stdlib's.
+
+  python -m benchmarks.differential [--count 1000] [--output results.json]
+
+Every corpus URL is parsed with urlparse.urlsplit(), furl.helpers.urlsplit(),
+and Furl(). Components that differ from the stdlib's are reported as
+mismatches, along with examples, and the time per URL of each parser is
+reported relative to urlparse.urlsplit(). The comparison is
+tests/differential.py's, which the test suite runs too.
+"""
+from __future__ import print_function
+
+import argparse
+import json
+import sys
+import urlparse
+from timeit import default_timer
+
+import furl
+from benchmarks.speed import metadata
+from tests import corpus
+from tests.differential import compare, parse
+
+
+PARSERS = [
+    ('urlparse.urlsplit', urlparse.urlsplit),
+    ('furl.helpers.urlsplit', furl.helpers.urlsplit),
+    ('Furl', furl.Furl),
+]
+
+
+def timings(urls, repeat=3):
+    """
+    Returns: Dictionary of parser name to the best time of <repeat> runs, in
+    microseconds per URL, of parsing every URL in <urls>.
+    """
+    results = {}
+    for name, parser in PARSERS:
+        best = None
+        for _ in xrange(repeat):
+            urlparse.clear_cache()
+            start = default_timer()
+            for url in urls:
+                parse(parser, url)
+            elapsed = default_timer() - start
+            best = elapsed if best is None else min(best, elapsed)
+        results[name] = best / len(urls) * 1e6
+    return results
+
+
+def run(count=1000, seed=0, categories=None, repeat=3):
+    """
+    Returns: List of result dictionaries, one for every corpus category in
+    <categories>.
+    """
+    results = []
+    for category in categories or corpus.CATEGORIES:
+        urls = corpus.generate(category, count, seed)
+        results.append({
+            'corpus': category,
+            'urls': len(urls),
+            'mismatches': compare(urls),
+            'us_per_url': timings(urls, repeat),
+        })
+    return results
+
+
+def report(results, examples=3, stream=sys.stdout):
+    baseline = PARSERS[0][0]
+    print('%-11s %-22s %10s %8s' % ('corpus', 'parser', 'us/url', 'ratio'),
+          file=stream)
+    for result in results:
+        times = result['us_per_url']
+        for name, _ in PARSERS:
+            print('%-11s %-22s %10.2f %7.1fx' % (
+                result['corpus'], name, times[name], times[name] / times[baseline]),
+                file=stream)
+
+    print('', file=stream)
+    for result in results:
+        for component, mismatches in sorted(result['mismatches'].items()):
+            print('%s: %s differs for %d of %d URLs' % (
+                result['corpus'], component, len(mismatches), result['urls']),
+                file=stream)
+            for url, expected, actual in mismatches[:examples]:
+                print('  %r: stdlib %r, furl %r' % (url, expected, actual),
+                      file=stream)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--output', help='File to write the JSON results to.')
+    parser.add_argument('--count', type=int, default=1000,
+                        help='Number of URLs per corpus category.')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Number of timed runs per parser.')
+    parser.add_argument('--seed', type=int, default=0, help='Corpus seed.')
+    parser.add_argument('--corpus', action='append', dest='categories',
+                        choices=corpus.CATEGORIES,
+                        help='Only use this corpus category. Can be repeated.')
+    parser.add_argument('--examples', type=int, default=3,
+                        help='Number of mismatches to print per component.')
+    args = parser.parse_args(argv)
+
+    results = run(args.count, args.seed, args.categories, args.repeat)
+    report(results, args.examples)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'metadata': metadata(), 'results': results}, f, indent=2,
+                      sort_keys=True)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
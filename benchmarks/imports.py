@@ -0,0 +1,129 @@
+#
+# furl - URL manipulation made simple.
+#
+# Arthur Grunseid
+# grunseid.com
+# grunseid@gmail.com
+#
+# License: Build Amazing Things (Unlicense)
+"""
+Import time of the furl package, measured in fresh interpreters.
+
+  python -m benchmarks.imports [--runs 20] [--output results.json]
+
+Exits with status 1 if 'import furl', or 'import furl; furl.Furl', takes
+longer than its budget, so it can guard cold start time in CI.
+"""
+from __future__ import print_function
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+from benchmarks.speed import metadata
+
+
+# Budget of 'import furl', in milliseconds. Submodules are imported lazily, so
+# 'import furl' itself only has to create the package.
+IMPORT_BUDGET_MS = 5.0
+
+# Budget of 'import furl; furl.Furl', in milliseconds. Furl's submodules, and
+# the urllib and orderedmultidict modules they need, take about 30 ms to
+# import, as much as furl 0.3.6's eager import did. The optional modules, like
+# canonical, routing, patterns, suffixes, urlset and template, are only
+# imported once they're used, and mustn't be imported by furl.Furl.
+FURL_BUDGET_MS = 40.0
+
+# Each benchmark is (name, setup statement, timed statement).
+BENCHMARKS = [
+    ('import furl', '', 'import furl'),
+    ('import furl; Furl', '', 'import furl; furl.Furl'),
+    ('furl.Furl', 'import furl', 'furl.Furl'),
+    ('from furl import *', '', 'from furl import *'),
+]
+
+_SCRIPT = """
+from timeit import default_timer
+%s
+start = default_timer()
+%s
+print(default_timer() - start)
+"""
+
+
+def measure(setup, statement, runs=20):
+    """
+    Returns: List of the times, in milliseconds, that <statement> took after
+    <setup> in each of <runs> fresh interpreters.
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(
+        filter(None, [root, os.environ.get('PYTHONPATH')])))
+    times = []
+    for _ in xrange(runs):
+        output = subprocess.check_output(
+            [sys.executable, '-c', _SCRIPT % (setup, statement)], env=env)
+        times.append(float(output) * 1e3)
+    return times
+
+
+def run(runs=20):
+    results = []
+    for name, setup, statement in BENCHMARKS:
+        times = sorted(measure(setup, statement, runs))
+        results.append({
+            'benchmark': name,
+            'runs': runs,
+            'min_ms': times[0],
+            'median_ms': times[len(times) // 2],
+        })
+    return results
+
+
+def report(results, budget=IMPORT_BUDGET_MS, furl_budget=FURL_BUDGET_MS,
+           stream=sys.stdout):
+    """
+    Returns: True if 'import furl' is within <budget> milliseconds and 'import
+    furl; furl.Furl' is within <furl_budget> milliseconds, False otherwise.
+    """
+    budgets = {BENCHMARKS[0][0]: budget, BENCHMARKS[1][0]: furl_budget}
+    print('%-20s %10s %10s' % ('benchmark', 'min ms', 'median ms'), file=stream)
+    within = True
+    for result in results:
+        line = '%-20s %10.2f %10.2f' % (result['benchmark'], result['min_ms'],
+                                        result['median_ms'])
+        limit = budgets.get(result['benchmark'])
+        if limit is not None:
+            ok = result['median_ms'] <= limit
+            within = within and ok
+            line += '  %s budget of %.1f ms' % ('within' if ok else 'OVER', limit)
+        print(line, file=stream)
+    return within
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--output', help='File to write the JSON results to.')
+    parser.add_argument('--runs', type=int, default=20,
+                        help='Number of fresh interpreters per benchmark.')
+    parser.add_argument('--budget', type=float, default=IMPORT_BUDGET_MS,
+                        help="Budget of 'import furl' in milliseconds.")
+    parser.add_argument('--furl-budget', type=float, default=FURL_BUDGET_MS,
+                        help="Budget of 'import furl; furl.Furl' in "
+                        "milliseconds.")
+    args = parser.parse_args(argv)
+
+    results = run(args.runs)
+    within = report(results, args.budget, args.furl_budget)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'metadata': metadata(), 'results': results}, f, indent=2,
+                      sort_keys=True)
+    return 0 if within else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,200 @@
+#
+# furl - URL manipulation made simple.
+#
+# Arthur Grunseid
+# grunseid.com
+# grunseid@gmail.com
+#
+# License: Build Amazing Things (Unlicense)
+"""
+Throughput and latency benchmarks of furl's hot paths over synthetic corpora.
+
+  python -m benchmarks.speed [--output results.json] [--compare old.json]
+
+Results are printed as a table and written as JSON, so runs from different
+commits can be compared with --compare.
+"""
+from __future__ import print_function
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from timeit import default_timer
+
+import furl
+from tests import corpus
+
+
+def _nones(urls):
+    return [None] * len(urls)
+
+
+def _furls(urls):
+    return [furl.Furl(url) for url in urls]
+
+
+def _pairs(urls):
+    furls = _furls(urls)
+    return zip(furls, _furls(urls))
+
+
+# Each benchmark is (name, setup, operation). setup(urls) returns the list of
+# arguments to call operation() with, one call per argument. setup() runs before
+# every repetition and isn't timed, so operations that modify their argument
+# always start from the same state.
+BENCHMARKS = [
+    ('Furl()', _nones, lambda _: furl.Furl()),
+    ('Path()', _nones, lambda _: furl.Path()),
+    ('Query()', _nones, lambda _: furl.Query()),
+    ('Fragment()', _nones, lambda _: furl.Fragment()),
+    ('Furl(url)', lambda urls: urls, furl.Furl),
+    ('is_valid(url)', lambda urls: urls, furl.is_valid),
+    ('str(f)', _furls, str),
+    ('f.copy()', _furls, lambda f: f.copy()),
+    ('f.join(rel)', _furls, lambda f: f.join('../a/./b?c=d#e')),
+    ('f.add()', _furls, lambda f: f.add(args={'added': 'value'}, path='more')),
+    ('f.set()', _furls, lambda f: f.set(args={'set': 'value'}, path='/new/path')),
+    ('f.remove()', _furls, lambda f: f.remove(args=['q', 'meat'], path=True)),
+    ('Query.encode()', lambda urls: [f.query for f in _furls(urls)],
+     lambda q: q.encode()),
+    ('str(Path)', lambda urls: [f.path for f in _furls(urls)], str),
+    ('Fragment.load()', lambda urls: [(furl.Fragment(), str(f.fragment))
+                                      for f in _furls(urls)],
+     lambda args: args[0].load(args[1])),
+    ('hash(f)', _furls, hash),
+    ('f == g', _pairs, lambda pair: pair[0] == pair[1]),
+]
+
+
+def run(names=None, count=1000, repeat=5, seed=0, categories=None):
+    """
+    Run the benchmarks named <names>, or all benchmarks if <names> is None, over
+    <count> URLs of every corpus category in <categories>.
+
+    Returns: List of result dictionaries.
+    """
+    results = []
+    for category in categories or corpus.CATEGORIES:
+        urls = corpus.generate(category, count, seed)
+        for name, setup, operation in BENCHMARKS:
+            if names and name not in names:
+                continue
+            results.append(_measure(name, category, urls, setup, operation, repeat))
+    return results
+
+
+def _measure(name, category, urls, setup, operation, repeat):
+    """
+    Time <operation> over the arguments from setup(<urls>). Throughput is taken
+    from the fastest of <repeat> runs. Latency percentiles are taken from timing
+    every call of an additional run individually.
+    """
+    timer = default_timer
+    best = None
+    for _ in xrange(repeat):
+        args = setup(urls)
+        start = timer()
+        for arg in args:
+            operation(arg)
+        elapsed = timer() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    latencies = []
+    for arg in setup(urls):
+        start = timer()
+        operation(arg)
+        latencies.append(timer() - start)
+    latencies.sort()
+
+    def percentile(p):
+        return latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1e6
+
+    return {
+        'benchmark': name,
+        'corpus': category,
+        'operations': len(latencies),
+        'ops_per_sec': len(latencies) / best if best else float('inf'),
+        'mean_us': best / len(latencies) * 1e6,
+        'p50_us': percentile(0.50),
+        'p99_us': percentile(0.99),
+    }
+
+
+def metadata():
+    """
+    Returns: Dictionary describing the environment the benchmarks ran in.
+    """
+    try:
+        with open(os.devnull, 'w') as devnull:
+            commit = subprocess.check_output(
+                ['git', 'rev-parse', '--short', 'HEAD'], stderr=devnull).strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'furl_version': furl.__version__,
+        'commit': commit,
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'timestamp': int(time.time()),
+    }
+
+
+def report(results, compare=None, key='ops_per_sec', stream=sys.stdout):
+    """
+    Print <results> as a table. If <compare> is a list of earlier results, the
+    ratio of each result to its earlier counterpart is printed, too.
+    """
+    earlier = {}
+    for result in compare or []:
+        earlier[(result['benchmark'], result['corpus'])] = result
+
+    header = '%-18s %-11s %12s %10s %10s' % ('benchmark', 'corpus', 'ops/sec',
+                                            'p50 us', 'p99 us')
+    print(header + ('    change' if compare else ''), file=stream)
+    for result in results:
+        line = '%-18s %-11s %12.0f %10.2f %10.2f' % (
+            result['benchmark'], result['corpus'], result['ops_per_sec'],
+            result['p50_us'], result['p99_us'])
+        old = earlier.get((result['benchmark'], result['corpus']))
+        if old and old.get(key):
+            line += '  %+7.1f%%' % ((result[key] / old[key] - 1) * 100)
+        print(line, file=stream)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--output', help='File to write the JSON results to.')
+    parser.add_argument('--compare', help='JSON results of an earlier run.')
+    parser.add_argument('--count', type=int, default=1000,
+                        help='Number of URLs per corpus category.')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='Number of timed runs per benchmark.')
+    parser.add_argument('--seed', type=int, default=0, help='Corpus seed.')
+    parser.add_argument('--benchmark', action='append', dest='names',
+                        help='Only run this benchmark. Can be repeated.')
+    parser.add_argument('--corpus', action='append', dest='categories',
+                        choices=corpus.CATEGORIES,
+                        help='Only use this corpus category. Can be repeated.')
+    args = parser.parse_args(argv)
+
+    results = run(args.names, args.count, args.repeat, args.seed, args.categories)
+    compare = None
+    if args.compare:
+        with open(args.compare) as f:
+            compare = json.load(f)['results']
+    report(results, compare)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'metadata': metadata(), 'results': results}, f, indent=2,
+                      sort_keys=True)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
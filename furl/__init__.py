@@ -6,6 +6,8 @@
 # grunseid@gmail.com
 #
 # License: Build Amazing Things (Unlicense)
+import sys
+from types import ModuleType
 
 __title__ = 'furl'
 __version__ = '0.3.6' # Keep synchronized with ../setup.py.
@@ -14,10 +16,86 @@ __contact__ = 'grunseid@gmail.com'
 __license__ = 'Unlicense'
 __url__ = 'https://github.com/gruns/furl'
 
-from .core import *
-from .fragment import *
-from .helpers import *
-from .multidict import *
-from .path import *
-from .query import *
-from .stringlike import *
+# Submodules and the public names they define. Submodules are only imported
+# once one of their names is used, so 'import furl' is cheap and, for example,
+# programs that never use URLSet never import mmap.
+_exports = {
+    'canonical': ['UNRESERVED_CHARS', 'PERCENT_ESCAPE_REGEX', 'CanonicalProfile',
+                  'DEFAULT_PROFILE', 'canonical_components', 'canonicalize',
+                  'canonicalize_many', 'unsplit_components'],
+    'core': ['Furl', 'join_many'],
+    'fragment': ['Fragment', 'FragmentCompositionInterface',
+                 'FragmentPathCompositionInterface'],
+    'hashing': ['fingerprint', 'hash_components'],
+    'helpers': ['VALID_ENCODED_PATH_SEGMENT_REGEX', 'VALID_ENCODED_QUERY_KEY_REGEX',
+                'VALID_ENCODED_QUERY_VALUE_REGEX', 'urlsplit', 'urljoin',
+                'split_netloc', 'split_path', 'join_path_segments',
+                'remove_path_segments', 'remove_dot_segments', 'is_valid_port',
+                'is_valid_encoded_path_segment', 'is_valid_encoded_query_key',
+                'is_valid_encoded_query_value', 'VALID_ENCODED_PATH_REGEX',
+                'VALID_ENCODED_QUERY_REGEX', 'is_valid_encoded_path',
+                'is_valid_encoded_query', 'StrictViolation', 'is_strict',
+                'report_violation', 'fix_encoding', 'utf8_str', 'LazyRegex'],
+    'idn': ['CACHE_SIZE', 'host_to_ascii', 'host_to_unicode'],
+    'index': ['sort_key', 'URLIndex'],
+    'instrumentation': ['enable_instrumentation', 'disable_instrumentation',
+                        'instrumentation_enabled', 'stats', 'reset_stats',
+                        'add_hook', 'remove_hook', 'ImplicitSerializationWarning',
+                        'detect_implicit_serializations',
+                        'stop_detecting_implicit_serializations',
+                        'implicit_serializations',
+                        'reset_implicit_serializations'],
+    'interning': ['enable_interning', 'disable_interning', 'interning_enabled',
+                  'interning_stats', 'reset_interning_stats'],
+    'ip': ['pack_ip', 'IPNetworkSet', 'PRIVATE_NETWORKS', 'LOOPBACK_NETWORKS'],
+    'multidict': ['OneDimensionalOrderedMultidict'],
+    'path': ['Path', 'PathCompositionInterface', 'URLPathCompositionInterface'],
+    'patterns': ['PatternSet'],
+    'query': ['Query', 'QueryCompositionInterface', 'QueryFilter'],
+    'routing': ['PARAMETER_REGEX', 'WILDCARD_REGEX', 'Router'],
+    'stringlike': ['StringLikeObject'],
+    'suffixes': ['PUBLIC_SUFFIX_LIST_PATHS', 'MissingPublicSuffixListWarning',
+                 'PublicSuffixList',
+                 'public_suffix_list', 'load_public_suffix_list'],
+    'template': ['UNRESERVED_SAFE_CHARS', 'RESERVED_SAFE_CHARS', 'EXPRESSION_REGEX',
+                 'VARSPEC_REGEX', 'STRAY_PERCENT_REGEX', 'OPERATORS', 'Template'],
+    'urlset': ['URLSet'],
+    'urlstore': ['URLStore'],
+    'validation': ['VALID_URL_REGEX', 'is_valid', 'validate_many'],
+}
+_origins = dict((name, module) for module, names in _exports.items()
+                for name in names)
+
+
+class _LazyModule(ModuleType):
+    """
+    The furl package, which imports its submodules on first use.
+    """
+
+    def __getattr__(self, name):
+        if name in _exports:
+            __import__('%s.%s' % (__name__, name))
+            return ModuleType.__getattribute__(self, name)
+
+        module = _origins.get(name)
+        if module is None:
+            raise AttributeError(
+                "'module' object has no attribute '%s'" % name)
+        __import__('%s.%s' % (__name__, module))
+        value = getattr(sys.modules['%s.%s' % (__name__, module)], name)
+        setattr(self, name, value)
+        return value
+
+    def __dir__(self):
+        return sorted(set(self.__all__) | set(_exports) | set(self.__dict__))
+
+
+_module = sys.modules[__name__]
+_lazy = sys.modules[__name__] = _LazyModule(__name__, __doc__)
+_lazy.__dict__.update(dict(
+    (key, value) for key, value in _module.__dict__.items()
+    if key.startswith('__') or key in ('_exports', '_origins')))
+_lazy.__all__ = sorted(_origins)
+# The globals of this module, which _LazyModule's methods use, are cleared when
+# the module is deallocated. Keep it alive.
+_lazy._module = _module
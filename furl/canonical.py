@@ -0,0 +1,249 @@
+#
+# furl - URL manipulation made simple.
+#
+# Arthur Grunseid
+# grunseid.com
+# grunseid@gmail.com
+#
+# License: Build Amazing Things (Unlicense)
+import re
+import urllib
+import urlparse
+from operator import itemgetter
+
+from .core import Furl
+from .fragment import Fragment
+from .helpers import urlsplit
+from .helpers import split_netloc
+from .helpers import is_valid_port
+from .helpers import fix_encoding
+from .helpers import remove_dot_segments
+from .helpers import utf8_str
+from .path import Path
+from .query import Query
+from .query import QueryFilter
+
+
+# RFC 3986
+#   unreserved  = ALPHA / DIGIT / "-" / "." / "_" / "~"
+UNRESERVED_CHARS = frozenset(
+    'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-._~')
+
+PERCENT_ESCAPE_REGEX = re.compile(r'%([\da-fA-F]{2})')
+
+
+class CanonicalProfile(object):
+    """
+    Set of rules that canonicalize() applies to a URL. Rules are compiled once,
+    when the profile is created, so a profile should be created once and reused
+    for every URL it canonicalizes.
+
+    Percent-escapes are always normalized. Components are decoded and re-encoded
+    the same way Furl serializes them, which uppercases the hexadecimal digits of
+    escapes and decodes escaped unreserved characters ('%7e' becomes '~').
+
+    Attributes:
+      lowercase_scheme: Boolean whether or not the scheme is lowercased.
+      lowercase_host: Boolean whether or not the host is lowercased. Furl
+        objects lowercase hosts when they parse URLs, so for Furl objects this
+        only affects hosts assigned to Furl.host.
+      drop_default_port: Boolean whether or not a port equal to the scheme's
+        default port in Furl.DEFAULT_PORTS is dropped. If False, default ports are
+        written out explicitly instead, so 'http://a.com' and 'http://a.com:80'
+        still have the same canonical form.
+      remove_dot_segments: Boolean whether or not '.' and '..' path segments are
+        removed.
+      empty_path_as_root: Boolean whether or not an empty path is replaced with
+        '/' if the URL has a netloc.
+      sort_query: Boolean whether or not query parameters are sorted by key.
+        Parameters with the same key keep their relative order.
+      query_allow: Collection of query keys to keep, or None to keep all keys.
+      query_deny: Collection of query keys to drop. Keys can be globs, so
+        'utm_*' drops all keys that start with 'utm_'.
+      query_filter: The QueryFilter compiled from <query_allow> and
+        <query_deny>.
+      drop_fragment: Boolean whether or not the fragment is dropped entirely. An
+        empty fragment is always dropped.
+    """
+
+    def __init__(self, lowercase_scheme=True, lowercase_host=True,
+                 drop_default_port=True, remove_dot_segments=True,
+                 empty_path_as_root=True, sort_query=False, query_allow=None,
+                 query_deny=(), drop_fragment=False):
+        self.lowercase_scheme = lowercase_scheme
+        self.lowercase_host = lowercase_host
+        self.drop_default_port = drop_default_port
+        self.remove_dot_segments = remove_dot_segments
+        self.empty_path_as_root = empty_path_as_root
+        self.sort_query = sort_query
+        self.drop_fragment = drop_fragment
+
+        self.query_filter = QueryFilter(query_allow, query_deny)
+        self.query_allow = self.query_filter.allow
+        self.query_deny = self.query_filter.deny
+
+    def keeps_query_key(self, key):
+        """
+        Returns: True if query parameters with the decoded key <key> are kept,
+        False otherwise.
+        """
+        return self.query_filter.keeps(key)
+
+
+DEFAULT_PROFILE = CanonicalProfile()
+
+
+def canonical_components(url, profile=None):
+    """
+    Canonicalize the components of <url>, a URL string or Furl object, according
+    to the rules of <profile>, a CanonicalProfile. DEFAULT_PROFILE is used if
+    <profile> is None.
+
+    URL strings are split into their components once and never loaded into a
+    Furl object. The components of Furl objects are used as-is, so Furl objects
+    aren't serialized. Either way, the same URL yields the same components,
+    except that Furl objects lowercase hosts when they parse URLs, whatever
+    <profile>.lowercase_host is.
+
+    Returns: Tuple (scheme, netloc, path, query, fragment) of encoded component
+    strings. Components that aren't present are ''.
+    Raises: ValueError on invalid URL (for example malformed IPv6 address or
+    invalid port).
+    """
+    if profile is None:
+        profile = DEFAULT_PROFILE
+
+    if isinstance(url, basestring):
+        scheme, netloc, path, query, fragment = urlsplit(fix_encoding(url))
+        username = password = host = port = None
+        if netloc:
+            username, password, host, port = split_netloc(netloc)
+            username, password = username or None, password or None
+            if port is not None:
+                if not is_valid_port(port):
+                    raise ValueError("Invalid port: '%s'" % port)
+                port = int(port)
+        # Decode segments like Path.load() does, which unquotes them twice.
+        unquote = urllib.unquote
+        segments = [unquote(unquote(s)) for s in path.split('/')] if path else []
+        items = urlparse.parse_qsl(query, keep_blank_values=True)
+        if profile.drop_fragment:
+            fragment = ''
+        elif fragment:
+            fragment = str(Fragment(fragment))
+        default_ports = Furl.DEFAULT_PORTS
+    else:
+        scheme, username, password = url.scheme or '', url.username, url.password
+        host, port = url.host, url.port
+        segments = url.path.segments
+        if url.path.isabsolute:
+            segments = [''] + segments
+        items = url.query.params.iterallitems()
+        fragment = '' if profile.drop_fragment else str(url.fragment)
+        default_ports = url.DEFAULT_PORTS
+
+    if profile.lowercase_scheme:
+        scheme = scheme.lower()
+
+    netloc = host or ''
+    if netloc and profile.lowercase_host:
+        netloc = netloc.lower()
+    default_port = default_ports.get(scheme.lower())
+    port = port or default_port
+    if port and (port != default_port or not profile.drop_default_port):
+        netloc += ':%d' % port
+    if username is not None or password is not None:
+        userpass = username or ''
+        if password is not None:
+            userpass += ':' + password
+        netloc = userpass + '@' + netloc
+
+    if profile.remove_dot_segments:
+        segments = remove_dot_segments(segments)
+    path = '/'.join(urllib.quote(s, Path.SAFE_SEGMENT_CHARS) for s in segments)
+    if not path and netloc and profile.empty_path_as_root:
+        path = '/'
+
+    pairs = []
+    keeps_query_key = profile.keeps_query_key
+    for key, value in items:
+        key, value = utf8_str(key), utf8_str(value)
+        if keeps_query_key(key):
+            pairs.append((key, value))
+    if profile.sort_query:
+        pairs.sort(key=itemgetter(0))
+    query = '&'.join(
+        '%s=%s' % (urllib.quote_plus(key, Query.SAFE_KEY_CHARS),
+                   urllib.quote_plus(value, Query.SAFE_VALUE_CHARS))
+        for key, value in pairs)
+
+    if '%' in fragment:
+        fragment = PERCENT_ESCAPE_REGEX.sub(_normalize_percent_escape, fragment)
+
+    return scheme, netloc, path, query, fragment
+
+
+def canonicalize(url, profile=None):
+    """
+    Canonicalize <url>, a URL string or Furl object, according to the rules of
+    <profile>, a CanonicalProfile. DEFAULT_PROFILE is used if <profile> is None.
+
+    Examples:
+      canonicalize('HTTP://Www.Google.COM:80/a/./b/../c?%7euser=1#')
+        == 'http://www.google.com/a/c?~user=1'
+      canonicalize('http://a.com/?b=2&utm_source=x&a=1',
+                   CanonicalProfile(sort_query=True, query_deny=['utm_*']))
+        == 'http://a.com/?a=1&b=2'
+
+    Returns: The canonical URL string of <url>.
+    Raises: ValueError on invalid URL.
+    """
+    return unsplit_components(canonical_components(url, profile))
+
+
+def canonicalize_many(urls, profile=None):
+    """
+    Canonicalize every URL string or Furl object in <urls> according to the rules
+    of <profile>. See canonicalize().
+
+    Returns: A list of canonical URL strings, one for each URL in <urls>.
+    Raises: ValueError on invalid URL.
+    """
+    if profile is None:
+        profile = DEFAULT_PROFILE
+    components = canonical_components
+    unsplit = unsplit_components
+    return [unsplit(components(url, profile)) for url in urls]
+
+
+def unsplit_components(components):
+    """
+    Combine the encoded component strings <components> into a URL string.
+
+    Example:
+      unsplit_components(('http', 'a.com', '/b', 'c=d', 'e'))
+        == 'http://a.com/b?c=d#e'
+
+    Returns: The URL string of the tuple (scheme, netloc, path, query, fragment)
+    <components>.
+    """
+    scheme, netloc, path, query, fragment = components
+    url = path
+    if netloc:
+        if path and not path.startswith('/'):
+            url = '/' + url
+        url = '//' + netloc + url
+    if scheme:
+        url = scheme + ':' + url
+    if query:
+        url += '?' + query
+    if fragment:
+        url += '#' + fragment
+    return url
+
+
+def _normalize_percent_escape(match):
+    char = chr(int(match.group(1), 16))
+    if char in UNRESERVED_CHARS:
+        return char
+    return '%' + match.group(1).upper()
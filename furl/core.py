@@ -6,14 +6,17 @@
 # grunseid@gmail.com
 #
 # License: Build Amazing Things (Unlicense)
+import urllib
 import urlparse
 import warnings
 
 from .fragment import FragmentCompositionInterface
 from .helpers import urlsplit
-from .helpers import urljoin
 from .helpers import is_valid_port
+from .helpers import remove_dot_segments
+from .helpers import split_netloc
 from .helpers import fix_encoding
+from .interning import pool as _interning
 from .path import PathCompositionInterface, URLPathCompositionInterface
 from .query import QueryCompositionInterface
 from .stringlike import StringLikeObject
@@ -21,6 +24,14 @@ from .stringlike import StringLikeObject
 
 _absent = object()
 
+# Attributes whose assignment changes a Furl's origin.
+_ORIGIN_ATTRIBUTES = frozenset(['scheme', '_host', '_port'])
+
+# Attributes whose assignment invalidates a Furl's cached fingerprint. The path,
+# query, and fragment can be changed in place, so they're compared instead.
+_FINGERPRINT_ATTRIBUTES = frozenset(
+    ['scheme', 'username', 'password', '_host', '_port'])
+
 
 # TODO(grun): Subclass Path, PathCompositionInterface, Query, and
 # QueryCompositionInterface into two subclasses each - one for the URL and one
@@ -48,15 +59,28 @@ class Furl(StringLikeObject, URLPathCompositionInterface, QueryCompositionInterf
       strict: Boolean whether or not UserWarnings should be raised if improperly
         encoded path, query, or fragment strings are provided to methods that take
         such strings, like load(), add(), set(), remove(), etc.
+        A list can be given instead of True to collect StrictViolations into,
+        rather than raising UserWarnings.
       username: Username string for authentication. Initially None.
       password: Password string for authentication with <username>. Initially
         None.
       scheme: URL scheme ('http', 'https', etc). All lowercase. Initially None.
       host: URL host (domain, IPv4 address, or IPv6 address), not including
         port. All lowercase. Initially None.
+      host_ascii: Read-only IDNA ASCII form of the host, like
+        'xn--bcher-kva.example'. host_unicode is the decoded form.
       port: Port. Valid port values are 1-65535, or None meaning no port
         specified.
       netloc: Network location. Combined host and port string. Initially None.
+      origin: Read-only, cached (scheme, host, port) tuple.
+      packed_ip: Read-only packed binary form of the host if it's an IP
+        address, or None. is_ip, ip_version, is_private, and is_loopback
+        classify it.
+      registered_domain: Read-only domain of the host registered under its
+        public suffix, like 'bbc.co.uk' for 'www.bbc.co.uk'.
+      public_suffix: Read-only public suffix of the host, like 'co.uk'.
+      subdomain: Read-only labels of the host before its registered domain,
+        like 'www'.
       path: Path object from URLPathCompositionInterface.
       query: Query object from QueryCompositionInterface.
       fragment: Fragment object from FragmentCompositionInterface.
@@ -76,8 +100,11 @@ class Furl(StringLikeObject, URLPathCompositionInterface, QueryCompositionInterf
         QueryCompositionInterface.__init__(self, strict=strict)
         FragmentCompositionInterface.__init__(self, strict=strict)
         self.strict = strict
+        self._fingerprint = None # (state, seed, bits, profile, fingerprint).
+        self._origin = None
+        self._ip = None # (host, packed IP address of host).
 
-        self.load(fix_encoding(url))  # Raises ValueError on invalid url.
+        self.load(url)  # Raises ValueError on invalid url.
 
     def load(self, url):
         """
@@ -89,10 +116,16 @@ class Furl(StringLikeObject, URLPathCompositionInterface, QueryCompositionInterf
         self.username = self.password = self.scheme = self._host = None
         self._port = None
 
+        url = fix_encoding(url)
         tokens = urlsplit(url) # Raises ValueError on malformed IPv6 address.
 
         self.netloc = tokens.netloc # Raises ValueError.
         self.scheme = tokens.scheme.lower() or None
+        if _interning.enabled:
+            if self.scheme:
+                self.scheme = _interning.intern(self.scheme)
+            if self._host:
+                self._host = _interning.intern(self._host)
         if not self.port:
             self._port = self.DEFAULT_PORTS.get(self.scheme)
         self.path.load(tokens.path)
@@ -112,6 +145,28 @@ class Furl(StringLikeObject, URLPathCompositionInterface, QueryCompositionInterf
         urlparse.urlsplit('http://%s/' % host) # Raises ValueError.
         self._host = host
 
+    @property
+    def host_ascii(self):
+        """
+        The host in IDNA's ASCII form, like 'xn--bcher-kva.example', for DNS
+        lookups and HTTP Host headers. See idn.host_to_ascii().
+
+        Raises: ValueError if the host can't be converted.
+        """
+        from .idn import host_to_ascii
+        return host_to_ascii(self._host)
+
+    @property
+    def host_unicode(self):
+        """
+        The host as a UTF-8 string with its IDNA ASCII labels, like
+        'xn--bcher-kva', decoded, for display. See idn.host_to_unicode().
+
+        Raises: ValueError if a label of the host isn't valid IDNA.
+        """
+        from .idn import host_to_unicode
+        return host_to_unicode(self._host)
+
     @property
     def port(self):
         return self._port
@@ -126,7 +181,7 @@ class Furl(StringLikeObject, URLPathCompositionInterface, QueryCompositionInterf
         Raises: ValueError on invalid port.
         """
         if port is None:
-            self._port = self.DEFAULT_PORTS.get(self.scheme)
+            self._port = self._default_port()
         elif is_valid_port(port):
             self._port = int(str(port))
         else:
@@ -141,7 +196,7 @@ class Furl(StringLikeObject, URLPathCompositionInterface, QueryCompositionInterf
             userpass += '@'
 
         netloc = self.host or ''
-        if self.port and self.port != self.DEFAULT_PORTS.get(self.scheme):
+        if self.port and self.port != self._default_port():
             netloc += ':' + str(self.port)
 
         netloc = ((userpass or '') + (netloc or ''))
@@ -154,33 +209,10 @@ class Furl(StringLikeObject, URLPathCompositionInterface, QueryCompositionInterf
           netloc: Network location string, like 'google.com' or 'google.com:99'.
         Raises: ValueError on invalid port or malformed IPv6 address.
         """
-        # Raises ValueError on malformed IPv6 addresses.
-        urlparse.urlsplit('http://%s/' % netloc)
-
-        username = password = host = port = None
-
-        if '@' in netloc:
-            userpass, netloc = netloc.split('@', 1)
-            if ':' in userpass:
-                username, password = userpass.split(':', 1)
-            else:
-                username = userpass
-
-        if ':' in netloc:
-            # IPv6 address literal.
-            if ']' in netloc:
-                colonpos, bracketpos = netloc.rfind(':'), netloc.rfind(']')
-                if colonpos > bracketpos and colonpos != bracketpos + 1:
-                    raise ValueError("Invalid netloc: '%s'" % netloc)
-                elif colonpos > bracketpos and colonpos == bracketpos + 1:
-                    host, port = netloc.rsplit(':', 1)
-                else:
-                    host = netloc.lower()
-            else:
-                host, port = netloc.rsplit(':', 1)
-                host = host.lower()
-        else:
-            host = netloc.lower()
+        # Raises ValueError on malformed IPv6 addresses or an invalid netloc.
+        username, password, host, port = split_netloc(netloc)
+        if host is not None:
+            host = host.lower()
 
         # Avoid side effects by assigning self.port before self.host so that if an
         # exception is raised when assigning self.port, self.host isn't updated.
@@ -197,6 +229,112 @@ class Furl(StringLikeObject, URLPathCompositionInterface, QueryCompositionInterf
     def url(self, url):
         self.load(url)
 
+    @property
+    def origin(self):
+        """
+        The (scheme, host, port) tuple of this URL, for example to pick a
+        connection pool. The scheme and host are lowercase and the port is the
+        default port of the scheme if there's no port. The tuple is cached until
+        the scheme, host, or port change.
+        """
+        origin = self._origin
+        if origin is None:
+            scheme = self.scheme.lower() if self.scheme else None
+            host, port = self._host, self._port
+            if port is None:
+                port = self._default_port()
+            origin = self._origin = (scheme, host.lower() if host else None, port)
+        return origin
+
+    def same_origin(self, other):
+        """
+        Compare the origin of this URL with that of <other>, a URL string or Furl
+        object, without serializing either.
+
+        Returns: True if <other> has the same scheme, host, and port as this
+        URL, False otherwise.
+        Raises: ValueError if <other> is an invalid URL string.
+        """
+        if isinstance(other, Furl):
+            return self.origin == other.origin
+        return self.origin == _string_origin(other, self.DEFAULT_PORTS)
+
+    def _default_port(self):
+        """
+        Returns: The default port of this URL's scheme in self.DEFAULT_PORTS,
+        whatever the case of the scheme, or None if there's none.
+        """
+        return self.DEFAULT_PORTS.get(self.scheme.lower() if self.scheme else None)
+
+    @property
+    def packed_ip(self):
+        """
+        The packed binary form of the host if it's an IP address, 4 bytes for
+        IPv4 and 16 bytes for IPv6, or None otherwise. See ip.pack_ip(). The
+        host is parsed once, until it changes.
+        """
+        cached = self._ip
+        if cached is None or cached[0] is not self._host:
+            from .ip import pack_ip
+            cached = self._ip = (self._host, pack_ip(self._host))
+        return cached[1]
+
+    @property
+    def is_ip(self):
+        return self.packed_ip is not None
+
+    @property
+    def ip_version(self):
+        """
+        4 or 6 if the host is an IPv4 or IPv6 address, None otherwise.
+        """
+        packed = self.packed_ip
+        if packed is None:
+            return None
+        return 4 if len(packed) == 4 else 6
+
+    @property
+    def is_private(self):
+        """
+        True if the host is an IP address of a private network, like
+        '192.168.0.1' or '[fc00::1]', False otherwise. See ip.PRIVATE_NETWORKS.
+        """
+        from .ip import PRIVATE_NETWORKS
+        return PRIVATE_NETWORKS.contains_packed(self.packed_ip)
+
+    @property
+    def is_loopback(self):
+        from .ip import LOOPBACK_NETWORKS
+        return LOOPBACK_NETWORKS.contains_packed(self.packed_ip)
+
+    @property
+    def registered_domain(self):
+        """
+        The host's domain registered under its public suffix, like 'bbc.co.uk'
+        for 'www.bbc.co.uk', or None if the host is None, an IP address, or a
+        public suffix itself. See suffixes.public_suffix_list().
+        """
+        from .suffixes import public_suffix_list
+        return public_suffix_list().split(self.host)[1]
+
+    @property
+    def public_suffix(self):
+        """
+        The host's public suffix, like 'co.uk' for 'www.bbc.co.uk', or None if
+        the host is None or an IP address.
+        """
+        from .suffixes import public_suffix_list
+        return public_suffix_list().split(self.host)[2]
+
+    @property
+    def subdomain(self):
+        """
+        The labels of the host before its registered domain, like 'www' for
+        'www.bbc.co.uk', or None if there are none.
+        """
+        from .suffixes import public_suffix_list
+        return public_suffix_list().split(self.host)[0]
+
     def add(self, args=_absent, path=_absent, fragment_path=_absent,
             fragment_args=_absent, query_params=_absent):
         """
@@ -403,17 +541,157 @@ class Furl(StringLikeObject, URLPathCompositionInterface, QueryCompositionInterf
         return self
 
     def join(self, url):
-        self.load(urljoin(self.url, str(url)))
+        """
+        Resolve the relative or absolute URL reference <url> against this URL, as
+        described in RFC 3986 section 5.2, and adopt the result. <url> can be a URL
+        string or another Furl object.
+
+          http://tools.ietf.org/html/rfc3986#section-5.2
+
+        The reference is resolved directly against the already parsed components
+        of this URL; this URL is never serialized and re-parsed.
+
+        Returns: <self>.
+        """
+        url = fix_encoding(url)
+        if not isinstance(url, basestring):
+            url = str(url)
+        scheme, netloc, path, query, fragment = urlsplit(url)
+
+        # Like browsers, and RFC 3986 section 5.2.2's non-strict parsers, treat
+        # a reference with this URL's scheme but no authority, like 'http:g',
+        # as a relative reference.
+        if (scheme and scheme.lower() == (self.scheme or '').lower() and
+                not url[len(scheme) + 1:].startswith('//')):
+            url = url[len(scheme) + 1:]
+            scheme, netloc, path, query, fragment = urlsplit(url)
+
+        # Was the reference's query given, even if empty, as in 'path?'?
+        hasquery = '?' in url.split('#', 1)[0]
+        # Dot segments are removed from the reference's still encoded segments,
+        # so encoded dots, like '%2e%2e', are literal segments. The segments of
+        # this URL are already decoded, so they're wrapped in tuples to tell
+        # them apart from dot segments and keep them from being decoded again.
+        refsegments = []
+        if path:
+            refsegments = self.path._segments_from_path(path, unquote=False)
+
+        if scheme:
+            self.load(url)
+            segments = refsegments if path else None
+        elif url.startswith('//'):
+            self.netloc = netloc # Raises ValueError.
+            segments = refsegments
+        elif not path:
+            segments = None
+            if hasquery:
+                self.query.load(query)
+        elif path.startswith('/'):
+            segments = refsegments
+        else:
+            # Merge the reference path with all but the last segment of this
+            # URL's path.
+            segments = [(segment,) for segment in self.path.segments]
+            if self.path.isabsolute:
+                segments = [''] + segments
+            elif self.netloc is not None and not segments:
+                segments = ['', '']
+            segments = segments[:-1] + refsegments
+
+        if not scheme:
+            if path or url.startswith('//'):
+                self.query.load(query)
+            self.fragment.load(fragment)
+
+        if segments is not None:
+            self.path._load_segments(
+                [_unquote_reference_segment(segment)
+                 for segment in remove_dot_segments(segments)])
         return self
 
     def copy(self):
-        return self.__class__(self)
+        """
+        Returns: A new Furl object with an identical URL. Components are copied
+        directly, so the URL isn't serialized and re-parsed.
+        """
+        f = self.__class__(strict=self.strict)
+        f.scheme, f.username, f.password = self.scheme, self.username, self.password
+        f._host, f._port = self._host, self._port
+        for src, dst in ((self.path, f.path), (self.fragment.path, f.fragment.path)):
+            dst.segments = list(src.segments)
+            dst._isabsolute = src._isabsolute
+        f.query.params.load(self.query.params)
+        f.fragment.query.params.load(self.fragment.query.params)
+        f.fragment.separator = self.fragment.separator
+        return f
+
+    def canonical(self, profile=None):
+        """
+        Canonicalize this URL according to the rules of <profile>, a
+        CanonicalProfile. See furl.canonical.canonicalize().
+
+        Returns: The canonical URL string of this URL.
+        """
+        from .canonical import canonicalize
+        return canonicalize(self, profile)
+
+    def fingerprint(self, seed=0, bits=64, profile=None):
+        """
+        Compute a stable fingerprint of this URL. See
+        furl.hashing.fingerprint().
+
+        The fingerprint is cached and only recomputed once this URL has changed.
+        Assigning the scheme, username, password, host, or port clears the
+        cache. The path, query, and fragment can be changed in place, so a
+        cache hit still compares their segments and parameters with those the
+        fingerprint was computed from, which costs about a tenth of computing
+        the fingerprint.
+
+        Returns: The fingerprint of this URL, a non-negative integer less than
+        2**<bits>.
+        """
+        state = self._state()
+        cached = self._fingerprint
+        if (cached is not None and cached[0] == state and cached[1] == seed and
+                cached[2] == bits and cached[3] is profile):
+            return cached[4]
+
+        from .hashing import fingerprint
+        value = fingerprint(self, seed, bits, profile)
+        self._fingerprint = (state, seed, bits, profile, value)
+        return value
+
+    def sort_key(self):
+        """
+        Compute the key that orders this URL by its reversed host labels, then
+        port, then path segments, so URLs of the same site sort together. See
+        furl.index.sort_key().
+
+        Returns: The sort key string of this URL.
+        """
+        from .index import sort_key
+        return sort_key(self)
+
+    def _state(self):
+        """
+        Returns: A tuple of the unencoded path, query, and fragment of this URL.
+        Changing any of them changes the state. Nothing is serialized.
+        """
+        path, fragment = self._path, self._fragment
+        return (path._isabsolute, tuple(path.segments),
+                self._query._params.snapshot(), fragment._path._isabsolute,
+                tuple(fragment._path.segments), fragment._query._params.snapshot(),
+                fragment.separator)
 
     def __setattr__(self, attr, value):
         if (not PathCompositionInterface.__setattr__(self, attr, value) and
                 not QueryCompositionInterface.__setattr__(self, attr, value) and
                 not FragmentCompositionInterface.__setattr__(self, attr, value)):
             object.__setattr__(self, attr, value)
+            if attr in _FINGERPRINT_ATTRIBUTES:
+                object.__setattr__(self, '_fingerprint', None)
+                if attr in _ORIGIN_ATTRIBUTES:
+                    object.__setattr__(self, '_origin', None)
 
     def __str__(self):
         path, query, fragment = str(self.path), str(self.query), str(self.fragment)
@@ -428,3 +706,56 @@ class Furl(StringLikeObject, URLPathCompositionInterface, QueryCompositionInterf
             url += '//'
 
         return url
+
+
+def join_many(base, refs):
+    """
+    Resolve every URL reference in <refs> against the URL <base>, a URL string or
+    Furl object. <base> is parsed at most once, no matter how many references are
+    resolved against it.
+
+    Example:
+      join_many('http://a.com/b/c', ['d', '../e?f=g', '#h'])
+        == [Furl('http://a.com/b/d'), Furl('http://a.com/e?f=g'),
+            Furl('http://a.com/b/c#h')]
+
+    Returns: A list of new Furl objects, one for each reference in <refs>.
+    """
+    if not isinstance(base, Furl):
+        base = Furl(base)
+    return [base.copy().join(ref) for ref in refs]
+
+
+def _unquote_reference_segment(segment):
+    """
+    Returns: The decoded path segment of the segment <segment> left by Furl.join()
+    after removing dot segments. Decoded segments of the base URL are wrapped in
+    tuples. Encoded reference segments that decode to '.' or '..', like '%2e%2e',
+    stay encoded, so they remain literal segments and aren't mistaken for dot
+    segments once the URL is serialized and parsed again.
+    """
+    if isinstance(segment, tuple):
+        return segment[0]
+    unquoted = urllib.unquote(segment)
+    if unquoted in ('.', '..') and unquoted != segment:
+        return segment
+    return unquoted
+
+
+def _string_origin(url, default_ports):
+    """
+    Returns: The (scheme, host, port) tuple of the URL string <url>, like
+    Furl.origin, with the default ports of schemes in <default_ports>, like
+    Furl.DEFAULT_PORTS.
+    Raises: ValueError on invalid URL.
+    """
+    tokens = urlsplit(fix_encoding(url))
+    _, _, host, port = split_netloc(tokens.netloc)
+    scheme = tokens.scheme.lower() or None
+    if port:
+        if not is_valid_port(port):
+            raise ValueError("Invalid port: '%s'" % port)
+        port = int(port)
+    else:
+        port = default_ports.get(scheme)
+    return (scheme, host.lower() if host else None, port)
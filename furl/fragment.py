@@ -1,5 +1,5 @@
-import abc
 import warnings
+from .helpers import fix_encoding
 from .stringlike import StringLikeObject
 from .path import PathCompositionInterface
 from .query import QueryCompositionInterface
@@ -15,7 +15,6 @@ class FragmentPathCompositionInterface(PathCompositionInterface):
     Fragment Paths they be set to absolute (self.isabsolute = True) or not
     absolute (self.isabsolute = False).
     """
-    __metaclass__ = abc.ABCMeta
 
     def __init__(self, strict=False):
         PathCompositionInterface.__init__(self, strict=strict)
@@ -53,6 +52,7 @@ class Fragment(StringLikeObject, FragmentPathCompositionInterface,
         self.path.load('')
         self.query.load('')
 
+        fragment = fix_encoding(fragment)
         toks = fragment.split('?', 1)
         if len(toks) == 0:
             self._path.load('')
@@ -125,7 +125,6 @@ class FragmentCompositionInterface(object):
     """
     Abstract class interface for a parent class that contains a Fragment.
     """
-    __metaclass__ = abc.ABCMeta
 
     def __init__(self, strict=False):
         self._fragment = Fragment(strict=strict)
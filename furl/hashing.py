@@ -0,0 +1,65 @@
+#
+# furl - URL manipulation made simple.
+#
+# Arthur Grunseid
+# grunseid.com
+# grunseid@gmail.com
+#
+# License: Build Amazing Things (Unlicense)
+import hashlib
+import struct
+
+from .canonical import canonical_components
+
+
+_SEED_STRUCT = struct.Struct('<Q')
+_LENGTH_STRUCT = struct.Struct('<I')
+_DIGEST_STRUCT = struct.Struct('<QQ')
+
+
+def fingerprint(url, seed=0, bits=64, profile=None):
+    """
+    Compute a stable fingerprint of <url>, a URL string or Furl object. The
+    fingerprint is a hash of the canonical components of <url> (see
+    canonical_components()), so URLs with the same canonical form have the same
+    fingerprint. The URL string itself is never serialized.
+
+    Fingerprints are stable across processes, platforms, and Python versions.
+    Different seeds yield independent fingerprints of the same URL.
+
+    Parameters:
+      url: URL string or Furl object to fingerprint.
+      seed: Integer seed, 0 to 2**64 - 1.
+      bits: Size of the fingerprint in bits, either 64 or 128.
+      profile: CanonicalProfile used to canonicalize <url>. DEFAULT_PROFILE is
+        used if <profile> is None.
+
+    Returns: The fingerprint of <url>, a non-negative integer less than
+    2**<bits>.
+    Raises: ValueError on invalid URL or invalid <bits>.
+    """
+    return hash_components(canonical_components(url, profile), seed, bits)
+
+
+def hash_components(components, seed=0, bits=64):
+    """
+    Compute a stable hash of the sequence of strings <components>. Every
+    component is length prefixed, so ('ab', 'c') and ('a', 'bc') hash
+    differently.
+
+    Returns: The hash of <components>, a non-negative integer less than
+    2**<bits>.
+    Raises: ValueError if <bits> is neither 64 nor 128.
+    """
+    if bits not in (64, 128):
+        raise ValueError("Invalid fingerprint size: '%s'" % bits)
+
+    md5 = hashlib.md5(_SEED_STRUCT.pack(seed & 0xFFFFFFFFFFFFFFFF))
+    for component in components:
+        md5.update(_LENGTH_STRUCT.pack(len(component)))
+        md5.update(component)
+
+    high, low = _DIGEST_STRUCT.unpack(md5.digest())
+    if bits == 64:
+        return high
+    return (high << 64) | low
@@ -1,5 +1,8 @@
 import re
+import sys
+import urllib
 import urlparse
+import warnings
 
 
 # TODO(grun): These functions need to be expanded to reflect the fact that the
@@ -38,13 +41,38 @@ import urlparse
 #   =====
 #   query       = *( pchar / "/" / "?" )
 #
-VALID_ENCODED_PATH_SEGMENT_REGEX = re.compile(
+class LazyRegex(object):
+    """
+    Regular expression that's compiled on first use instead of when its module
+    is imported.
+    """
+
+    def __init__(self, pattern, flags=0):
+        self.pattern = pattern
+        self.flags = flags
+
+    def __getattr__(self, attr):
+        value = getattr(re.compile(self.pattern, self.flags), attr)
+        setattr(self, attr, value) # Only look up each attribute once.
+        return value
+
+
+VALID_ENCODED_PATH_SEGMENT_REGEX = LazyRegex(
     r"^([\w\-\.~:@!\$&'\(\)\*\+,;=]|(%[\da-fA-F][\da-fA-F]))*$")
-VALID_ENCODED_QUERY_KEY_REGEX = re.compile(
+VALID_ENCODED_QUERY_KEY_REGEX = LazyRegex(
     r"^([\w\-\.~:@!\$&'\(\)\*\+,;/\?]|(%[\da-fA-F][\da-fA-F]))*$")
-VALID_ENCODED_QUERY_VALUE_REGEX = re.compile(
+VALID_ENCODED_QUERY_VALUE_REGEX = LazyRegex(
     r"^([\w\-\.~:@!\$&'\(\)\*\+,;/\?=]|(%[\da-fA-F][\da-fA-F]))*$")
 
+# Whole path and query strings, so strict mode can validate them with a single
+# match instead of one match per segment, key, and value. Path segments can't
+# contain '/', so a path is valid if its segments are. Query keys can't contain
+# '=' and pairs are split on '&' and ';', so a query is valid if it's a valid
+# query value.
+VALID_ENCODED_PATH_REGEX = LazyRegex(
+    r"^([\w\-\.~:@!\$&'\(\)\*\+,;=/]|(%[\da-fA-F][\da-fA-F]))*$")
+VALID_ENCODED_QUERY_REGEX = VALID_ENCODED_QUERY_VALUE_REGEX
+
 
 def _get_scheme(url):
     i = url.find(':')
@@ -112,6 +140,73 @@ def urljoin(base, url):
     return joined
 
 
+def split_path(path, unquote=True):
+    """
+    Split the path string <path> into its segments, dropping the leading '/' of
+    absolute paths. If <unquote> is True, segments are unquoted.
+
+    Examples:
+      split_path('/a/b%20c/') == ['a', 'b c', '']
+      split_path('a/b%20c', unquote=False) == ['a', 'b%20c']
+      split_path('') == []
+
+    Returns: The list of path segment strings of <path>.
+    """
+    path = fix_encoding(path)
+    if path.startswith('/'):
+        path = path[1:]
+    elif not path:
+        return []
+    segments = path.split('/')
+    if unquote and '%' in path:
+        segments = map(urllib.unquote, segments)
+    return segments
+
+
+def split_netloc(netloc):
+    """
+    Split the network location string <netloc> into its username, password, host,
+    and port strings. Components that aren't present are None. Neither the port
+    nor the case of the host are validated or changed.
+
+    Examples:
+      split_netloc('google.com') == (None, None, 'google.com', None)
+      split_netloc('u:p@google.com:99') == ('u', 'p', 'google.com', '99')
+      split_netloc('[::1]:99') == (None, None, '[::1]', '99')
+
+    Returns: Tuple (username, password, host, port).
+    Raises: ValueError on malformed IPv6 address or invalid netloc.
+    """
+    # Raises ValueError on malformed IPv6 addresses.
+    urlparse.urlsplit('http://%s/' % netloc)
+
+    username = password = host = port = None
+
+    if '@' in netloc:
+        userpass, netloc = netloc.split('@', 1)
+        if ':' in userpass:
+            username, password = userpass.split(':', 1)
+        else:
+            username = userpass
+
+    if ':' in netloc:
+        # IPv6 address literal.
+        if ']' in netloc:
+            colonpos, bracketpos = netloc.rfind(':'), netloc.rfind(']')
+            if colonpos > bracketpos and colonpos != bracketpos + 1:
+                raise ValueError("Invalid netloc: '%s'" % netloc)
+            elif colonpos > bracketpos and colonpos == bracketpos + 1:
+                host, port = netloc.rsplit(':', 1)
+            else:
+                host = netloc
+        else:
+            host, port = netloc.rsplit(':', 1)
+    else:
+        host = netloc
+
+    return username, password, host, port
+
+
 def join_path_segments(*args):
     """
     Join multiple lists of path segments together, intelligently handling path
@@ -189,6 +284,47 @@ def remove_path_segments(segments, remove):
     return ret
 
 
+def remove_dot_segments(segments):
+    """
+    Removes the '.' and '..' segments from the path segments <segments>, as
+    described in RFC 3986 section 5.2.4. A leading '' segment marks an absolute
+    path and is never removed by a '..' segment.
+
+      http://tools.ietf.org/html/rfc3986#section-5.2.4
+
+    This function is not encoding aware - it does not test for or change the
+    encoding of path segments it is passed.
+
+    Examples:
+      # '/a/b/c/./../../g' == '/a/g'
+      remove_dot_segments(['','a','b','c','.','..','..','g']) == ['','a','g']
+      # 'mid/content=5/../6' == 'mid/6'
+      remove_dot_segments(['mid','content=5','..','6']) == ['mid','6']
+      # '/a/b/..' == '/a/'
+      remove_dot_segments(['','a','b','..']) == ['','a','']
+      # '/../g' == '/g'
+      remove_dot_segments(['','..','g']) == ['','g']
+
+    Returns: A new list of path segments without any '.' or '..' segments.
+    """
+    finals = []
+    last = len(segments) - 1
+    for i, segment in enumerate(segments):
+        if segment == '.':
+            pass
+        elif segment == '..':
+            if finals and finals != ['']:
+                finals.pop()
+        else:
+            finals.append(segment)
+            continue
+
+        # A trailing '.' or '..' segment leaves a trailing '/' behind.
+        if i == last:
+            finals.append('')
+    return finals
+
+
 def is_valid_port(port):
     port = str(port)
     if not port.isdigit() or int(port) == 0 or int(port) > 65535:
@@ -208,8 +344,133 @@ def is_valid_encoded_query_value(value):
     return bool(VALID_ENCODED_QUERY_VALUE_REGEX.match(value))
 
 
+def is_valid_encoded_path(path):
+    return bool(VALID_ENCODED_PATH_REGEX.match(path))
+
+
+def is_valid_encoded_query(query):
+    return bool(VALID_ENCODED_QUERY_REGEX.match(query))
+
+
+class StrictViolation(object):
+    """
+    An improperly encoded path or query string received in strict mode.
+
+    Attributes:
+      component: 'path' or 'query'.
+      value: The improperly encoded string.
+      suggestion: The properly encoded string that was probably meant instead.
+        It's only computed once it's accessed.
+      message: Warning message describing the violation.
+    """
+
+    def __init__(self, component, value, suggest):
+        """
+        Parameters:
+          suggest: Function that returns the suggestion for <value>.
+        """
+        self.component = component
+        self.value = value
+        self._suggest = suggest
+
+    @property
+    def suggestion(self):
+        return self._suggest()
+
+    @property
+    def message(self):
+        return ("Improperly encoded %s string received: '%s'. "
+                "Proceeding, but did you mean '%s'?" %
+                (self.component, self.value, self.suggestion))
+
+    def __str__(self):
+        return self.message
+
+    def __repr__(self):
+        return '<%s %s %r>' % (self.__class__.__name__, self.component, self.value)
+
+
+def is_strict(strict):
+    """
+    Returns: True if the strict setting <strict> turns strict mode on, that is
+    if it's true, or if it's a list, or any other object with an append()
+    method, to collect StrictViolations into, even an empty one. False, None,
+    and other false values turn strict mode off.
+    """
+    return bool(strict) or hasattr(strict, 'append')
+
+
+def report_violation(strict, violation):
+    """
+    Report the StrictViolation <violation>. If <strict> is a list, or any other
+    object with an append() method, <violation> is appended to it. Otherwise a
+    UserWarning is raised, unless UserWarnings are ignored, in which case the
+    warning's message is never formatted.
+    """
+    if hasattr(strict, 'append'):
+        strict.append(violation)
+    elif not _warning_ignored(UserWarning):
+        warnings.warn(violation.message, UserWarning,
+                      stacklevel=_external_stacklevel())
+
+
+# The name of the package, 'furl', whose frames _external_stacklevel() skips.
+_PACKAGE = __name__.rpartition('.')[0]
+
+
+def _external_stacklevel():
+    """
+    Returns: The stacklevel that attributes a warning raised by the caller to
+    the first calling frame outside of the furl package, however deep inside
+    furl the caller is. Violations are reported from Furl(), Path.load(),
+    Query.add(), and so on, at different depths.
+    """
+    level = 1
+    frame = sys._getframe(1)
+    while frame is not None and _in_package(frame):
+        frame = frame.f_back
+        level += 1
+    return level
+
+
+def _in_package(frame):
+    name = frame.f_globals.get('__name__') or ''
+    return name == _PACKAGE or name.startswith(_PACKAGE + '.')
+
+
+def _warning_ignored(category):
+    """
+    Returns: True if the warnings filters ignore every warning of <category>,
+    False if they don't or if it depends on the warning's message or location.
+    """
+    for action, message, filtercategory, module, lineno in warnings.filters:
+        if not issubclass(category, filtercategory):
+            continue
+        if ((message is None or not message.pattern) and
+                (module is None or not module.pattern) and not lineno):
+            return action == 'ignore'
+        return False
+    return warnings.defaultaction == 'ignore'
+
+
+# Text is held internally as UTF-8 encoded str. Unicode is encoded once, with
+# fix_encoding(), where it enters furl through the public API, like Furl(),
+# load(), add(), and set(), and internal code trusts the text it's handed from
+# there on. The exception is Query.params, which can be modified directly
+# through its omdict interface, so Query.encode() converts its keys and values
+# with utf8_str() if they aren't already str.
 def fix_encoding(item):
     if isinstance(item, unicode):
         item = item.encode('utf-8')
 
     return item
+
+
+def utf8_str(item):
+    """
+    Returns: <item> as a str. Unicode strings are UTF-8 encoded and other objects
+    are converted with str().
+    """
+    if isinstance(item, unicode):
+        return item.encode('utf-8')
+    return str(item)
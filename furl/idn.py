@@ -0,0 +1,118 @@
+#
+# furl - URL manipulation made simple.
+#
+# Arthur Grunseid
+# grunseid.com
+# grunseid@gmail.com
+#
+# License: Build Amazing Things (Unlicense)
+import re
+from encodings import idna
+
+from .helpers import fix_encoding
+
+
+# Maximum number of hosts whose conversions are cached, per direction. The same
+# hosts recur constantly, so converting each host once saves repeating the
+# nameprep and punycode work of every label.
+CACHE_SIZE = 10000
+
+# Full stops that separate labels, like idna.dots.
+_DOTS_REGEX = re.compile(u'[.\u3002\uff0e\uff61]')
+
+_ascii_cache = {}
+_unicode_cache = {}
+
+
+def host_to_ascii(host):
+    """
+    Convert the internationalized host <host>, a UTF-8 or unicode string, to
+    its ASCII form, label by label, with IDNA. Labels that are already ASCII
+    are left as they are.
+
+    Examples:
+      host_to_ascii(u'b\\xfccher.example') == 'xn--bcher-kva.example'
+      host_to_ascii('www.google.com') == 'www.google.com'
+
+    Returns: The ASCII host string, or None if <host> is None.
+    Raises: ValueError if <host> can't be converted, for example because one of
+    its labels is empty or longer than 63 characters once converted.
+    """
+    if host is None:
+        return None
+    host = fix_encoding(host)
+    converted = _ascii_cache.get(host)
+    if converted is None:
+        try:
+            host.decode('ascii')
+            converted = host
+        except UnicodeDecodeError:
+            converted = _to_ascii(host) # Raises ValueError.
+        _cache(_ascii_cache, host, converted)
+    return converted
+
+
+def host_to_unicode(host):
+    """
+    Convert the host <host> to its internationalized form, label by label, by
+    decoding labels in IDNA's ASCII form, which start with 'xn--'. Other labels
+    are left as they are.
+
+    Examples:
+      host_to_unicode('xn--bcher-kva.example') == 'b\\xc3\\xbccher.example'
+      host_to_unicode('www.google.com') == 'www.google.com'
+
+    Returns: The host as a UTF-8 string, like Furl.host, or None if <host> is
+    None.
+    Raises: ValueError if a label of <host> isn't valid IDNA.
+    """
+    if host is None:
+        return None
+    host = fix_encoding(host)
+    converted = _unicode_cache.get(host)
+    if converted is None:
+        if 'xn--' in host.lower():
+            converted = _to_unicode(host) # Raises ValueError.
+        else:
+            converted = host
+        _cache(_unicode_cache, host, converted)
+    return converted
+
+
+def _to_ascii(host):
+    try:
+        labels = _DOTS_REGEX.split(host.decode('utf-8'))
+        if not all(labels[:-1]): # Only a trailing dot can end a label.
+            raise UnicodeError
+        return '.'.join(_label_to_ascii(label) for label in labels)
+    except UnicodeError:
+        raise ValueError("Invalid internationalized host: '%s'" % host)
+
+
+def _to_unicode(host):
+    try:
+        labels = _DOTS_REGEX.split(host.decode('utf-8'))
+        return '.'.join(_label_to_unicode(label) for label in labels).encode(
+            'utf-8')
+    except UnicodeError:
+        raise ValueError("Invalid internationalized host: '%s'" % host)
+
+
+def _label_to_ascii(label):
+    try:
+        return label.encode('ascii')
+    except UnicodeEncodeError:
+        return idna.ToASCII(label) # Raises UnicodeError.
+
+
+def _label_to_unicode(label):
+    lowered = label.lower()
+    if lowered.startswith('xn--'):
+        return idna.ToUnicode(lowered) # Raises UnicodeError.
+    return label
+
+
+def _cache(cache, host, converted):
+    if len(cache) >= CACHE_SIZE:
+        cache.clear()
+    cache[host] = converted
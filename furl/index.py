@@ -0,0 +1,189 @@
+#
+# furl - URL manipulation made simple.
+#
+# Arthur Grunseid
+# grunseid.com
+# grunseid@gmail.com
+#
+# License: Build Amazing Things (Unlicense)
+import struct
+from bisect import bisect_left
+
+from .core import Furl
+from .helpers import fix_encoding
+from .helpers import split_netloc
+from .helpers import split_path
+from .helpers import urlsplit
+
+
+# Sort keys are
+#
+#   reversed host labels, separated by '\x01' | '\x00' | port | path segments,
+#   separated by '\x00'
+#
+# so the keys of a host's URLs sort together, directly followed by the keys of
+# its subdomains' URLs, and the keys of the URLs under a path sort together
+# within a host and port. The port is two big-endian bytes, 0 if there's no
+# port. IP addresses aren't reversed.
+_PORT_STRUCT = struct.Struct('>H')
+_HOST_END = '\x00'
+_LABEL_SEPARATOR = '\x01'
+_SEGMENT_SEPARATOR = '\x00'
+
+
+def sort_key(url):
+    """
+    Compute the sort key of <url>, a URL string or Furl object. Sort keys order
+    URLs by their reversed host labels, then port, then path segments, so the
+    URLs of a site sort together, directly followed by those of its subdomains:
+
+      http://google.com/
+      http://google.com/a
+      http://google.com/a/b
+      http://google.com:8080/
+      http://www.google.com/
+      http://google.org/
+
+    The scheme, query, and fragment don't affect the sort key, apart from the
+    scheme's default port.
+
+    Returns: The sort key string of <url>.
+    Raises: ValueError on invalid URL.
+    """
+    if isinstance(url, Furl):
+        return _key(url.host, url.port, url.path.segments)
+
+    scheme, netloc, path, _, _ = urlsplit(fix_encoding(url))
+    _, _, host, port = split_netloc(netloc)
+    port = int(port) if port else Furl.DEFAULT_PORTS.get(scheme.lower())
+    return _key(host, port, split_path(path))
+
+
+def _key(host, port, segments):
+    return (_host_key(host) + _HOST_END + _PORT_STRUCT.pack(port or 0) +
+            _SEGMENT_SEPARATOR.join(segments))
+
+
+def _host_key(host):
+    if not host:
+        return ''
+    host = host.lower().rstrip('.')
+    if host[-1].isdigit() or host[-1] == ']':
+        return host # IP addresses aren't reversed.
+    return _LABEL_SEPARATOR.join(reversed(host.split('.')))
+
+
+def _successor(prefix):
+    """
+    Returns: The smallest string greater than every string that starts with
+    <prefix>. <prefix> ends with a host key's '\\x00' and port bytes, so
+    incrementing its last byte, carrying over '\\xff' port bytes, never runs
+    out of bytes.
+    """
+    stripped = prefix.rstrip('\xff')
+    return stripped[:-1] + chr(ord(stripped[-1]) + 1)
+
+
+class URLIndex(object):
+    """
+    Sorted collection of URL strings and Furl objects, ordered by their sort
+    keys (see sort_key()), for range scans of sites and paths.
+
+    Example:
+      index = URLIndex(['http://www.google.com/docs/a', 'http://bing.com/'])
+      index.scan('*.google.com', '/docs/') == ['http://www.google.com/docs/a']
+
+    URLs are sorted lazily, once for every batch of URLs added between scans.
+    Scans bisect the sorted keys, so they take time proportional to the log of
+    the number of URLs, plus the number of URLs and ports found.
+    """
+
+    def __init__(self, urls=None):
+        self._entries = [] # Sorted (sort key, insertion number, URL) tuples.
+        self._keys = [] # Sort keys of self._entries.
+        self._pending = []
+        if urls is not None:
+            self.update(urls)
+
+    def add(self, url):
+        """
+        Add <url>, a URL string or Furl object.
+
+        Raises: ValueError on invalid URL.
+        """
+        number = len(self._entries) + len(self._pending)
+        self._pending.append((sort_key(url), number, url))
+
+    def update(self, urls):
+        """
+        Add every URL string and Furl object in <urls>.
+
+        Raises: ValueError on invalid URL.
+        """
+        for url in urls:
+            self.add(url)
+
+    def scan(self, host='*', path=None):
+        """
+        Find the URLs of <host> under <path>.
+
+        Parameters:
+          host: Host whose URLs to find. If <host> starts with '*.', the URLs of
+            its subdomains are found instead, like PatternSet. A lone '*' finds
+            the URLs of every host.
+          path: Path string, like '/docs/', under which URLs are found. URLs
+            whose path is <path>, or whose path segments start with those of
+            <path>, are under <path>. If <path> is None, every URL is.
+
+        Returns: A list of the URLs found, ordered by their sort keys.
+        """
+        self._flush()
+        keys = self._keys
+
+        if host == '*':
+            lo, hi = 0, len(keys)
+        elif host.startswith('*.'):
+            prefix = _host_key(host[2:]) + _LABEL_SEPARATOR
+            lo = bisect_left(keys, prefix)
+            hi = bisect_left(keys, prefix[:-1] + chr(ord(_LABEL_SEPARATOR) + 1))
+        else:
+            prefix = _host_key(host) + _HOST_END
+            lo = bisect_left(keys, prefix)
+            hi = bisect_left(keys, prefix[:-1] + chr(ord(_HOST_END) + 1))
+
+        if path is None:
+            return [entry[2] for entry in self._entries[lo:hi]]
+
+        segments = split_path(path)
+        if segments and segments[-1] == '':
+            segments = segments[:-1]
+        under = _SEGMENT_SEPARATOR.join(segments)
+
+        # Bisect the URLs under <path> of every host and port in [lo, hi).
+        urls = []
+        while lo < hi:
+            key = keys[lo]
+            group = key[:key.index(_HOST_END) + 1 + _PORT_STRUCT.size]
+            group_end = _successor(group)
+            start = bisect_left(keys, group + under, lo, hi)
+            if segments:
+                end = bisect_left(keys, group + under + '\x01', start, hi)
+            else:
+                end = bisect_left(keys, group_end, start, hi)
+            urls.extend(entry[2] for entry in self._entries[start:end])
+            lo = bisect_left(keys, group_end, end, hi)
+        return urls
+
+    def __len__(self):
+        return len(self._entries) + len(self._pending)
+
+    def __iter__(self):
+        self._flush()
+        return (entry[2] for entry in self._entries)
+
+    def _flush(self):
+        if self._pending:
+            self._entries.extend(self._pending)
+            self._entries.sort()
+            self._keys = [entry[0] for entry in self._entries]
+            self._pending = []
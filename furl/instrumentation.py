@@ -0,0 +1,358 @@
+#
+# furl - URL manipulation made simple.
+#
+# Arthur Grunseid
+# grunseid.com
+# grunseid@gmail.com
+#
+# License: Build Amazing Things (Unlicense)
+import importlib
+import os
+import sys
+import urllib
+import warnings
+from functools import wraps
+from timeit import default_timer
+
+
+# Operations are counted and timed by replacing the methods and functions that
+# implement them with wrappers while instrumentation is enabled. When it's
+# disabled, the original methods and functions are put back, so disabled
+# instrumentation costs nothing at all.
+
+# Instrumented methods, as (module name, class name, method name).
+_METHODS = [
+    ('core', 'Furl', 'load'),
+    ('path', 'Path', 'load'),
+    ('query', 'Query', 'load'),
+    ('fragment', 'Fragment', 'load'),
+    ('core', 'Furl', '__str__'),
+    ('path', 'Path', '__str__'),
+    ('query', 'Query', '__str__'),
+    ('fragment', 'Fragment', '__str__'),
+]
+
+# Instrumented urllib functions, and the furl modules whose calls of them are
+# counted.
+_QUOTING_FUNCTIONS = ['quote', 'quote_plus', 'unquote', 'unquote_plus']
+_QUOTING_MODULES = ['canonical', 'path', 'query', 'template']
+
+# Instrumented caches, as (module name, class name, method or property name,
+# attribute). A call of the method, or a read of the property, is a cache miss
+# if it replaced the value of the attribute with a new object and a cache hit
+# otherwise.
+_CACHES = [
+    ('core', 'Furl', 'fingerprint', '_fingerprint'),
+    ('core', 'Furl', 'origin', '_origin'),
+    ('core', 'Furl', 'packed_ip', '_ip'),
+]
+
+# Instrumented dictionary caches, as (module name, class name or None for module
+# functions, method or function name, dictionary attribute). A call is a cache
+# hit if its first argument is a key of the dictionary before the call and a
+# cache miss otherwise. Calls whose first argument is None aren't lookups.
+_KEYED_CACHES = [
+    ('idn', None, 'host_to_ascii', '_ascii_cache'),
+    ('idn', None, 'host_to_unicode', '_unicode_cache'),
+    ('query', 'QueryFilter', 'keeps', '_decisions'),
+    ('suffixes', 'PublicSuffixList', 'split', '_cache'),
+]
+
+# StringLikeObject methods that serialize the object, for which implicit
+# serializations are detected.
+_SERIALIZING_METHODS = [
+    '__getattr__', '__len__', '__nonzero__', '__iter__', '__contains__',
+    '__getitem__', '__eq__', '__hash__', '__add__', '__radd__',
+]
+
+_enabled = False
+_originals = [] # (object, attribute name, original value) of every wrapper.
+_hooks = []
+_operations = {} # Operation name -> [calls, seconds].
+_caches = {} # Cache name -> [hits, misses].
+
+_detecting = False
+_detection_originals = []
+_threshold = None
+_serializations = {} # (method, type, file, line, function) -> count.
+
+
+def enable_instrumentation():
+    """
+    Start counting and timing furl's parses, serializations, quote and unquote
+    calls, and cache lookups. See stats().
+
+    Instrumentation is global, and costs nothing until it's enabled.
+    """
+    global _enabled
+    if _enabled:
+        return
+    _enabled = True
+
+    for module_name, class_name, method in _METHODS:
+        cls = getattr(_module(module_name), class_name)
+        wrapper = _timed('%s.%s' % (class_name, method), cls.__dict__[method])
+        _replace(_originals, cls, method, wrapper)
+
+    quoting = _QuotingFunctions()
+    for module_name in _QUOTING_MODULES:
+        _replace(_originals, _module(module_name), 'urllib', quoting)
+
+    for module_name, class_name, method, attribute in _CACHES:
+        cls = getattr(_module(module_name), class_name)
+        original = cls.__dict__[method]
+        cache = '%s.%s' % (class_name, method)
+        if isinstance(original, property):
+            wrapper = property(_cached(cache, original.fget, attribute),
+                               original.fset, original.fdel, original.__doc__)
+        else:
+            wrapper = _cached(cache, original, attribute)
+        _replace(_originals, cls, method, wrapper)
+
+    for module_name, class_name, function, attribute in _KEYED_CACHES:
+        module = _module(module_name)
+        if class_name is None:
+            wrapper = _keyed_cached('%s.%s' % (module_name, function),
+                                    module.__dict__[function], module,
+                                    attribute, 0)
+            _replace(_originals, module, function, wrapper)
+        else:
+            cls = getattr(module, class_name)
+            wrapper = _keyed_cached('%s.%s' % (class_name, function),
+                                    cls.__dict__[function], None, attribute, 1)
+            _replace(_originals, cls, function, wrapper)
+
+
+def disable_instrumentation():
+    """
+    Stop counting and timing furl's operations. Statistics gathered so far are
+    kept until reset_stats() is called.
+    """
+    global _enabled
+    _restore(_originals)
+    _enabled = False
+
+
+def instrumentation_enabled():
+    return _enabled
+
+
+def stats():
+    """
+    Returns: A snapshot of the statistics gathered while instrumentation was
+    enabled, a dictionary like
+
+      {'enabled': True,
+       'operations': {'Furl.load': {'calls': 2, 'seconds': 0.0004}, ...},
+       'caches': {'Furl.fingerprint': {'hits': 5, 'misses': 1}}}
+
+    The times of operations include the times of the operations they call. For
+    example, the time of Furl.load includes the time of Path.load.
+    """
+    operations = dict((name, {'calls': calls, 'seconds': seconds})
+                      for name, (calls, seconds) in _operations.items())
+    caches = dict((name, {'hits': hits, 'misses': misses})
+                  for name, (hits, misses) in _caches.items())
+    return {'enabled': _enabled, 'operations': operations, 'caches': caches}
+
+
+def reset_stats():
+    _operations.clear()
+    _caches.clear()
+
+
+def add_hook(hook):
+    """
+    Call <hook>(operation, seconds) after every instrumented operation. For
+    cache lookups, <operation> is '<cache name> hit' or '<cache name> miss' and
+    <seconds> is None. Hooks are only called while instrumentation is enabled.
+    """
+    if hook not in _hooks:
+        _hooks.append(hook)
+
+
+def remove_hook(hook):
+    if hook in _hooks:
+        _hooks.remove(hook)
+
+
+class ImplicitSerializationWarning(UserWarning):
+    pass
+
+
+def detect_implicit_serializations(threshold=None):
+    """
+    Start recording implicit serializations of Furl, Path, Query, and Fragment
+    objects. Innocent looking code like f.startswith('http') or len(f.query)
+    serializes the whole object through StringLikeObject, which is expensive in
+    hot code. See implicit_serializations().
+
+    If <threshold> is given, an ImplicitSerializationWarning is raised when a
+    call site has implicitly serialized objects <threshold> times.
+
+    Detection is global, and costs nothing until it's started.
+    """
+    global _detecting, _threshold
+    _threshold = threshold
+    if _detecting:
+        return
+    _detecting = True
+
+    cls = _module('stringlike').StringLikeObject
+    for method in _SERIALIZING_METHODS:
+        _replace(_detection_originals, cls, method,
+                 _detected(method, cls.__dict__[method]))
+
+
+def stop_detecting_implicit_serializations():
+    """
+    Stop recording implicit serializations. Serializations recorded so far are
+    kept until reset_implicit_serializations() is called.
+    """
+    global _detecting
+    _restore(_detection_originals)
+    _detecting = False
+
+
+def implicit_serializations():
+    """
+    Returns: A list of the call sites that implicitly serialized objects, most
+    frequent first. Call sites are dictionaries like
+
+      {'method': '__getattr__', 'type': 'Furl', 'file': 'app/views.py',
+       'line': 42, 'function': 'handler', 'count': 1200}
+
+    where <method> is the StringLikeObject method that serialized the object
+    and <type> is the class of the serialized object.
+    """
+    sites = []
+    for site, count in _serializations.items():
+        method, type_, filename, line, function = site
+        sites.append({'method': method, 'type': type_, 'file': filename,
+                      'line': line, 'function': function, 'count': count})
+    sites.sort(key=lambda site: -site['count'])
+    return sites
+
+
+def reset_implicit_serializations():
+    _serializations.clear()
+
+
+def _module(name):
+    return importlib.import_module('furl.' + name)
+
+
+def _replace(originals, obj, name, value):
+    originals.append((obj, name, obj.__dict__[name]))
+    setattr(obj, name, value)
+
+
+def _restore(originals):
+    while originals:
+        obj, name, original = originals.pop()
+        setattr(obj, name, original)
+
+
+def _record(operation, seconds):
+    counts = _operations.get(operation)
+    if counts is None:
+        counts = _operations[operation] = [0, 0.0]
+    counts[0] += 1
+    counts[1] += seconds
+    for hook in _hooks:
+        hook(operation, seconds)
+
+
+def _timed(operation, function):
+    timer = default_timer
+
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        start = timer()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            _record(operation, timer() - start)
+    return wrapper
+
+
+def _cached(cache, method, attribute):
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        before = getattr(self, attribute, None)
+        result = method(self, *args, **kwargs)
+        _record_lookup(cache, getattr(self, attribute, None) is not before)
+        return result
+    return wrapper
+
+
+def _keyed_cached(cache, function, owner, attribute, position):
+    """
+    Returns: A wrapper of <function> that records a lookup of the dictionary
+    cache <attribute> of <owner> for every call, keyed by the argument at
+    <position>. If <owner> is None, the dictionary is an attribute of the
+    function's first argument, self.
+    """
+    fix_encoding = _module('helpers').fix_encoding
+
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        key = args[position] if len(args) > position else None
+        if key is not None:
+            cache_owner = args[0] if owner is None else owner
+            miss = fix_encoding(key) not in getattr(cache_owner, attribute)
+        result = function(*args, **kwargs)
+        if key is not None:
+            _record_lookup(cache, miss)
+        return result
+    return wrapper
+
+
+def _record_lookup(cache, miss):
+    counts = _caches.get(cache)
+    if counts is None:
+        counts = _caches[cache] = [0, 0]
+    counts[miss] += 1
+    for hook in _hooks:
+        hook('%s %s' % (cache, 'miss' if miss else 'hit'), None)
+
+
+def _detected(method, function):
+    # Frames of these files are skipped to find the call site, so that, for
+    # example, __ne__() calling __eq__() is attributed to __ne__()'s caller.
+    skipped = set(os.path.splitext(f)[0] for f in
+                  [_module('stringlike').__file__, __file__])
+
+    @wraps(function)
+    def wrapper(self, *args, **kwargs):
+        frame = sys._getframe(1)
+        while (frame.f_back is not None and
+               os.path.splitext(frame.f_code.co_filename)[0] in skipped):
+            frame = frame.f_back
+        code = frame.f_code
+        site = (method, self.__class__.__name__, code.co_filename,
+                frame.f_lineno, code.co_name)
+        del frame
+
+        count = _serializations[site] = _serializations.get(site, 0) + 1
+        if count == _threshold:
+            warnings.warn_explicit(
+                '%s.%s() implicitly serialized %d times in %s()' % (
+                    site[1], method, count, code.co_name),
+                ImplicitSerializationWarning, code.co_filename, site[3])
+        return function(self, *args, **kwargs)
+    return wrapper
+
+
+class _QuotingFunctions(object):
+    """
+    Stand-in for the urllib module in furl's modules, with counted and timed
+    quoting functions.
+    """
+
+    def __init__(self):
+        for name in _QUOTING_FUNCTIONS:
+            setattr(self, name, _timed('urllib.' + name, getattr(urllib, name)))
+
+    def __getattr__(self, attr):
+        return getattr(urllib, attr)
@@ -0,0 +1,106 @@
+#
+# furl - URL manipulation made simple.
+#
+# Arthur Grunseid
+# grunseid.com
+# grunseid@gmail.com
+#
+# License: Build Amazing Things (Unlicense)
+import sys
+
+
+# Parsed hosts, schemes, query keys, and path segments are interned in this
+# pool while interning is enabled, so that the many Furl objects with the same
+# components share one string for each distinct component. The parsers check
+# pool.enabled before they intern anything, so disabled interning costs one
+# attribute lookup per parse.
+
+class _InterningPool(object):
+    """
+    Bounded pool of distinct strings. Once the pool holds <max_size> strings, new
+    strings are no longer added, but strings already in the pool are still
+    shared.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.max_size = 0
+        self._values = {}
+        self.lookups = self.hits = self.bytes_saved = 0
+
+    def intern(self, value):
+        """
+        Returns: The string in the pool equal to <value>, adding <value> to the
+        pool first if there's no such string and the pool isn't full.
+        """
+        self.lookups += 1
+        interned = self._values.get(value)
+        if interned is None:
+            if len(self._values) < self.max_size:
+                self._values[value] = value
+            return value
+        if interned is not value:
+            self.hits += 1
+            self.bytes_saved += sys.getsizeof(value)
+        return interned
+
+    def intern_all(self, values):
+        """
+        Returns: A list of the interned strings of <values>.
+        """
+        return [self.intern(value) for value in values]
+
+
+pool = _InterningPool()
+
+
+def enable_interning(max_size=100000):
+    """
+    Start interning the hosts, schemes, query keys, and path segments of parsed
+    URLs, so that Furl objects share the strings of their common components.
+    This reduces the memory held by many live Furl objects of URLs with few
+    distinct components, like the URLs of a crawler frontier.
+
+    At most <max_size> distinct strings are interned. Interning is global, and
+    costs nothing but an attribute lookup per parse until it's enabled.
+
+    Raises: ValueError on invalid <max_size>.
+    """
+    if max_size < 1:
+        raise ValueError("Invalid interning pool size: '%s'" % max_size)
+    pool.max_size = max_size
+    pool.enabled = True
+
+
+def disable_interning():
+    """
+    Stop interning components of parsed URLs, and empty the pool. Strings
+    already shared by Furl objects remain shared. Statistics gathered so far are
+    kept until reset_interning_stats() is called.
+    """
+    pool.enabled = False
+    pool._values.clear()
+
+
+def interning_enabled():
+    return pool.enabled
+
+
+def interning_stats():
+    """
+    Returns: A snapshot of the interning pool's statistics, a dictionary like
+
+      {'enabled': True, 'distinct': 1200, 'max_size': 100000,
+       'lookups': 500000, 'hits': 480000, 'bytes_saved': 20000000}
+
+    where <distinct> is the number of strings in the pool, <hits> is the number
+    of parsed strings replaced with an equal string of the pool, and
+    <bytes_saved> is the total size of the replaced strings.
+    """
+    return {'enabled': pool.enabled, 'distinct': len(pool._values),
+            'max_size': pool.max_size, 'lookups': pool.lookups,
+            'hits': pool.hits, 'bytes_saved': pool.bytes_saved}
+
+
+def reset_interning_stats():
+    pool.lookups = pool.hits = pool.bytes_saved = 0
@@ -0,0 +1,174 @@
+#
+# furl - URL manipulation made simple.
+#
+# Arthur Grunseid
+# grunseid.com
+# grunseid@gmail.com
+#
+# License: Build Amazing Things (Unlicense)
+import re
+import socket
+import struct
+from bisect import bisect_right
+
+_IPV4_MAPPED_PREFIX = '\x00' * 10 + '\xff' * 2
+_IPV4_STRUCT = struct.Struct('>I')
+_IPV6_STRUCT = struct.Struct('>QQ')
+
+# One to four decimal, octal, or hexadecimal numbers separated by dots, like
+# '127.1' or '0x7f000001', which inet_aton(), and so the system resolver,
+# accepts as IPv4 addresses.
+_LEGACY_IPV4_REGEX = re.compile(
+    r'^(0x[\da-f]*|\d+)(\.(0x[\da-f]*|\d+)){0,3}\Z', re.IGNORECASE)
+
+
+def pack_ip(host):
+    """
+    Pack the IP address <host>, an IPv4 address or an IPv6 address, with or
+    without brackets, into its binary form. IPv6 zone identifiers, like
+    '%25eth0' in '[fe80::1%25eth0]', are ignored.
+
+    IPv4 addresses are parsed like inet_aton() and the system resolver parse
+    them, so the legacy forms that connect to an address pack to it too, like
+    '127.1', '2130706433', '0x7f000001', '0177.0.0.1', and '127.0.0.1.'.
+
+    Examples:
+      pack_ip('127.0.0.1') == '\\x7f\\x00\\x00\\x01'
+      pack_ip('0x7f.1') == '\\x7f\\x00\\x00\\x01'
+      pack_ip('[::1]') == '\\x00' * 15 + '\\x01'
+      pack_ip('www.google.com') is None
+
+    Returns: The 4 byte packed IPv4 address or 16 byte packed IPv6 address
+    string of <host>, or None if <host> isn't an IP address.
+    """
+    if not host:
+        return None
+    if host[0] == '[':
+        if host[-1] != ']':
+            return None
+        host = host[1:-1]
+    if not host:
+        return None
+
+    try:
+        if ':' in host:
+            return socket.inet_pton(socket.AF_INET6, host.split('%', 1)[0])
+        if host[-1] == '.':
+            host = host[:-1]
+        if _LEGACY_IPV4_REGEX.match(host):
+            return socket.inet_aton(host)
+    except (socket.error, ValueError, UnicodeError):
+        pass
+    return None
+
+
+class IPNetworkSet(object):
+    """
+    Compiled set of IPv4 and IPv6 networks, for fast membership tests of IP
+    addresses. Networks are merged into sorted, disjoint address ranges, so a
+    membership test is a bisection.
+
+    IPv4-mapped IPv6 addresses, like '::ffff:127.0.0.1', are members if their
+    IPv4 address is a member, so they can't be used to sneak IPv4 addresses
+    past a check.
+
+    Example:
+      internal = IPNetworkSet(['10.0.0.0/8', 'fc00::/7', '192.168.1.1'])
+      '10.1.2.3' in internal
+      Furl('http://[fd00::1]/') in internal
+      'www.google.com' not in internal
+    """
+
+    def __init__(self, networks=()):
+        """
+        Parameters:
+          networks: Iterable of networks in CIDR notation, like '10.0.0.0/8' or
+            'fc00::/7', or single IP addresses. Host bits of networks are
+            ignored.
+        Raises: ValueError on invalid network.
+        """
+        ranges = {4: [], 16: []} # Packed address length -> [(start, end)].
+        self.networks = []
+        for network in networks:
+            address, _, prefix = network.partition('/')
+            packed = pack_ip(address)
+            if packed is None:
+                raise ValueError("Invalid network: '%s'" % network)
+            bits = len(packed) * 8
+            if not prefix:
+                prefix = bits
+            elif prefix.isdigit() and int(prefix) <= bits:
+                prefix = int(prefix)
+            else:
+                raise ValueError("Invalid network: '%s'" % network)
+
+            hostmask = (1 << (bits - prefix)) - 1
+            start = _to_int(packed) & ~hostmask
+            ranges[len(packed)].append((start, start | hostmask))
+            self.networks.append(network)
+
+        self._starts, self._ends = {}, {}
+        for length, spans in ranges.items():
+            merged = []
+            for start, end in sorted(spans):
+                if merged and start <= merged[-1][1] + 1:
+                    merged[-1][1] = max(merged[-1][1], end)
+                else:
+                    merged.append([start, end])
+            self._starts[length] = [start for start, _ in merged]
+            self._ends[length] = [end for _, end in merged]
+
+    def contains_packed(self, packed):
+        """
+        Returns: True if the packed IP address <packed>, as returned by
+        pack_ip(), is a member, False otherwise.
+        """
+        if packed is None:
+            return False
+        if len(packed) == 16 and packed.startswith(_IPV4_MAPPED_PREFIX):
+            if self._contains(packed[12:]):
+                return True
+        return self._contains(packed)
+
+    def __contains__(self, address):
+        """
+        <address> can be an IP address string, or a Furl object whose host is
+        tested. Hosts that aren't IP addresses are never members.
+        """
+        if isinstance(address, basestring):
+            return self.contains_packed(pack_ip(address))
+        return self.contains_packed(address.packed_ip)
+
+    def __len__(self):
+        return len(self.networks)
+
+    def __repr__(self):
+        return '%s(%r)' % (self.__class__.__name__, self.networks)
+
+    def _contains(self, packed):
+        length = len(packed)
+        starts = self._starts[length]
+        if not starts:
+            return False
+        value = _to_int(packed)
+        i = bisect_right(starts, value) - 1
+        return i >= 0 and value <= self._ends[length][i]
+
+
+def _to_int(packed):
+    if len(packed) == 4:
+        return _IPV4_STRUCT.unpack(packed)[0]
+    high, low = _IPV6_STRUCT.unpack(packed)
+    return high << 64 | low
+
+
+# Like the Python 3 ipaddress module's is_private and is_loopback.
+PRIVATE_NETWORKS = IPNetworkSet([
+    '0.0.0.0/8', '10.0.0.0/8', '127.0.0.0/8', '169.254.0.0/16', '172.16.0.0/12',
+    '192.0.0.0/29', '192.0.0.170/31', '192.0.2.0/24', '192.168.0.0/16',
+    '198.18.0.0/15', '198.51.100.0/24', '203.0.113.0/24', '240.0.0.0/4',
+    '255.255.255.255/32',
+    '::1/128', '::/128', '::ffff:0:0/96', '100::/64', '2001::/23', '2001:2::/48',
+    '2001:db8::/32', '2001:10::/28', 'fc00::/7', 'fe80::/10',
+])
+LOOPBACK_NETWORKS = IPNetworkSet(['127.0.0.0/8', '::1/128'])
@@ -54,6 +54,14 @@ class OneDimensionalOrderedMultidict(omdict):
     def __setitem__(self, key, value):
         return self._set(key, value)
 
+    def snapshot(self):
+        """
+        Returns: A tuple of every (key, value) item, in order.
+        """
+        if not self:
+            return ()
+        return tuple(self.iterallitems())
+
     def _bin_update_items(self, items, replace_at_most_one,
                           replacements, leftovers):
         """
@@ -1,12 +1,15 @@
 import abc
 import urllib
-import warnings
 
 from .helpers import join_path_segments
 from .helpers import remove_path_segments
-from .helpers import is_valid_encoded_path_segment
+from .helpers import is_valid_encoded_path
+from .helpers import is_strict
+from .helpers import report_violation
+from .helpers import StrictViolation
 from .helpers import fix_encoding
-from .stringlike import StringLikeObject
+from .interning import pool as _interning
+from .stringlike import InterfaceType, StringLikeObject
 
 
 class Path(StringLikeObject):
@@ -35,6 +38,8 @@ class Path(StringLikeObject):
       strict: Boolean whether or not UserWarnings should be raised if improperly
         encoded path strings are provided to methods that take such strings, like
         load(), add(), set(), remove(), etc.
+        A list can be given instead of True to collect StrictViolations into,
+        rather than raising UserWarnings.
     """
     SAFE_SEGMENT_CHARS = ":@-._~!$&'()*+,;="
 
@@ -73,8 +78,21 @@ class Path(StringLikeObject):
         elif hasattr(path, 'split') and callable(path.split): # String interface.
             segments = self._segments_from_path(path)
         else: # List interface.
-            segments = fix_encoding(path)
+            segments = [fix_encoding(segment) for segment in path]
 
+        segments = [urllib.unquote(segment) for segment in segments]
+        if _interning.enabled:
+            segments = _interning.intern_all(segments)
+        return self._load_segments(segments)
+
+    def _load_segments(self, segments):
+        """
+        Adopt the list of unquoted path segments <segments>, replacing any existing
+        path. A leading '' segment marks an absolute path, just like the list
+        interface of load(). <segments> are adopted as-is, without unquoting.
+
+        Returns: <self>.
+        """
         if self._force_absolute(self):
             self._isabsolute = True if segments else False
         else:
@@ -82,7 +100,7 @@ class Path(StringLikeObject):
 
         if self.isabsolute and len(segments) > 1 and segments[0] == '':
             segments.pop(0)
-        self.segments = [urllib.unquote(segment) for segment in segments]
+        self.segments = segments
 
         return self
 
@@ -153,24 +171,23 @@ class Path(StringLikeObject):
         """
         return not self.isdir
 
-    def _segments_from_path(self, path):
+    def _segments_from_path(self, path, unquote=True):
         """
-        Returns: The list of path segments from the path string <path>.
+        Returns: The list of path segments from the path string <path>, unquoted
+        if <unquote> is True.
 
         Raises: UserWarning if <path> is an improperly encoded path string and self.strict
-        is True.
-        """
-        # Raise a warning if self.strict is True and the user provided an improperly
-        # encoded path string.
-        segments = [fix_encoding(item) for item in path.split('/')]
-        if self.strict:
-            for segment in segments:
-                if not is_valid_encoded_path_segment(segment):
-                    warnstr = (("Improperly encoded path string received: '%s'. "
-                                "Proceeding, but did you mean '%s'?") %
-                               (path, self._path_from_segments(segments, quoted=True)))
-                    warnings.warn(warnstr, UserWarning)
-                    break
+        is True. See helpers.report_violation().
+        """
+        path = fix_encoding(path)
+        segments = path.split('/')
+        # Report the violation if self.strict is set and the user provided an
+        # improperly encoded path string.
+        if is_strict(self.strict) and not is_valid_encoded_path(path):
+            suggest = lambda: self._path_from_segments(segments, quoted=True)
+            report_violation(self.strict, StrictViolation('path', path, suggest))
+        if not unquote:
+            return segments
         return map(urllib.unquote, segments)
 
     def _path_from_segments(self, segments, quoted=True):
@@ -194,7 +211,8 @@ class PathCompositionInterface(object):
     """
     Abstract class interface for a parent class that contains a Path.
     """
-    __metaclass__ = abc.ABCMeta
+    __metaclass__ = InterfaceType
+    __abstract__ = True
 
     def __init__(self, strict=False):
         """
@@ -245,7 +263,6 @@ class URLPathCompositionInterface(PathCompositionInterface):
 
       http://en.wikipedia.org/wiki/URI_scheme#Examples
     """
-    __metaclass__ = abc.ABCMeta
 
     def __init__(self, strict=False):
         PathCompositionInterface.__init__(self, strict=strict)
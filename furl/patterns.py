@@ -0,0 +1,272 @@
+#
+# furl - URL manipulation made simple.
+#
+# Arthur Grunseid
+# grunseid.com
+# grunseid@gmail.com
+#
+# License: Build Amazing Things (Unlicense)
+import re
+import urllib
+import urlparse
+
+from .core import Furl
+from .helpers import fix_encoding
+from .helpers import split_netloc
+from .helpers import split_path
+from .helpers import urlsplit
+
+
+class _Node(object):
+    """
+    Node of a trie of host labels or path segments, which finds every pattern
+    matching a sequence of labels or segments.
+    """
+    __slots__ = ['static', 'globs', 'rest', 'values']
+
+    def __init__(self):
+        self.static = {} # Literal label or segment -> _Node.
+        self.globs = [] # (compiled glob, _Node) tuples.
+        self.rest = None # Value of a trailing '*' wildcard.
+        self.values = None # Value of a pattern ending at this node.
+
+
+class _Pattern(object):
+    __slots__ = ['index', 'pattern', 'scheme', 'port', 'keys', 'constraints']
+
+
+class PatternSet(object):
+    """
+    Finds the glob-style URL patterns that match URLs. Patterns are compiled
+    into combined indexes, so matching a URL takes time proportional to the
+    length of the URL and the number of patterns it matches rather than the
+    total number of patterns.
+
+    Patterns look like '[scheme://]host[:port][/path][?query]', where
+
+      scheme   Is matched case insensitively. Any scheme matches if it's omitted
+               or '*'.
+      host     Is a literal host or a glob. A leading '*.' matches one or more
+               labels, so '*.google.com' matches 'www.google.com' and
+               'a.b.google.com' but not 'google.com'. A lone '*' matches any
+               host. Other '*'s match within one label.
+      port     Is matched against the URL's port, or the default port of its
+               scheme. Any port matches if it's omitted.
+      path     Is a literal path or a glob. A trailing '/*' matches zero or
+               more segments, so '/blog/*' matches '/blog' and '/blog/a/b'.
+               Other '*'s match within one segment. Any path matches if it's
+               omitted.
+      query    Is a list of '&' separated keys, or key=value pairs, that must
+               all be present in the URL's query. Keys and values can be
+               globs, like 'utm_*'.
+
+    Example:
+      patterns = PatternSet(['*.google.com/blog/*?utm_*', 'https://bing.com'])
+      patterns.match('http://www.google.com/blog/a?utm_source=x') ==
+        ['*.google.com/blog/*?utm_*']
+
+    Attributes:
+      patterns: List of pattern strings in the order they were added.
+    """
+
+    def __init__(self, patterns=None):
+        self.patterns = []
+        self._hosts = _Node() # Trie of reversed host labels to path tries.
+        for pattern in (patterns or []):
+            self.add(pattern)
+
+    def add(self, pattern):
+        """
+        Add the URL pattern string <pattern>.
+
+        Returns: <self>.
+        Raises: ValueError on invalid pattern.
+        """
+        entry = _Pattern()
+        entry.index = len(self.patterns)
+        entry.pattern = pattern
+
+        rest = fix_encoding(pattern)
+        entry.scheme = None
+        if '://' in rest:
+            scheme, rest = rest.split('://', 1)
+            if scheme != '*':
+                entry.scheme = scheme.lower()
+
+        rest, _, query = rest.partition('?')
+        i = rest.find('/')
+        netloc, path = (rest, None) if i < 0 else (rest[:i], rest[i:])
+        host, _, port = netloc.partition(':')
+        if not host:
+            raise ValueError("Invalid pattern without host: '%s'" % pattern)
+        entry.port = None
+        if port:
+            if not port.isdigit():
+                raise ValueError("Invalid pattern port: '%s'" % pattern)
+            entry.port = int(port)
+
+        entry.keys, entry.constraints = set(), []
+        for item in filter(None, query.split('&')):
+            key, equals, value = item.partition('=')
+            key, value = urllib.unquote_plus(key), urllib.unquote_plus(value)
+            if not equals and '*' not in key:
+                entry.keys.add(key)
+            else:
+                entry.constraints.append(
+                    (_glob(key), _glob(value) if equals else None))
+        entry.keys = frozenset(entry.keys)
+
+        labels = host.lower().split('.')[::-1]
+        paths = _insert(self._hosts, labels, 1)
+        if paths.values is None:
+            paths.values = _Node()
+        segments = ['*'] if path is None else split_path(path)
+        leaf = _insert(paths.values, segments, 0)
+        if leaf.values is None:
+            leaf.values = []
+        leaf.values.append(entry)
+
+        self.patterns.append(pattern)
+        return self
+
+    def match(self, url):
+        """
+        Find the patterns that match <url>, a URL string or Furl object.
+
+        Returns: List of the pattern strings that match <url>, in the order
+        they were added.
+        Raises: ValueError on invalid URL.
+        """
+        if isinstance(url, Furl):
+            scheme, host, port = url.scheme, url.host, url.port
+            segments = url.path.segments
+            items = url.query.params.allitems
+        else:
+            scheme, netloc, path, query, _ = urlsplit(fix_encoding(url))
+            _, _, host, port = split_netloc(netloc)
+            scheme = scheme.lower() or None
+            port = int(port) if port else Furl.DEFAULT_PORTS.get(scheme)
+            segments = split_path(path)
+            items = lambda: urlparse.parse_qsl(query, keep_blank_values=True)
+
+        if not host:
+            return []
+
+        paths = []
+        _collect(self._hosts, host.lower().split('.')[::-1], 0, 1, paths)
+        entries = []
+        for node in paths:
+            _collect(node, segments, 0, 0, entries)
+        if not entries:
+            return []
+
+        matches, pairs, keys = [], None, None
+        for entry in entries:
+            if ((entry.scheme is not None and entry.scheme != scheme) or
+                    (entry.port is not None and entry.port != port)):
+                continue
+            if entry.keys or entry.constraints:
+                if pairs is None:
+                    pairs = items()
+                    keys = frozenset(key for key, _ in pairs)
+                if not (entry.keys <= keys and
+                        all(_satisfied(constraint, pairs)
+                            for constraint in entry.constraints)):
+                    continue
+            matches.append(entry)
+        matches.sort(key=lambda entry: entry.index)
+        return [entry.pattern for entry in matches]
+
+    def match_many(self, urls):
+        """
+        Find the patterns that match every URL string or Furl object in <urls>.
+        See match().
+
+        Returns: A list of lists of pattern strings, one for each URL in
+        <urls>.
+        Raises: ValueError on invalid URL.
+        """
+        match = self.match
+        return [match(url) for url in urls]
+
+    def __len__(self):
+        return len(self.patterns)
+
+
+def _glob(pattern):
+    """
+    Returns: The compiled regular expression that fully matches the strings
+    matched by the glob <pattern>, in which '*' matches any characters.
+    """
+    return re.compile(
+        '.*'.join(re.escape(part) for part in pattern.split('*')) + r'\Z',
+        re.DOTALL)
+
+
+def _insert(node, parts, rest_min):
+    """
+    Insert the label or segment list <parts> below <node>. A trailing '*' in
+    <parts> becomes a wildcard matching <rest_min> or more parts.
+
+    Returns: The _Node whose values are those of <parts>.
+    """
+    for i, part in enumerate(parts):
+        if part == '*' and i == len(parts) - 1:
+            if node.rest is None:
+                node.rest = _Node()
+            return node.rest
+
+        if '*' in part:
+            for glob, child in node.globs:
+                if glob.pattern == _glob(part).pattern:
+                    break
+            else:
+                child = _Node()
+                node.globs.append((_glob(part), child))
+        else:
+            child = node.static.get(part)
+            if child is None:
+                child = node.static[part] = _Node()
+        node = child
+    return node
+
+
+def _collect(node, parts, i, rest_min, values):
+    """
+    Append the values of every pattern below <node> that matches <parts>[<i>:]
+    to <values>. Trailing wildcards match <rest_min> or more parts.
+    """
+    length = len(parts)
+    while True:
+        if node.rest is not None and length - i >= rest_min:
+            _extend(values, node.rest.values)
+        if i == length:
+            _extend(values, node.values)
+            return
+
+        part = parts[i]
+        for glob, child in node.globs:
+            if glob.match(part) is not None:
+                _collect(child, parts, i + 1, rest_min, values)
+        node = node.static.get(part)
+        if node is None:
+            return
+        i += 1
+
+
+def _extend(values, value):
+    if value is None:
+        return
+    if isinstance(value, list):
+        values.extend(value)
+    else:
+        values.append(value)
+
+
+def _satisfied(constraint, pairs):
+    key, value = constraint
+    for k, v in pairs:
+        if key.match(k) is not None and (value is None or
+                                         value.match(v) is not None):
+            return True
+    return False
@@ -1,11 +1,14 @@
-import abc
+import re
 import urllib
 import urlparse
-import warnings
 
-from .helpers import is_valid_encoded_query_key
-from .helpers import is_valid_encoded_query_value
+from .helpers import is_valid_encoded_query
+from .helpers import is_strict
+from .helpers import report_violation
+from .helpers import StrictViolation
 from .helpers import fix_encoding
+from .helpers import utf8_str
+from .interning import pool as _interning
 from .multidict import OneDimensionalOrderedMultidict
 from .stringlike import StringLikeObject
 
@@ -65,6 +68,8 @@ class Query(StringLikeObject):
       strict: Boolean whether or not UserWarnings should be raised if improperly
         encoded query strings are provided to methods that take such strings, like
         load(), add(), set(), remove(), etc.
+        A list can be given instead of True to collect StrictViolations into,
+        rather than raising UserWarnings.
     """
     SAFE_KEY_CHARS = "/?:@-._~!$'()*,"
     SAFE_VALUE_CHARS = "/?:@-._~!$'()*,="
@@ -134,13 +139,16 @@ class Query(StringLikeObject):
         separating key:value pairs. The most common and default delimeter is '&',
         but ';' can also be specified. ';' is W3C recommended.
         """
+        quote_plus = urllib.quote_plus
+        safe_key_chars, safe_value_chars = self.SAFE_KEY_CHARS, self.SAFE_VALUE_CHARS
         pairs = []
         for key, value in self.params.iterallitems():
-            key = fix_encoding(key)
-            value = fix_encoding(value)
-            pair = '='.join((urllib.quote_plus(str(key), self.SAFE_KEY_CHARS),
-                             urllib.quote_plus(str(value), self.SAFE_VALUE_CHARS)))
-            pairs.append(pair)
+            if key.__class__ is not str:
+                key = utf8_str(key)
+            if value.__class__ is not str:
+                value = utf8_str(value)
+            pairs.append(quote_plus(key, safe_key_chars) + '=' +
+                         quote_plus(value, safe_value_chars))
         return delimeter.join(pairs)
 
     def __nonzero__(self):
@@ -170,8 +178,8 @@ class Query(StringLikeObject):
         string, in which case the final keys and values that are returned will be
         unquoted.
 
-        Raises: UserWarning if <path> is an improperly encoded path string and self.strict
-        is True.
+        Raises: UserWarning if <items> is an improperly encoded query string and
+        self.strict is True. See helpers.report_violation().
         """
         if not items:
             items = []
@@ -187,23 +195,20 @@ class Query(StringLikeObject):
             items = list(items.items())
         # Encoded query string. i.e. 'a=1&b=2&c=3'
         elif isinstance(items, basestring):
-            # Raise a warning if self.strict is True and the user provided an
+            items = fix_encoding(items)
+            # Report the violation if self.strict is set and the user provided an
             # improperly encoded query string.
-            if self.strict:
-                pairstrs = [s2 for s1 in items.split('&') for s2 in s1.split(';')]
-                pairs = map(lambda item: item.split('=', 1), pairstrs)
-                pairs = map(lambda p: (p[0], '') if len(p) == 1 else (p[0], p[1]), pairs)
-                for key, value in pairs:
-                    if (not is_valid_encoded_query_key(key) or
-                            not is_valid_encoded_query_value(value)):
-                        warnstr = (("Improperly encoded query string received: '%s'. "
-                                    "Proceeding, but did you mean '%s'?") %
-                                   (items, urllib.urlencode(pairs)))
-                        warnings.warn(warnstr, UserWarning)
-                        break
-
-            # Keys and values will be unquoted from the query string.
+            if is_strict(self.strict) and not is_valid_encoded_query(items):
+                report_violation(self.strict, StrictViolation(
+                    'query', items, lambda query=items: _suggest_query(query)))
+
+            # Keys and values will be unquoted from the query string. They're
+            # already UTF-8 encoded.
             items = urlparse.parse_qsl(items, keep_blank_values=True)
+            if _interning.enabled:
+                intern = _interning.intern
+                items = [(intern(key), value) for key, value in items]
+            return items
         # Default to list of key:value items interface. i.e. [('a','1'), ('b','2')]
         else:
             items = list(items)
@@ -214,11 +219,19 @@ class Query(StringLikeObject):
         return items
 
 
+def _suggest_query(query):
+    """
+    Returns: The properly encoded query string that the improperly encoded query
+    string <query> was probably meant to be.
+    """
+    pairs = [pair.split('=', 1) for s in query.split('&') for pair in s.split(';')]
+    return urllib.urlencode([(p[0], p[1] if len(p) == 2 else '') for p in pairs])
+
+
 class QueryCompositionInterface(object):
     """
     Abstract class interface for a parent class that contains a Query.
     """
-    __metaclass__ = abc.ABCMeta
 
     def __init__(self, strict=False):
         self._query = Query(strict=strict)
@@ -242,3 +255,172 @@ class QueryCompositionInterface(object):
             self._query.load(value)
             return True
         return False
+
+
+class QueryFilter(object):
+    """
+    Compiled set of rules that decide which query parameters are kept, by key,
+    like rules that strip tracking parameters. Rules are compiled once, when the
+    filter is created, and the decision for each distinct key is cached, so
+    filtering costs one dictionary lookup per parameter however many rules
+    there are.
+
+    Rules are keys, like 'fbclid', or globs, in which '*' matches any
+    characters, like 'utm_*'. A parameter is kept if its key matches a rule of
+    <allow>, or <allow> is None, and its key matches no rule of <deny>.
+
+    Example:
+      tracking = QueryFilter(deny=['utm_*', 'fbclid'])
+      tracking.apply('a=1&utm_source=x&b=2&b=3') == 'a=1&b=2&b=3'
+      tracking.filter_url('http://a.com/?fbclid=x&id=1#f') == 'http://a.com/?id=1#f'
+
+    Attributes:
+      allow: List of rules of keys to keep, or None to keep all keys not denied.
+      deny: List of rules of keys to drop.
+      cache_size: Maximum number of keys whose decisions are cached.
+    """
+
+    def __init__(self, allow=None, deny=(), cache_size=10000):
+        self.allow = None
+        if allow is not None:
+            self.allow = [fix_encoding(rule) for rule in allow]
+        self.deny = [fix_encoding(rule) for rule in deny]
+        self.cache_size = cache_size
+        self._allow = None if self.allow is None else _KeyRules(self.allow)
+        self._deny = _KeyRules(self.deny)
+        self._decisions = {}
+
+    def keeps(self, key):
+        """
+        Returns: True if query parameters with the decoded key <key> are kept,
+        False otherwise.
+        """
+        keep = self._decisions.get(key)
+        if keep is None:
+            keep = ((self._allow is None or self._allow.matches(key)) and
+                    not self._deny.matches(key))
+            if len(self._decisions) >= self.cache_size:
+                self._decisions.clear()
+            self._decisions[key] = keep
+        return keep
+
+    def filter_items(self, items):
+        """
+        Returns: A list of the (key, value) tuples of <items> whose keys are
+        kept, in order.
+        """
+        keeps = self.keeps
+        return [(key, value) for key, value in items
+                if keeps(key if key.__class__ is str else utf8_str(key))]
+
+    def apply(self, query):
+        """
+        Filter the parameters of <query>, in one pass, keeping the order of the
+        parameters and every value of repeated keys.
+
+        Parameters:
+          query: Encoded query string, Query object, or object with a Query, like
+            a Furl object. Query objects, and the Query of other objects, are
+            filtered in place.
+
+        Returns: The filtered query string if <query> is a string, <query>
+        otherwise.
+        """
+        if isinstance(query, basestring):
+            return self._filter_string(fix_encoding(query))
+
+        target = query if isinstance(query, Query) else query.query
+        items = list(target.params.iterallitems())
+        kept = self.filter_items(items)
+        if len(kept) != len(items):
+            target.params.load(kept)
+        return query
+
+    def filter_url(self, url):
+        """
+        Filter the query parameters of <url>, a URL string or Furl object. Like
+        apply(), URL strings aren't parsed, and the encoding of the parameters
+        that are kept is left as it is. Furl objects are filtered in place.
+
+        Returns: The filtered URL string if <url> is a string, <url> otherwise.
+        """
+        if not isinstance(url, basestring):
+            return self.apply(url)
+
+        url = fix_encoding(url)
+        start = url.find('?')
+        fragment = url.find('#')
+        if start < 0 or 0 <= fragment < start:
+            return url
+        end = fragment if fragment >= 0 else len(url)
+        query = url[start + 1:end]
+        filtered = self._filter_string(query)
+        if filtered is query:
+            return url
+        return url[:start] + ('?' + filtered if filtered else '') + url[end:]
+
+    def filter_many(self, urls):
+        """
+        Filter the query parameters of every URL string and Furl object in
+        <urls>. See filter_url().
+
+        Returns: A list of the filtered URLs, one for each URL in <urls>.
+        """
+        filter_url = self.filter_url
+        return [filter_url(url) for url in urls]
+
+    def __repr__(self):
+        return '%s(allow=%r, deny=%r)' % (
+            self.__class__.__name__, self.allow, self.deny)
+
+    def _filter_string(self, query):
+        """
+        Returns: The encoded query string <query> without the parameters whose
+        keys aren't kept. Kept parameters are joined with '&', and aren't
+        decoded or re-encoded. <query> itself is returned if every parameter is
+        kept.
+        """
+        keeps = self.keeps
+        unquote_plus = urllib.unquote_plus
+        pairs, removed = [], False
+        for pair in _QUERY_SEPARATOR_REGEX.split(query):
+            if not pair:
+                removed = True
+                continue
+            key = pair.split('=', 1)[0]
+            if '%' in key or '+' in key:
+                key = unquote_plus(key)
+            if keeps(key):
+                pairs.append(pair)
+            else:
+                removed = True
+        return '&'.join(pairs) if removed else query
+
+
+_QUERY_SEPARATOR_REGEX = re.compile('[&;]')
+
+
+class _KeyRules(object):
+    """
+    Compiled query key rules of a QueryFilter. Keys are matched with a set
+    lookup, prefix rules like 'utm_*' with str.startswith(), and all other
+    globs with one regular expression.
+    """
+
+    def __init__(self, rules):
+        self.keys = frozenset(rule for rule in rules if '*' not in rule)
+        globs = [rule for rule in rules if '*' in rule]
+        self.prefixes = tuple(
+            rule[:-1] for rule in globs if rule.find('*') == len(rule) - 1)
+        patterns = [
+            '.*'.join(re.escape(part) for part in rule.split('*'))
+            for rule in globs if rule.find('*') != len(rule) - 1]
+        self.regex = None
+        if patterns:
+            self.regex = re.compile(
+                r'(?:%s)\Z' % '|'.join(patterns), re.DOTALL)
+
+    def matches(self, key):
+        return (key in self.keys or
+                bool(self.prefixes and key.startswith(self.prefixes)) or
+                (self.regex is not None and self.regex.match(key) is not None))
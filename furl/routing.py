@@ -0,0 +1,184 @@
+#
+# furl - URL manipulation made simple.
+#
+# Arthur Grunseid
+# grunseid.com
+# grunseid@gmail.com
+#
+# License: Build Amazing Things (Unlicense)
+import re
+import urllib
+
+from .core import Furl
+from .helpers import split_path
+from .path import Path
+
+
+# A pattern segment is a literal segment, a parameter, or, as the last segment
+# of a pattern, a wildcard.
+#   users      Literal segment 'users'.
+#   {id}       Any segment, captured as 'id'.
+#   {id:\d+}   Any segment that fully matches the regular expression \d+,
+#              captured as 'id'.
+#   {rest*}    Zero or more remaining segments, captured as the list 'rest'.
+#   *          Zero or more remaining segments, not captured.
+PARAMETER_REGEX = re.compile(r'^\{(?P<name>[A-Za-z_]\w*)(?::(?P<regex>.+))?\}$')
+WILDCARD_REGEX = re.compile(r'^(?:\*|\{(?P<name>[A-Za-z_]\w*)\*\})$')
+
+
+class _Node(object):
+    __slots__ = ['static', 'dynamic', 'wildcard', 'route']
+
+    def __init__(self):
+        self.static = {} # Literal segment -> _Node.
+        self.dynamic = [] # (name, regex, compiled regex, _Node) tuples.
+        self.wildcard = None # (name or None, route).
+        self.route = None # (route,) if a pattern ends at this node.
+
+
+class Router(object):
+    """
+    Matches URL paths against many path patterns at once. Patterns are compiled
+    into a trie of path segments, so matching a path takes time proportional
+    to the number of segments in the path rather than the number of patterns.
+
+    Example:
+      router = Router()
+      router.add('/users/{id:\d+}/orders/{oid}', 'order')
+      router.add('/static/{file*}', 'static')
+      router.match('/users/7/orders/a1') == ('order', {'id': '7', 'oid': 'a1'})
+      router.match(Furl('http://www.google.com/static/css/a.css')) ==
+        ('static', {'file': ['css', 'a.css']})
+
+    Literal segments take precedence over parameters with regular expressions,
+    which take precedence over parameters without, which take precedence over
+    wildcards. Parameters with regular expressions are tried in the order they
+    were added. If the best matching branch of the trie doesn't match the rest
+    of the path, the next best branch is tried.
+
+    Attributes:
+      routes: List of (pattern, route) tuples in the order they were added.
+    """
+
+    def __init__(self, routes=None):
+        self.routes = []
+        self._root = _Node()
+        for pattern, route in (routes or []):
+            self.add(pattern, route)
+
+    def add(self, pattern, route):
+        """
+        Add the path pattern <pattern>, which matches paths as <route>. <route>
+        can be any object, like a handler function or a name.
+
+        Returns: <self>.
+        Raises: ValueError on invalid pattern, or if <pattern> was already added.
+        """
+        node = self._root
+        segments = split_path(pattern, unquote=False)
+        for i, segment in enumerate(segments):
+            wildcard = WILDCARD_REGEX.match(segment)
+            if wildcard:
+                if i != len(segments) - 1:
+                    raise ValueError(
+                        "Wildcard isn't the last path segment: '%s'" % pattern)
+                if node.wildcard is not None:
+                    raise ValueError("Duplicate path pattern: '%s'" % pattern)
+                node.wildcard = (wildcard.group('name'), route)
+                break
+
+            parameter = PARAMETER_REGEX.match(segment)
+            if parameter:
+                node = self._dynamic_child(node, pattern, *parameter.groups())
+            else:
+                segment = urllib.unquote(segment)
+                child = node.static.get(segment)
+                if child is None:
+                    child = node.static[segment] = _Node()
+                node = child
+        else:
+            if node.route is not None:
+                raise ValueError("Duplicate path pattern: '%s'" % pattern)
+            node.route = (route,)
+
+        self.routes.append((pattern, route))
+        return self
+
+    def match(self, path):
+        """
+        Match <path>, which can be a path string, a list of path segments, or a
+        Path or Furl object. Path strings are split and unquoted like Path's are.
+
+        Returns: A (route, parameters) tuple of the best matching route and the
+        dictionary of parameters captured from <path>, or None if no pattern
+        matches <path>.
+        """
+        if isinstance(path, basestring):
+            segments = split_path(path)
+        elif isinstance(path, Furl):
+            segments = path.path.segments
+        elif isinstance(path, Path):
+            segments = path.segments
+        else:
+            segments = path
+
+        params = {}
+        route = _match(self._root, segments, 0, len(segments), params)
+        if route is None:
+            return None
+        return route[0], params
+
+    def _dynamic_child(self, node, pattern, name, regex):
+        for entry in node.dynamic:
+            if entry[0] == name and entry[1] == regex:
+                return entry[3]
+
+        compiled = None
+        if regex is not None:
+            try:
+                compiled = re.compile(r'(?:%s)\Z' % regex)
+            except re.error as e:
+                raise ValueError("Invalid regular expression in path pattern "
+                                 "'%s': %s" % (pattern, e))
+        entry = (name, regex, compiled, _Node())
+        if compiled is None:
+            node.dynamic.append(entry)
+        else:
+            # Parameters with regular expressions come first, in the order
+            # they're added.
+            position = sum(1 for e in node.dynamic if e[2] is not None)
+            node.dynamic.insert(position, entry)
+        return entry[3]
+
+
+def _match(node, segments, i, length, params):
+    """
+    Returns: The (route,) tuple of the best route matching <segments>[<i>:]
+    below <node>, or None if there's no such route. Captured parameters are
+    added to <params>.
+    """
+    if i == length:
+        if node.route is not None:
+            return node.route
+    else:
+        segment = segments[i]
+        child = node.static.get(segment)
+        if child is not None:
+            route = _match(child, segments, i + 1, length, params)
+            if route is not None:
+                return route
+
+        for name, _, regex, child in node.dynamic:
+            if regex is not None and regex.match(segment) is None:
+                continue
+            route = _match(child, segments, i + 1, length, params)
+            if route is not None:
+                params[name] = segment
+                return route
+
+    if node.wildcard is not None:
+        name, route = node.wildcard
+        if name is not None:
+            params[name] = list(segments[i:])
+        return (route,)
+    return None
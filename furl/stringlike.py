@@ -1,12 +1,39 @@
 import abc
 
 
+class InterfaceType(type):
+    """
+    Metaclass that ensures, when a class is defined, that the class implements
+    all the methods marked with abc.abstractmethod() in its base classes.
+    Classes that are interfaces themselves are exempt if they set __abstract__
+    to True.
+
+    Unlike abc.ABCMeta, nothing is checked after a class has been defined, so
+    instantiation and isinstance() checks, including the ones Python makes when
+    unbound methods are called, are as fast as for any other class.
+
+    Raises: TypeError if a class doesn't implement an abstract method.
+    """
+
+    def __init__(cls, name, bases, namespace):
+        type.__init__(cls, name, bases, namespace)
+        if namespace.get('__abstract__'):
+            return
+
+        missing = [attr for attr in dir(cls) if getattr(
+            getattr(cls, attr, None), '__isabstractmethod__', False)]
+        if missing:
+            raise TypeError("Can't define class %s without abstract methods %s"
+                            % (name, ', '.join(sorted(missing))))
+
+
 class StringLikeObject(object):
     """Represents a string-like object
     Note that for pickling purposes this implements an Interface that defines that the
     object should be reloadable through passing the string value alone as an argument.
     """
-    __metaclass__ = abc.ABCMeta
+    __metaclass__ = InterfaceType
+    __abstract__ = True
 
     @abc.abstractmethod
     def __str__(self):
@@ -0,0 +1,285 @@
+#
+# furl - URL manipulation made simple.
+#
+# Arthur Grunseid
+# grunseid.com
+# grunseid@gmail.com
+#
+# License: Build Amazing Things (Unlicense)
+import os
+import re
+import threading
+import warnings
+
+from .helpers import fix_encoding
+from .helpers import _external_stacklevel
+
+
+# Files the shared public suffix list is loaded from, in order of preference, if
+# load_public_suffix_list() isn't called. The FURL_PUBLIC_SUFFIX_LIST
+# environment variable takes precedence. The list is published at
+# https://publicsuffix.org/list/public_suffix_list.dat.
+PUBLIC_SUFFIX_LIST_PATHS = [
+    '/usr/share/publicsuffix/public_suffix_list.dat',
+    '/usr/local/share/publicsuffix/public_suffix_list.dat',
+    '/etc/ssl/public_suffix_list.dat',
+]
+
+_IP_REGEX = re.compile(r'^(\[.*\]|[\d\.]+)$')
+# Full stops that separate the labels of internationalized hosts, like idna.dots.
+_DOTS_REGEX = re.compile(u'[.\u3002\uff0e\uff61]')
+_PRIVATE_MARKER = '===BEGIN PRIVATE DOMAINS==='
+
+_shared = None
+_shared_lock = threading.Lock()
+
+
+class MissingPublicSuffixListWarning(UserWarning):
+    """
+    Warning raised when no public suffix list file is found, so the shared
+    PublicSuffixList is empty.
+    """
+
+
+class _Node(object):
+    __slots__ = ['children', 'rule', 'exception']
+
+    def __init__(self):
+        self.children = {} # Label -> _Node. Wildcard rules are under '*'.
+        self.rule = False
+        self.exception = False
+
+
+class PublicSuffixList(object):
+    """
+    Public suffix list, like https://publicsuffix.org/, for splitting hosts
+    into their subdomain, registered domain, and public suffix.
+
+    Rules are compiled into a trie of reversed host labels, so looking up a host
+    takes time proportional to its number of labels. Lookups are cached per
+    host, up to <cache_size> hosts.
+
+    Example:
+      suffixes = PublicSuffixList(['com', 'uk', 'co.uk'])
+      suffixes.split('www.bbc.co.uk') == ('www', 'bbc.co.uk', 'co.uk')
+      suffixes.split('co.uk') == (None, None, 'co.uk')
+
+    Like the public suffix list's algorithm prescribes, the rightmost label of
+    hosts no rule matches is their public suffix.
+
+    Internationalized rules and hosts are compared in their ASCII form, so the
+    rule '\xe5\x85\xac\xe5\x8f\xb8.cn', as the list writes it, matches both
+    'a.\xe5\x85\xac\xe5\x8f\xb8.cn' and 'a.xn--55qx5d.cn'. Components are
+    returned in the form of the host they're split from.
+    """
+
+    def __init__(self, rules=(), private=True, cache_size=100000):
+        """
+        Parameters:
+          rules: Iterable of rule strings in the public suffix list format, like
+            the lines of public_suffix_list.dat. Blank lines and '//' comments
+            are skipped.
+          private: Whether to use the rules of the list's private domains
+            section, like 'blogspot.com', as well as its ICANN domains.
+          cache_size: Maximum number of hosts whose lookups are cached.
+        """
+        self.cache_size = cache_size
+        self._root = _Node()
+        self._cache = {}
+        for line in rules:
+            if not private and _PRIVATE_MARKER in line:
+                break
+            rule = line.strip().split(None, 1)[0] if line.strip() else ''
+            if not rule or rule.startswith('//'):
+                continue
+            self._add(rule)
+
+    @classmethod
+    def load(cls, path, private=True, cache_size=100000):
+        """
+        Returns: A PublicSuffixList of the rules in the file <path>, like a copy
+        of public_suffix_list.dat.
+        Raises: IOError if <path> can't be read.
+        """
+        with open(path) as f:
+            return cls(f, private, cache_size)
+
+    def split(self, host):
+        """
+        Split <host> into its subdomain, registered domain, and public suffix.
+        Components that aren't present are None, as are all components of
+        IP addresses.
+
+        Examples:
+          split('www.bbc.co.uk') == ('www', 'bbc.co.uk', 'co.uk')
+          split('bbc.co.uk') == (None, 'bbc.co.uk', 'co.uk')
+          split('co.uk') == (None, None, 'co.uk')
+
+        Returns: Tuple (subdomain, registered domain, public suffix).
+        """
+        result = self._cache.get(host)
+        if result is None:
+            result = self._split(host)
+            if len(self._cache) >= self.cache_size:
+                self._cache.clear()
+            self._cache[host] = result
+        return result
+
+    def public_suffix(self, host):
+        return self.split(host)[2]
+
+    def registered_domain(self, host):
+        return self.split(host)[1]
+
+    def subdomain(self, host):
+        return self.split(host)[0]
+
+    def _add(self, rule):
+        node = self._root
+        exception = rule.startswith('!')
+        for label in reversed(_to_ascii(rule.lstrip('!')).lower().split('.')):
+            child = node.children.get(label)
+            if child is None:
+                child = node.children[label] = _Node()
+            node = child
+        if exception:
+            node.exception = True
+        else:
+            node.rule = True
+
+    def _split(self, host):
+        if not host or _IP_REGEX.match(host):
+            return (None, None, None)
+
+        labels = host.lower().rstrip('.').split('.')
+        if not all(labels):
+            return (None, None, None)
+        if not _is_ascii(host):
+            return self._split_internationalized(host)
+
+        # The number of rightmost labels in the public suffix. Exception rules
+        # take precedence over all other rules, and otherwise the rule with the
+        # most labels prevails.
+        length = 1
+        node = self._root
+        for depth, label in enumerate(reversed(labels), 1):
+            wildcard = node.children.get('*')
+            node = node.children.get(label)
+            if node is not None and node.exception:
+                length = depth - 1
+                break
+            if wildcard is not None and wildcard.rule:
+                length = depth
+            if node is None:
+                break
+            if node.rule:
+                length = depth
+
+        return _join_split(labels, length)
+
+    def _split_internationalized(self, host):
+        # Split the ASCII form of <host>, then split <host> itself into as many
+        # labels.
+        try:
+            subdomain, domain, suffix = self._split(_to_ascii(host))
+        except ValueError:
+            return (None, None, None)
+        if suffix is None:
+            return (None, None, None)
+
+        unicode_host = host if isinstance(host, unicode) else host.decode('utf-8')
+        labels = _DOTS_REGEX.split(unicode_host.lower())
+        if not labels[-1]: # A trailing dot.
+            labels.pop()
+        components = _join_split(labels, suffix.count('.') + 1)
+        if isinstance(host, unicode):
+            return components
+        return tuple(c if c is None else c.encode('utf-8') for c in components)
+
+
+def _join_split(labels, length):
+    """
+    Returns: Tuple (subdomain, registered domain, public suffix) of the host
+    <labels> whose public suffix is its <length> rightmost labels.
+    """
+    suffix = '.'.join(labels[-length:])
+    if length >= len(labels):
+        return (None, None, suffix)
+    domain = '.'.join(labels[-length - 1:])
+    subdomain = '.'.join(labels[:-length - 1]) or None
+    return (subdomain, domain, suffix)
+
+
+def _is_ascii(string):
+    try:
+        string.encode('ascii') if isinstance(string, unicode) else string.decode(
+            'ascii')
+        return True
+    except UnicodeError:
+        return False
+
+
+def _to_ascii(host):
+    """
+    Returns: The ASCII form of the UTF-8 or unicode string <host>, like
+    'xn--55qx5d.cn'.
+    Raises: ValueError if <host> isn't a valid internationalized host.
+    """
+    if _is_ascii(host):
+        return str(host)
+    # Lookups are cached by PublicSuffixList.split() and rules are converted
+    # once, so idn's cache is bypassed rather than filled.
+    from .idn import _to_ascii as idn_to_ascii
+    return idn_to_ascii(fix_encoding(host)) # Raises ValueError.
+
+
+def public_suffix_list():
+    """
+    Returns: The PublicSuffixList shared by the process, which Furl's
+    registered_domain, public_suffix, and subdomain properties use. It's loaded
+    from the file named by the FURL_PUBLIC_SUFFIX_LIST environment variable, or
+    else the first file of PUBLIC_SUFFIX_LIST_PATHS that exists, once, when
+    it's first used.
+
+    If there's no such file, a MissingPublicSuffixListWarning is raised and the
+    list is empty, so the public suffix of every host is its rightmost label
+    and, for example, the registered domain of 'www.bbc.co.uk' is 'co.uk'.
+    Install a copy of the list, or use load_public_suffix_list(), to avoid
+    these wrong results.
+    """
+    global _shared
+    if _shared is None:
+        with _shared_lock:
+            if _shared is None:
+                paths = [os.environ.get('FURL_PUBLIC_SUFFIX_LIST')]
+                for path in filter(None, paths) + PUBLIC_SUFFIX_LIST_PATHS:
+                    if os.path.exists(path):
+                        _shared = PublicSuffixList.load(path)
+                        break
+                else:
+                    warnings.warn(
+                        'No public suffix list was found in %s, so registered '
+                        'domains, public suffixes and subdomains will be wrong '
+                        'for hosts under multi-label public suffixes like '
+                        "'co.uk'. Set FURL_PUBLIC_SUFFIX_LIST or call "
+                        'load_public_suffix_list().' %
+                        ', '.join(PUBLIC_SUFFIX_LIST_PATHS),
+                        MissingPublicSuffixListWarning,
+                        stacklevel=_external_stacklevel())
+                    _shared = PublicSuffixList()
+    return _shared
+
+
+def load_public_suffix_list(suffixes):
+    """
+    Replace the shared PublicSuffixList with <suffixes>, a PublicSuffixList or
+    the path of a file of rules.
+
+    Returns: The new shared PublicSuffixList.
+    Raises: IOError if the file <suffixes> can't be read.
+    """
+    global _shared
+    if not isinstance(suffixes, PublicSuffixList):
+        suffixes = PublicSuffixList.load(suffixes)
+    _shared = suffixes
+    return suffixes
@@ -0,0 +1,261 @@
+#
+# furl - URL manipulation made simple.
+#
+# Arthur Grunseid
+# grunseid.com
+# grunseid@gmail.com
+#
+# License: Build Amazing Things (Unlicense)
+import re
+import urllib
+
+from .core import Furl
+from .helpers import fix_encoding
+from .helpers import utf8_str
+
+
+# RFC 6570
+#   unreserved = ALPHA / DIGIT / "-" / "." / "_" / "~"
+#   reserved   = gen-delims / sub-delims
+#   gen-delims = ":" / "/" / "?" / "#" / "[" / "]" / "@"
+#   sub-delims = "!" / "$" / "&" / "'" / "(" / ")"
+#                / "*" / "+" / "," / ";" / "="
+UNRESERVED_SAFE_CHARS = '-._~'
+RESERVED_SAFE_CHARS = UNRESERVED_SAFE_CHARS + ":/?#[]@!$&'()*+,;="
+
+EXPRESSION_REGEX = re.compile(r'\{([^{}]*)\}')
+VARSPEC_REGEX = re.compile(r'^((?:[\w]|%[\da-fA-F]{2})(?:\.?(?:[\w]|%[\da-fA-F]{2}))*)'
+                           r'(?::([1-9]\d{0,3})|(\*))?$')
+STRAY_PERCENT_REGEX = re.compile(r'%(?![\da-fA-F]{2})')
+
+# Operator: (first, separator, named, ifempty, allow reserved characters).
+OPERATORS = {
+    '': ('', ',', False, '', False),
+    '+': ('', ',', False, '', True),
+    '#': ('#', ',', False, '', True),
+    '.': ('.', '.', False, '', False),
+    '/': ('/', '/', False, '', False),
+    ';': (';', ';', True, '', False),
+    '?': ('?', '&', True, '=', False),
+    '&': ('&', '&', True, '=', False),
+}
+
+
+class Template(object):
+    """
+    Represents a URI Template, as described in RFC 6570, up to and including
+    level 4 templates.
+
+      http://tools.ietf.org/html/rfc6570
+
+    The template string is compiled once, when the Template is created, into a
+    sequence of literal chunks, which are encoded once, and expressions. Only the
+    values of variables are encoded when the template is expanded, so expansion
+    is little more than string concatenation.
+
+    Examples:
+      t = Template('https://api.example.com/users/{id}/items{?page,limit}')
+      t.expand(id=7, page=2) == 'https://api.example.com/users/7/items?page=2'
+      t.expand({'id': 'a b'}) == 'https://api.example.com/users/a%20b/items'
+
+    Attributes:
+      template: The template string.
+      variables: List of the names of all variables in the template, in order of
+        their first appearance.
+    """
+
+    def __init__(self, template):
+        """
+        Raises: ValueError on invalid template.
+        """
+        self.template = template = fix_encoding(template)
+        self.variables = []
+        self._parts = []
+
+        position = 0
+        for match in EXPRESSION_REGEX.finditer(template):
+            self._add_literal(template[position:match.start()])
+            self._parts.append(_Expression(match.group(1), template))
+            position = match.end()
+        self._add_literal(template[position:])
+
+        for part in self._parts:
+            if isinstance(part, _Expression):
+                for name in part.names:
+                    if name not in self.variables:
+                        self.variables.append(name)
+
+    def expand(self, variables=None, **kwargs):
+        """
+        Expand this template with the variables in the dictionary <variables> and
+        the keyword arguments <kwargs>. Keyword arguments take precedence.
+
+        Variable values can be strings, numbers, lists of values, or dictionaries
+        (or lists of (key, value) tuples) of values. Undefined variables, and
+        variables whose value is None, an empty list or an empty dictionary,
+        are skipped.
+
+        Returns: The expanded URL string.
+        """
+        if variables is None:
+            variables = kwargs
+        elif kwargs:
+            variables = dict(variables, **kwargs)
+
+        chunks = []
+        for part in self._parts:
+            if part.__class__ is str:
+                chunks.append(part)
+            else:
+                chunks.append(part.expand(variables))
+        return ''.join(chunks)
+
+    def expand_furl(self, variables=None, **kwargs):
+        """
+        Expand this template. See expand().
+
+        Returns: A new Furl object of the expanded URL.
+        """
+        return Furl(self.expand(variables, **kwargs))
+
+    def __str__(self):
+        return self.template
+
+    def __repr__(self):
+        return "%s('%s')" % (self.__class__.__name__, self.template)
+
+    def _add_literal(self, literal):
+        if '{' in literal or '}' in literal:
+            raise ValueError("Invalid template: '%s'" % self.template)
+        if literal:
+            self._parts.append(_encode(literal, True))
+
+
+class _Expression(object):
+    """
+    A compiled template expression, like '{?page,limit}'.
+    """
+
+    def __init__(self, expression, template):
+        """
+        Raises: ValueError on invalid expression.
+        """
+        operator = expression[:1]
+        if operator and operator in OPERATORS:
+            expression = expression[1:]
+        elif operator and operator in '=,!@|': # Reserved for future extensions.
+            raise ValueError("Invalid template: '%s'" % template)
+        else:
+            operator = ''
+        (self.first, self.separator, self.named, self.ifempty,
+         self.reserved) = OPERATORS[operator]
+
+        # Each varspec is (name, name prefix, prefix length, explode).
+        self.varspecs = []
+        for varspec in expression.split(','):
+            match = VARSPEC_REGEX.match(varspec)
+            if not match:
+                raise ValueError("Invalid template: '%s'" % template)
+            name, prefix, explode = match.groups()
+            prefix = int(prefix) if prefix else None
+            self.varspecs.append((name, name + '=', prefix, bool(explode)))
+
+    @property
+    def names(self):
+        return [varspec[0] for varspec in self.varspecs]
+
+    def expand(self, variables):
+        reserved, named, ifempty = self.reserved, self.named, self.ifempty
+        parts = []
+        for name, nameeq, prefix, explode in self.varspecs:
+            value = variables.get(name)
+            if value is None:
+                continue
+
+            items = _items(value)
+            if items is None: # String value.
+                if prefix is not None:
+                    value = _prefix(value, prefix)
+                value = _encode(value, reserved)
+                if named:
+                    parts.append(nameeq + value if value else name + ifempty)
+                else:
+                    parts.append(value)
+                continue
+            if not items:
+                continue
+
+            if explode:
+                for key, item in items:
+                    item = _encode(item, reserved)
+                    if key is not None:
+                        key = _encode(key, reserved)
+                        parts.append(key + '=' + item if item else key + ifempty)
+                    elif named:
+                        parts.append(nameeq + item if item else name + ifempty)
+                    else:
+                        parts.append(item)
+            else:
+                joined = []
+                for key, item in items:
+                    if key is not None:
+                        joined.append(_encode(key, reserved))
+                    joined.append(_encode(item, reserved))
+                joined = ','.join(joined)
+                if named:
+                    parts.append(nameeq + joined if joined else name + ifempty)
+                else:
+                    parts.append(joined)
+
+        if not parts:
+            return ''
+        return self.first + self.separator.join(parts)
+
+
+def _items(value):
+    """
+    Returns: None if <value> is a string value, a list of (None, value) tuples if
+    <value> is a list of values, or a list of (key, value) tuples if <value> is a
+    dictionary or a list of (key, value) tuples.
+    """
+    if isinstance(value, basestring) or not hasattr(value, '__iter__'):
+        return None
+    if hasattr(value, 'iteritems') and callable(value.iteritems):
+        return list(value.iteritems())
+    items = list(value)
+    if items and all(isinstance(i, tuple) and len(i) == 2 for i in items):
+        return items
+    return [(None, item) for item in items]
+
+
+def _prefix(value, length):
+    """
+    Returns: The first <length> characters of <value>. Multibyte UTF-8 characters
+    count as a single character.
+    """
+    if isinstance(value, str):
+        try:
+            return value.decode('utf-8')[:length].encode('utf-8')
+        except UnicodeDecodeError:
+            return value[:length]
+    elif isinstance(value, unicode):
+        return value[:length]
+    return str(value)[:length]
+
+
+def _encode(value, reserved):
+    """
+    Percent-encode <value>. If <reserved> is True, reserved characters and
+    existing percent-escapes are left as-is, as for the '+' and '#' operators.
+
+    Returns: The encoded string of <value>.
+    """
+    if value.__class__ is not str:
+        value = utf8_str(value)
+    if not reserved:
+        return urllib.quote(value, UNRESERVED_SAFE_CHARS)
+
+    value = urllib.quote(value, RESERVED_SAFE_CHARS + '%')
+    if '%' in value:
+        value = STRAY_PERCENT_REGEX.sub('%25', value)
+    return value
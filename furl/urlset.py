@@ -0,0 +1,267 @@
+#
+# furl - URL manipulation made simple.
+#
+# Arthur Grunseid
+# grunseid.com
+# grunseid@gmail.com
+#
+# License: Build Amazing Things (Unlicense)
+import math
+import mmap
+import struct
+
+from .hashing import fingerprint
+
+
+_HEADER = struct.Struct('<8sBQQQB')
+_MAGIC = 'FURLSET1'
+_EXACT, _APPROXIMATE = 0, 1
+
+_BYTE = struct.Struct('B')
+_SLOT = struct.Struct('<Q')
+_SLOT_SIZE = _SLOT.size
+_MAX_LOAD_FACTOR = 0.75
+
+
+class URLSet(object):
+    """
+    Compact set of URLs for tracking seen URLs, like a crawler frontier. URLs are
+    canonicalized and only their fingerprints are stored, never the URLs
+    themselves. URL strings and Furl objects can be mixed freely; URLs with the
+    same canonical form are the same member.
+
+    A URLSet is either exact or approximate.
+
+    Exact sets store the 64 bit fingerprint of every URL in an open addressing
+    hash table, which takes 11 to 22 bytes per URL. Two different URLs are only
+    mistaken for each other if their fingerprints collide, which is
+    astronomically unlikely.
+
+    Approximate sets are Bloom filters. They take a fixed amount of memory
+    regardless of the number of URLs added, but report a URL that was never
+    added as a member with probability <error_rate>, as long as no more than
+    <capacity> URLs have been added. For example, an error rate of 0.01 takes
+    1.2 bytes per URL.
+
+    Both kinds of sets can be saved to a file with save() and loaded again with
+    load(). Loaded sets are memory mapped, so even huge sets load instantly and
+    only the pages that are actually probed are read from disk.
+
+    Attributes:
+      capacity: Initial number of URLs an exact set holds before it grows, or
+        the maximum number of URLs an approximate set holds at <error_rate>.
+      error_rate: Probability that an approximate set reports a URL that was
+        never added as a member, or None for exact sets.
+      profile: CanonicalProfile used to canonicalize URLs, or None for
+        DEFAULT_PROFILE. Sets must always be used with the same profile,
+        including after they've been loaded from a file.
+      seed: Seed of the URL fingerprints.
+    """
+
+    def __init__(self, capacity=1024, error_rate=None, profile=None, seed=0):
+        """
+        Raises: ValueError on invalid <capacity> or <error_rate>.
+        """
+        if capacity < 1:
+            raise ValueError("Invalid capacity: '%s'" % capacity)
+        if error_rate is not None and not 0 < error_rate < 1:
+            raise ValueError("Invalid error rate: '%s'" % error_rate)
+
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.profile = profile
+        self.seed = seed
+        self._count = 0
+        self._offset = 0 # Offset of the table or bits in self._buffer.
+
+        if error_rate is None:
+            self._size = 8 # Number of slots, always a power of two.
+            while self._size * _MAX_LOAD_FACTOR < capacity:
+                self._size *= 2
+            self._hashes = 0
+            self._buffer = bytearray(self._size * _SLOT_SIZE)
+        else:
+            ln2 = math.log(2)
+            bits = -capacity * math.log(error_rate) / (ln2 * ln2)
+            self._size = max(8, int(math.ceil(bits / 8.0)) * 8) # Number of bits.
+            self._hashes = max(1, int(round(self._size / float(capacity) * ln2)))
+            self._buffer = bytearray(self._size // 8)
+
+    @property
+    def approximate(self):
+        return self.error_rate is not None
+
+    def add(self, url):
+        """
+        Add <url>, a URL string or Furl object, to this set.
+
+        Raises: ValueError on invalid URL.
+        """
+        if self.approximate:
+            self._add_approximate(self._fingerprint(url, 128))
+        else:
+            self._add_exact(self._fingerprint(url, 64))
+
+    def update(self, urls):
+        """
+        Add every URL string or Furl object in <urls> to this set.
+
+        Raises: ValueError on invalid URL.
+        """
+        if self.approximate:
+            add, bits = self._add_approximate, 128
+        else:
+            add, bits = self._add_exact, 64
+        fingerprint = self._fingerprint
+        for url in urls:
+            add(fingerprint(url, bits))
+
+    def save(self, path):
+        """
+        Save this set to the file <path>, replacing the file if it exists. The
+        set's profile isn't saved.
+        """
+        mode = _APPROXIMATE if self.approximate else _EXACT
+        header = _HEADER.pack(_MAGIC, mode, self.seed, self._count, self._size,
+                              self._hashes)
+        with open(path, 'wb') as f:
+            f.write(header)
+            f.write(buffer(self._buffer, self._offset))
+
+    @classmethod
+    def load(cls, path, profile=None, use_mmap=True):
+        """
+        Load the set saved to the file <path> with save(). If <use_mmap> is True,
+        the file is memory mapped instead of read into memory. Changes to a memory
+        mapped set are never written back to the file; use save() for that.
+
+        Parameters:
+          path: Path of the file to load.
+          profile: CanonicalProfile the set was used with before it was saved.
+          use_mmap: Boolean whether or not to memory map the file.
+        Returns: The loaded URLSet.
+        Raises: ValueError if <path> isn't a saved URLSet.
+        """
+        with open(path, 'rb') as f:
+            if use_mmap:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+            else:
+                data = bytearray(f.read())
+
+        if len(data) < _HEADER.size:
+            raise ValueError("Invalid URLSet file: '%s'" % path)
+        magic, mode, seed, count, size, hashes = _HEADER.unpack_from(data)
+        if magic != _MAGIC:
+            raise ValueError("Invalid URLSet file: '%s'" % path)
+
+        urlset = cls.__new__(cls)
+        urlset.profile = profile
+        urlset.seed = seed
+        urlset._count = count
+        urlset._size = size
+        urlset._hashes = hashes
+        urlset._buffer = data
+        urlset._offset = _HEADER.size
+        if mode == _APPROXIMATE:
+            urlset.capacity = int(round(size * math.log(2) / hashes))
+            urlset.error_rate = 0.5 ** hashes
+        else:
+            urlset.capacity = int(size * _MAX_LOAD_FACTOR)
+            urlset.error_rate = None
+        return urlset
+
+    def __contains__(self, url):
+        if self.approximate:
+            return self._contains_approximate(self._fingerprint(url, 128))
+        return self._contains_exact(self._fingerprint(url, 64))
+
+    def __len__(self):
+        """
+        Returns: The number of URLs in this set. For approximate sets, this is the
+        number of added URLs that weren't already reported as members.
+        """
+        return self._count
+
+    def __nonzero__(self):
+        return self._count > 0
+
+    def __repr__(self):
+        kind = 'approximate' if self.approximate else 'exact'
+        return '<%s %s with %d URLs>' % (self.__class__.__name__, kind, self._count)
+
+    def _fingerprint(self, url, bits):
+        if isinstance(url, basestring):
+            return fingerprint(url, self.seed, bits, self.profile)
+        return url.fingerprint(self.seed, bits, self.profile)
+
+    def _add_exact(self, value):
+        value = value or 1 # 0 marks an empty slot.
+        buf, offset, mask = self._buffer, self._offset, self._size - 1
+        i = value & mask
+        while True:
+            current = _SLOT.unpack_from(buf, offset + i * _SLOT_SIZE)[0]
+            if current == value:
+                return
+            if not current:
+                break
+            i = (i + 1) & mask
+
+        _SLOT.pack_into(buf, offset + i * _SLOT_SIZE, value)
+        self._count += 1
+        if self._count > self._size * _MAX_LOAD_FACTOR:
+            self._grow()
+
+    def _contains_exact(self, value):
+        value = value or 1
+        buf, offset, mask = self._buffer, self._offset, self._size - 1
+        i = value & mask
+        while True:
+            current = _SLOT.unpack_from(buf, offset + i * _SLOT_SIZE)[0]
+            if current == value:
+                return True
+            if not current:
+                return False
+            i = (i + 1) & mask
+
+    def _grow(self):
+        buf, offset = self._buffer, self._offset
+        values = [_SLOT.unpack_from(buf, offset + i * _SLOT_SIZE)[0]
+                  for i in xrange(self._size)]
+
+        self._size *= 2
+        self._buffer = bytearray(self._size * _SLOT_SIZE)
+        self._offset = 0
+        self._count = 0
+        for value in values:
+            if value:
+                self._add_exact(value)
+
+    def _add_approximate(self, value):
+        buf, offset = self._buffer, self._offset
+        isnew = False
+        for bit in self._bits(value):
+            pos, mask = offset + (bit >> 3), 1 << (bit & 7)
+            byte = _BYTE.unpack_from(buf, pos)[0]
+            if not byte & mask:
+                _BYTE.pack_into(buf, pos, byte | mask)
+                isnew = True
+        if isnew:
+            self._count += 1
+
+    def _contains_approximate(self, value):
+        buf, offset = self._buffer, self._offset
+        for bit in self._bits(value):
+            if not _BYTE.unpack_from(buf, offset + (bit >> 3))[0] & (1 << (bit & 7)):
+                return False
+        return True
+
+    def _bits(self, value):
+        """
+        Derive self._hashes bit positions from the 128 bit fingerprint <value> with
+        double hashing.
+
+          http://www.eecs.harvard.edu/~michaelm/postscripts/rsa2008.pdf
+        """
+        size = self._size
+        first, second = value >> 64, (value & 0xFFFFFFFFFFFFFFFF) | 1
+        return [(first + i * second) % size for i in xrange(self._hashes)]
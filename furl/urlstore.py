@@ -0,0 +1,318 @@
+#
+# furl - URL manipulation made simple.
+#
+# Arthur Grunseid
+# grunseid.com
+# grunseid@gmail.com
+#
+# License: Build Amazing Things (Unlicense)
+import mmap
+import struct
+
+from .core import Furl
+from .helpers import fix_encoding
+
+
+_HEADER = struct.Struct('<8sIQQ')
+_MAGIC = 'FURLSTR1'
+_OFFSET = struct.Struct('<Q')
+_OFFSET_SIZE = _OFFSET.size
+
+
+class URLStore(object):
+    """
+    Compact, immutable, sorted list of URL strings, for holding huge URL
+    inventories in memory or in memory mapped files.
+
+    URLs are front coded in blocks of <block_size> URLs: the first URL of every
+    block is stored whole, and every other URL as the length of the prefix it
+    shares with the URL before it, followed by the rest of it. URLs of the same
+    site share long prefixes, so they take a fraction of the memory of a list
+    of strings. An index of block offsets finds the block of a URL by
+    bisection, and only that block is decoded.
+
+    Example:
+      store = URLStore(['http://www.google.com/b', 'http://www.google.com/a'])
+      store[0] == 'http://www.google.com/a'
+      'http://www.google.com/b' in store
+      list(store.iterprefix('http://www.google.com/')) == [
+        'http://www.google.com/a', 'http://www.google.com/b']
+
+    Stores can be saved to a file with save() and loaded again with load().
+    Loaded stores are memory mapped, so even huge stores load instantly and
+    only the blocks that are actually decoded are read from disk.
+
+    Attributes:
+      block_size: Number of URLs per block. Larger blocks compress better, but
+        take longer to decode.
+    """
+
+    def __init__(self, urls=(), block_size=16, presorted=False):
+        """
+        Parameters:
+          urls: Iterable of URL strings and Furl objects to store. Duplicates
+            are only stored once.
+          block_size: Number of URLs per block.
+          presorted: Whether <urls> are already sorted. If so, <urls> are
+            stored as they're iterated, without holding them all in memory.
+        Raises: ValueError on invalid <block_size>, or if <presorted> is True
+        and <urls> aren't sorted.
+        """
+        if block_size < 1:
+            raise ValueError("Invalid block size: '%s'" % block_size)
+        if not presorted:
+            urls = sorted(set(_string(url) for url in urls))
+
+        index, data = bytearray(), bytearray() # Block offsets and blocks.
+        count, previous = 0, None
+        for url in urls:
+            url = _string(url)
+            if previous is not None and url <= previous:
+                if url == previous:
+                    continue
+                raise ValueError("Unsorted URL: '%s'" % url)
+
+            if count % block_size == 0:
+                index += _OFFSET.pack(len(data))
+                data += _varint(len(url))
+                data += url
+            else:
+                shared = _shared_length(previous, url)
+                data += _varint(shared)
+                data += _varint(len(url) - shared)
+                data += url[shared:]
+            count += 1
+            previous = url
+
+        self.block_size = block_size
+        self._count = count
+        self._blocks = len(index) // _OFFSET_SIZE
+        index += data
+        self._buffer = index
+        self._offset = 0 # Offset of the block index in self._buffer.
+        self._block = None # (block number, decoded URLs) of the last block.
+
+    @property
+    def nbytes(self):
+        """
+        The number of bytes of the block index and front coded URLs.
+        """
+        return len(self._buffer) - self._offset
+
+    def save(self, path):
+        """
+        Save this store to the file <path>, replacing the file if it exists.
+        """
+        header = _HEADER.pack(_MAGIC, self.block_size, self._count, self._blocks)
+        with open(path, 'wb') as f:
+            f.write(header)
+            f.write(buffer(self._buffer, self._offset))
+
+    @classmethod
+    def load(cls, path, use_mmap=True):
+        """
+        Load the store saved to the file <path> with save(). If <use_mmap> is
+        True, the file is memory mapped instead of read into memory.
+
+        Returns: The loaded URLStore.
+        Raises: ValueError if <path> isn't a saved URLStore.
+        """
+        with open(path, 'rb') as f:
+            if use_mmap:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                data = f.read()
+
+        if len(data) < _HEADER.size:
+            raise ValueError("Invalid URLStore file: '%s'" % path)
+        magic, block_size, count, blocks = _HEADER.unpack_from(data)
+        if magic != _MAGIC:
+            raise ValueError("Invalid URLStore file: '%s'" % path)
+
+        store = cls.__new__(cls)
+        store.block_size = block_size
+        store._count = count
+        store._blocks = blocks
+        store._buffer = data
+        store._offset = _HEADER.size
+        store._block = None
+        return store
+
+    def index(self, url):
+        """
+        Returns: The position of <url>, a URL string or Furl object, in this
+        store.
+        Raises: ValueError if <url> isn't in this store.
+        """
+        url = _string(url)
+        block = self._find_block(url)
+        if block >= 0:
+            urls = self._decode(block)
+            for i, stored in enumerate(urls):
+                if stored == url:
+                    return block * self.block_size + i
+        raise ValueError("URL not in URLStore: '%s'" % url)
+
+    def iterprefix(self, prefix):
+        """
+        Iterate over the URL strings that start with <prefix>, in order.
+        """
+        prefix = fix_encoding(prefix)
+        block = max(0, self._find_block(prefix))
+        for block in xrange(block, self._blocks):
+            for url in self._decode(block):
+                if url.startswith(prefix):
+                    yield url
+                elif url > prefix:
+                    return
+
+    def iterfurls(self, prefix=''):
+        """
+        Iterate over the URLs that start with <prefix>, in order, as new Furl
+        objects. Furl objects are created on demand, one at a time.
+        """
+        for url in self.iterprefix(prefix):
+            yield Furl(url)
+
+    def __getitem__(self, i):
+        """
+        Returns: The URL string at position <i>.
+        Raises: IndexError if <i> is out of range.
+        """
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError('URLStore index out of range')
+        return self._decode(i // self.block_size)[i % self.block_size]
+
+    def __contains__(self, url):
+        url = _string(url)
+        block = self._find_block(url)
+        return block >= 0 and url in self._decode(block)
+
+    def __iter__(self):
+        for block in xrange(self._blocks):
+            for url in self._decode(block):
+                yield url
+
+    def __len__(self):
+        return self._count
+
+    def __nonzero__(self):
+        return self._count > 0
+
+    def __repr__(self):
+        return '<%s with %d URLs in %d bytes>' % (
+            self.__class__.__name__, self._count, self.nbytes)
+
+    def _data_offset(self, block):
+        """
+        Returns: The offset in self._buffer of block number <block>.
+        """
+        index = self._offset + block * _OFFSET_SIZE
+        return (self._offset + self._blocks * _OFFSET_SIZE +
+                _OFFSET.unpack_from(self._buffer, index)[0])
+
+    def _first(self, block):
+        """
+        Returns: The first URL string of block number <block>.
+        """
+        start = self._data_offset(block)
+        head = str(self._buffer[start:start + 10])
+        length, pos = _read_varint(head, 0)
+        return str(self._buffer[start + pos:start + pos + length])
+
+    def _find_block(self, url):
+        """
+        Returns: The number of the last block whose first URL is at most <url>,
+        or -1 if there's no such block.
+        """
+        lo, hi = 0, self._blocks
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._first(mid) <= url:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo - 1
+
+    def _decode(self, block):
+        """
+        Returns: The list of URL strings of block number <block>.
+        """
+        cached = self._block
+        if cached is not None and cached[0] == block:
+            return cached[1]
+
+        start = self._data_offset(block)
+        if block + 1 < self._blocks:
+            end = self._data_offset(block + 1)
+        else:
+            end = len(self._buffer)
+        data = str(self._buffer[start:end])
+
+        length, pos = _read_varint(data, 0)
+        url = data[pos:pos + length]
+        pos += length
+        urls = [url]
+        while pos < end - start:
+            shared, pos = _read_varint(data, pos)
+            length, pos = _read_varint(data, pos)
+            url = url[:shared] + data[pos:pos + length]
+            pos += length
+            urls.append(url)
+
+        self._block = (block, urls)
+        return urls
+
+
+def _string(url):
+    if isinstance(url, Furl):
+        return str(url)
+    return fix_encoding(url)
+
+
+def _shared_length(a, b):
+    """
+    Returns: The length of the longest common prefix of strings <a> and <b>.
+    """
+    n = min(len(a), len(b))
+    i = 0
+    # Compare in chunks first, then characters.
+    step = 16
+    while i + step <= n and a[i:i + step] == b[i:i + step]:
+        i += step
+    while i < n and a[i] == b[i]:
+        i += 1
+    return i
+
+
+def _varint(value):
+    """
+    Returns: The unsigned integer <value> as a LEB128 variable length string.
+    """
+    if value < 0x80:
+        return chr(value)
+    out = []
+    while value >= 0x80:
+        out.append(chr((value & 0x7F) | 0x80))
+        value >>= 7
+    out.append(chr(value))
+    return ''.join(out)
+
+
+def _read_varint(data, pos):
+    """
+    Returns: Tuple (value, position after the value) of the LEB128 variable
+    length unsigned integer at position <pos> of the string <data>.
+    """
+    byte = ord(data[pos])
+    if byte < 0x80:
+        return byte, pos + 1
+    value, shift = 0, 0
+    while byte >= 0x80:
+        value |= (byte & 0x7F) << shift
+        shift += 7
+        pos += 1
+        byte = ord(data[pos])
+    return value | (byte << shift), pos + 1
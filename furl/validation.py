@@ -0,0 +1,101 @@
+#
+# furl - URL manipulation made simple.
+#
+# Arthur Grunseid
+# grunseid.com
+# grunseid@gmail.com
+#
+# License: Build Amazing Things (Unlicense)
+from .helpers import LazyRegex
+
+
+# RFC 3986
+#   URI-reference = URI / relative-ref
+#   URI           = scheme ":" hier-part [ "?" query ] [ "#" fragment ]
+#   relative-ref  = relative-part [ "?" query ] [ "#" fragment ]
+#
+#   hier-part     = "//" authority path-abempty / path-absolute / path-rootless
+#                 / path-empty
+#   relative-part = "//" authority path-abempty / path-absolute / path-noscheme
+#                 / path-empty
+#
+#   scheme        = ALPHA *( ALPHA / DIGIT / "+" / "-" / "." )
+#   authority     = [ userinfo "@" ] host [ ":" port ]
+#   userinfo      = *( unreserved / pct-encoded / sub-delims / ":" )
+#   host          = IP-literal / IPv4address / reg-name
+#   IP-literal    = "[" ( IPv6address / IPvFuture  ) "]"
+#   IPvFuture     = "v" 1*HEXDIG "." 1*( unreserved / sub-delims / ":" )
+#   reg-name      = *( unreserved / pct-encoded / sub-delims )
+#
+#   path-noscheme = segment-nz-nc *( "/" segment )
+#   fragment      = *( pchar / "/" / "?" )
+#
+# IPv4address is a subset of reg-name, so it isn't matched separately. Like
+# is_valid_port(), ports must be 1 to 65535, so empty ports are invalid. The
+# path, query, and fragment characters are those of VALID_ENCODED_PATH_REGEX
+# and VALID_ENCODED_QUERY_REGEX.
+_PCT_ENCODED = r'%[\da-fA-F]{2}'
+_SUB_DELIMS = r"!\$&'\(\)\*\+,;="
+
+
+def _chars(chars):
+    # Unrolled *( [chars] / pct-encoded ), which backtracks less than an
+    # alternation of single characters.
+    return r'[%s]*(?:%s[%s]*)*' % (chars, _PCT_ENCODED, chars)
+
+
+_H16 = r'[\da-fA-F]{1,4}'
+_DEC_OCTET = r'(?:25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)'
+_IPV4 = r'%s(?:\.%s){3}' % (_DEC_OCTET, _DEC_OCTET)
+_LS32 = r'(?:%s:%s|%s)' % (_H16, _H16, _IPV4)
+_IPV6 = '|'.join(pattern % {'h16': _H16, 'ls32': _LS32} for pattern in [
+    r'(?:%(h16)s:){6}%(ls32)s',
+    r'::(?:%(h16)s:){5}%(ls32)s',
+    r'(?:%(h16)s)?::(?:%(h16)s:){4}%(ls32)s',
+    r'(?:(?:%(h16)s:){0,1}%(h16)s)?::(?:%(h16)s:){3}%(ls32)s',
+    r'(?:(?:%(h16)s:){0,2}%(h16)s)?::(?:%(h16)s:){2}%(ls32)s',
+    r'(?:(?:%(h16)s:){0,3}%(h16)s)?::%(h16)s:%(ls32)s',
+    r'(?:(?:%(h16)s:){0,4}%(h16)s)?::%(ls32)s',
+    r'(?:(?:%(h16)s:){0,5}%(h16)s)?::%(h16)s',
+    r'(?:(?:%(h16)s:){0,6}%(h16)s)?::',
+])
+_IP_LITERAL = r'\[(?:%s|v[\da-fA-F]+\.[\w\-\.~%s:]+)\]' % (_IPV6, _SUB_DELIMS)
+_PORT = (r'0*(?:[1-9]\d{0,3}|[1-5]\d{4}|6[0-4]\d{3}|65[0-4]\d\d|655[0-2]\d|'
+         r'6553[0-5])')
+
+_AUTHORITY = r'(?:%s@)?(?:%s|%s)(?::%s)?' % (
+    _chars(r'\w\-\.~%s:' % _SUB_DELIMS), _IP_LITERAL,
+    _chars(r'\w\-\.~%s' % _SUB_DELIMS), _PORT)
+_PATH = _chars(r"\w\-\.~:@%s/" % _SUB_DELIMS)
+_QUERY = _chars(r"\w\-\.~:@%s/\?" % _SUB_DELIMS)
+
+# Without an authority, a path can't begin with '//'. Without a scheme, the
+# first segment of a relative path can't contain ':'.
+VALID_URL_REGEX = LazyRegex(
+    r'(?:[a-zA-Z][a-zA-Z\d\+\-\.]*:(?://%(authority)s(?:/%(path)s)?|(?!//)%(path)s)'
+    r'|(?://%(authority)s(?:/%(path)s)?|(?!//)(?![^/\?#]*:)%(path)s))'
+    r'(?:\?%(query)s)?(?:#%(query)s)?\Z' % {
+        'authority': _AUTHORITY, 'path': _PATH, 'query': _QUERY})
+
+
+def is_valid(url):
+    """
+    Check whether the URL string <url> is a valid, properly encoded URI
+    reference according to RFC 3986. Relative references, like '/a/b?c=d', are
+    valid. No objects are created, so this is much faster than catching
+    ValueError from Furl(<url>) for invalid URLs.
+
+    Returns: True if <url> is valid, False otherwise.
+    """
+    return VALID_URL_REGEX.match(url) is not None
+
+
+def validate_many(urls):
+    """
+    Check whether every URL string in <urls> is valid. See is_valid().
+
+    Returns: A list of booleans, True for every valid URL in <urls> and False
+    for every invalid one.
+    """
+    match = VALID_URL_REGEX.match
+    return [match(url) is not None for url in urls]
@@ -17,7 +17,7 @@ setup(name='furl',
       license='Unlicense',
       description='URL manipulation made simple.',
       long_description=long_description,
-      packages=find_packages(),
+      packages=find_packages(exclude=['benchmarks']),
       include_package_data=True,
       platforms=['any'],
       classifiers=[
@@ -0,0 +1,116 @@
+#
+# furl - URL manipulation made simple.
+#
+# Arthur Grunseid
+# grunseid.com
+# grunseid@gmail.com
+#
+# License: Build Amazing Things (Unlicense)
+"""
+Differential conformance of furl's parser against the stdlib's, shared by
+test_differential.py and benchmarks/differential.py.
+
+Every URL is parsed with urlparse.urlsplit(), furl.helpers.urlsplit(), and
+Furl(). furl.helpers.urlsplit() is compared with urlparse.urlsplit() as-is.
+Furl() components are compared with the stdlib's after applying furl's
+documented normalizations to the stdlib's, like the lowercase host and default
+ports, so only unexpected differences are reported for Furl().
+"""
+import urllib
+import urlparse
+from collections import defaultdict
+
+import furl
+
+
+SPLIT_COMPONENTS = ['scheme', 'netloc', 'path', 'query', 'fragment']
+FURL_COMPONENTS = ['scheme', 'username', 'password', 'host', 'port', 'path',
+                   'query', 'fragment']
+
+
+def stdlib_components(url):
+    """
+    Returns: Dictionary of the components of <url> parsed by the stdlib, in the
+    form Furl() represents them.
+    """
+    split = urlparse.urlsplit(url)
+    scheme = split.scheme or None
+    if scheme and scheme not in urlparse.uses_query:
+        # Like furl, split the query from the path for every scheme.
+        split = urlparse.urlsplit('http' + url[len(scheme):])
+
+    host = split.hostname
+    if host is not None and ':' in host:
+        host = '[%s]' % host
+    if host is None and split.netloc:
+        host = ''
+    port = split.port or furl.Furl.DEFAULT_PORTS.get(scheme)
+
+    return {
+        'scheme': scheme,
+        'username': split.username,
+        'password': split.password,
+        'host': host,
+        'port': port,
+        'path': urllib.unquote(split.path),
+        'query': urlparse.parse_qsl(split.query, keep_blank_values=True),
+        'fragment': urllib.unquote(split.fragment),
+    }
+
+
+def furl_components(url):
+    """
+    Returns: Dictionary of the components of <url> parsed by Furl().
+    """
+    f = furl.Furl(url)
+    return {
+        'scheme': f.scheme,
+        'username': f.username,
+        'password': f.password,
+        'host': f.host,
+        'port': f.port,
+        'path': urllib.unquote(str(f.path)),
+        'query': f.query.params.allitems(),
+        'fragment': urllib.unquote(str(f.fragment)),
+    }
+
+
+def compare(urls):
+    """
+    Parse every URL in <urls> with the stdlib and furl, and compare the
+    components.
+
+    Returns: Dictionary of '<parser>.<component>' to a list of mismatches, as
+    (url, stdlib value, furl value) tuples. Errors raised by a parser are
+    compared as their class names.
+    """
+    mismatches = defaultdict(list)
+    for url in urls:
+        expected = parse(urlparse.urlsplit, url)
+        actual = parse(furl.helpers.urlsplit, url)
+        for i, component in enumerate(SPLIT_COMPONENTS):
+            pair = (_item(expected, i), _item(actual, i))
+            if pair[0] != pair[1]:
+                mismatches['urlsplit.' + component].append((url,) + pair)
+
+        expected = parse(stdlib_components, url)
+        actual = parse(furl_components, url)
+        for component in FURL_COMPONENTS:
+            pair = (_item(expected, component), _item(actual, component))
+            if pair[0] != pair[1]:
+                mismatches['Furl.' + component].append((url,) + pair)
+    return dict(mismatches)
+
+
+def parse(parser, url):
+    """
+    Returns: <parser>(<url>), or the class name of the error it raised.
+    """
+    try:
+        return parser(url)
+    except Exception as e:
+        return e.__class__.__name__
+
+
+def _item(parsed, key):
+    return parsed if isinstance(parsed, basestring) else parsed[key]
@@ -0,0 +1,109 @@
+#
+# furl - URL manipulation made simple.
+#
+# Arthur Grunseid
+# grunseid.com
+# grunseid@gmail.com
+#
+# License: Build Amazing Things (Unlicense)
+
+import unittest
+
+import furl
+from tests import corpus
+
+
+class TestCanonicalize(unittest.TestCase):
+    def test_basics(self):
+        tests = [
+            ('HTTP://Www.Google.COM:80/a/./b/../c?%7euser=1#',
+             'http://www.google.com/a/c?~user=1'),
+            ('http://google.com', 'http://google.com/'),
+            ('https://google.com:443/', 'https://google.com/'),
+            ('https://google.com:80/', 'https://google.com:80/'),
+            ('http://u:p@google.com/%7e%2f%2a%5e', 'http://u:p@google.com/~%2F*%5E'),
+            ('http://google.com/?a=%20b&c=d+e', 'http://google.com/?a=+b&c=d+e'),
+            ('http://google.com/#%7efrag%2f', 'http://google.com/#~frag%2F'),
+            ('sup://[::1]:99/a/../b', 'sup://[::1]:99/b'),
+            ('mailto:user@google.com', 'mailto:user@google.com'),
+            ('/a/./b/../../c', '/c'),
+            ('', ''),
+        ]
+        for url, canonical in tests:
+            assert furl.canonicalize(url) == canonical
+            assert furl.Furl(url).canonical() == canonical
+
+    def test_strings_and_furls_agree(self):
+        urls = ['https://u:p@A.com:443/x%2fy/%7Ez?a=%20b&c=d+e#F%7e%2f',
+                'http://a.com:8080/?utm_source=1&b=2&a=1&a=0#',
+                'sup://www.pumps.com/a%20b/c/?d=d&d=e&f=#g/h?i=j',
+                'http://www.google.com/../a/b/./c/']
+        profiles = [furl.DEFAULT_PROFILE,
+                    furl.CanonicalProfile(sort_query=True, query_deny=['utm_*']),
+                    furl.CanonicalProfile(drop_default_port=False,
+                                          drop_fragment=True)]
+        for profile in profiles:
+            for url in urls:
+                f = furl.Furl(url)
+                assert furl.canonicalize(url, profile) == f.canonical(profile)
+                assert furl.canonicalize(f, profile) == f.canonical(profile)
+
+    def test_strings_and_furls_agree_over_corpus(self):
+        urls = [url for category in corpus.CATEGORIES
+                for url in corpus.generate(category, 50)]
+        urls += ['http://a.com/%2541', 'http://a.com/%252F%2F', 'http://:p@a.com/',
+                 'http://u:@a.com/', 'http://@a.com/', 'http://a.com/?%2541=%2542',
+                 'http://a.com/#%2541', '//a.com/b', 'a/b/../c']
+        profiles = [furl.DEFAULT_PROFILE,
+                    furl.CanonicalProfile(remove_dot_segments=False,
+                                          empty_path_as_root=False)]
+        for url in urls:
+            f = furl.Furl(url)
+            for profile in profiles:
+                assert furl.canonicalize(url, profile) == f.canonical(profile), url
+            assert furl.fingerprint(url) == f.fingerprint(), url
+
+    def test_profile_rules(self):
+        url = 'HTTP://Google.COM:80/a/./b?utm_source=x&b=2&a=1&a=0&fbclid=y#frag'
+
+        profile = furl.CanonicalProfile(lowercase_scheme=False,
+                                        lowercase_host=False)
+        assert furl.canonicalize(url, profile).startswith('HTTP://Google.COM/')
+
+        profile = furl.CanonicalProfile(drop_default_port=False,
+                                        remove_dot_segments=False)
+        assert furl.canonicalize(url, profile).startswith('http://google.com:80/a/./b?')
+        assert furl.canonicalize('http://a.com/', profile) == 'http://a.com:80/'
+
+        profile = furl.CanonicalProfile(empty_path_as_root=False)
+        assert furl.canonicalize('http://a.com', profile) == 'http://a.com'
+
+        profile = furl.CanonicalProfile(sort_query=True, drop_fragment=True,
+                                        query_deny=['utm_*', 'fbclid'])
+        assert furl.canonicalize(url, profile) == 'http://google.com/a/b?a=1&a=0&b=2'
+
+        profile = furl.CanonicalProfile(query_allow=['a', 'fbclid'],
+                                        query_deny=['fbclid'])
+        assert furl.canonicalize(url, profile) == 'http://google.com/a/b?a=1&a=0#frag'
+
+    def test_invalid_urls(self):
+        for url in ['http://google.com:0/', 'http://google.com:port/',
+                    'http://[::1/']:
+            self.assertRaises(ValueError, furl.canonicalize, url)
+
+    def test_canonicalize_many(self):
+        urls = ['HTTP://A.com:80/./b', furl.Furl('http://a.com/b/'), 'http://a.com/']
+        assert furl.canonicalize_many(urls) == [
+            'http://a.com/b', 'http://a.com/b/', 'http://a.com/']
+        assert furl.canonicalize_many([]) == []
+
+        profile = furl.CanonicalProfile(drop_default_port=False)
+        assert furl.canonicalize_many(urls, profile) == [
+            furl.canonicalize(url, profile) for url in urls]
+
+    def test_unsplit_components(self):
+        usc = furl.unsplit_components
+        assert usc(('http', 'a.com', '/b', 'c=d', 'e')) == 'http://a.com/b?c=d#e'
+        assert usc(('http', 'a.com', 'b', '', '')) == 'http://a.com/b'
+        assert usc(('mailto', '', 'a@b.com', '', '')) == 'mailto:a@b.com'
+        assert usc(('', '', 'a/b', '', 'c')) == 'a/b#c'
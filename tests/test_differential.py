@@ -0,0 +1,49 @@
+#
+# furl - URL manipulation made simple.
+#
+# Arthur Grunseid
+# grunseid.com
+# grunseid@gmail.com
+#
+# License: Build Amazing Things (Unlicense)
+
+import unittest
+
+from tests import corpus
+from tests import differential
+
+
+# Known differences between furl and the stdlib. Any other difference is a
+# regression of furl's parser.
+KNOWN_MISMATCHES = {
+    # furl.helpers.urlsplit() doesn't lowercase the scheme.
+    'urlsplit.scheme': lambda url, stdlib, furl: stdlib == furl.lower(),
+    # furl serializes fragment query keys without values as 'key='.
+    'Furl.fragment': lambda url, stdlib, furl: furl.startswith(stdlib),
+}
+
+
+class TestDifferential(unittest.TestCase):
+    def test_corpora(self):
+        for category in corpus.CATEGORIES:
+            mismatches = differential.compare(corpus.generate(category, 100))
+            for component, found in mismatches.items():
+                assert component in KNOWN_MISMATCHES, (category, found[0])
+                for mismatch in found:
+                    assert KNOWN_MISMATCHES[component](*mismatch), mismatch
+
+    def test_mismatches(self):
+        urls = ['HTTP://a.com/', 'http://a.com/#/b?c=d&e']
+        mismatches = differential.compare(urls)
+        assert mismatches == {
+            'urlsplit.scheme': [('HTTP://a.com/', 'http', 'HTTP')],
+            'Furl.fragment': [('http://a.com/#/b?c=d&e', '/b?c=d&e', '/b?c=d&e=')]}
+        assert differential.compare(['http://a.com:/']) == {
+            'Furl.host': [('http://a.com:/', 'a.com', 'ValueError')],
+            'Furl.port': [('http://a.com:/', 80, 'ValueError')],
+            'Furl.scheme': [('http://a.com:/', 'http', 'ValueError')],
+            'Furl.username': [('http://a.com:/', None, 'ValueError')],
+            'Furl.password': [('http://a.com:/', None, 'ValueError')],
+            'Furl.path': [('http://a.com:/', '/', 'ValueError')],
+            'Furl.query': [('http://a.com:/', [], 'ValueError')],
+            'Furl.fragment': [('http://a.com:/', '', 'ValueError')]}
@@ -8,6 +8,9 @@
 #
 # License: Build Amazing Things (Unlicense)
 
+import os
+import subprocess
+import sys
 import urllib
 import unittest
 import urlparse
@@ -23,12 +26,6 @@ except ImportError:
 import furl
 from furl.multidict import OneDimensionalOrderedMultidict
 
-#
-# TODO(grun): Add tests for Furl objects with strict=True. Make sure
-# UserWarnings are raised when improperly encoded path, query, and fragment
-# strings are provided.
-#
-
 # Utility list subclasses to expose allitems() and iterallitems() methods on
 # different kinds of item containers - lists, dictionaries, multivalue
 # dictionaries, and query strings. This provides a common iteration interface
@@ -126,6 +123,12 @@ class TestPath(unittest.TestCase):
         path = furl.Path(u'/some/كهربائي/arabic/')
         str(path)
 
+        # Unicode is UTF-8 encoded where it enters, including through the list
+        # interface.
+        for path in [furl.Path([u'', u'كهربائي']), furl.Path('/').add([u'كهربائي'])]:
+            assert path.segments == ['كهربائي']
+            assert str(path) == '/%D9%83%D9%87%D8%B1%D8%A8%D8%A7%D8%A6%D9%8A'
+
     def test_path_inside_path(self):
         instance = furl.Path('/some/path/')
         assert furl.Furl(instance) == '/some/path/'
@@ -525,6 +528,14 @@ class TestQuery(unittest.TestCase):
     def test_iris(self):
         query = furl.Query(u'param=كهربائي')
         str(query)  # Should not throw error
+        assert query.params.allitems() == [('param', 'كهربائي')]
+
+        # Params modified directly are converted when the query is encoded.
+        query = furl.Query()
+        query.params[u'é'] = u'é'
+        query.params['one'] = 1
+        query.params['none'] = None
+        assert str(query) == '%C3%A9=%C3%A9&one=1&none=None'
 
     def test_load(self):
         for items in self.items:
@@ -657,6 +668,68 @@ class TestQuery(unittest.TestCase):
         return allitems_quoted
 
 
+class TestQueryFilter(unittest.TestCase):
+    def test_keeps(self):
+        qf = furl.QueryFilter(deny=['utm_*', 'fbclid', '*_ref', 'a*b'])
+        for key in ['utm_', 'utm_source', 'fbclid', 'x_ref', '_ref', 'ab', 'a_b']:
+            assert not qf.keeps(key), key
+        for key in ['id', 'utm', 'fbclid2', 'x_ref2', 'abc', '']:
+            assert qf.keeps(key), key
+
+        qf = furl.QueryFilter(allow=['id', 'page*'], deny=['page_token'])
+        assert qf.keeps('id') and qf.keeps('page') and qf.keeps('page_size')
+        assert not qf.keeps('page_token') and not qf.keeps('x')
+        assert not furl.QueryFilter(allow=[]).keeps('id')
+
+        # Decisions are cached up to <cache_size> keys.
+        qf = furl.QueryFilter(deny=['a'], cache_size=2)
+        for key in ['a', 'b', 'c', 'd']:
+            qf.keeps(key)
+            assert len(qf._decisions) <= 2
+
+    def test_apply(self):
+        qf = furl.QueryFilter(deny=['utm_*', 'fbclid'])
+
+        # Query strings keep the encoding and order of the parameters that are
+        # kept, and every value of repeated keys.
+        assert qf.apply('b=2&utm_source=x&a=%20&b=3;fbclid=1') == 'b=2&a=%20&b=3'
+        assert qf.apply('utm%5Fsource=x&a+a=1&fbclid') == 'a+a=1'
+        assert qf.apply('utm_source=x') == ''
+        query = 'a=1;b=2'
+        assert qf.apply(query) is query
+
+        # Query and Furl objects are filtered in place.
+        q = furl.Query('b=2&utm_source=x&a=1&b=3')
+        assert qf.apply(q) is q
+        assert q.params.allitems() == [('b', '2'), ('a', '1'), ('b', '3')]
+
+        f = furl.Furl('http://a.com/?fbclid=x&id=1#f?utm_a=1')
+        assert qf.apply(f) is f
+        assert str(f) == 'http://a.com/?id=1#f?utm_a=1'
+
+        q = furl.Query()
+        q.params.add(1, 2).add('utm_a', 3)
+        assert qf.apply(q).params.allitems() == [(1, 2)]
+
+    def test_filter_url(self):
+        qf = furl.QueryFilter(allow=['id', 'page'])
+        assert qf.filter_url('http://a.com/?id=1&x=2#f') == 'http://a.com/?id=1#f'
+        assert qf.filter_url('http://a.com/?x=2#f') == 'http://a.com/#f'
+        assert qf.filter_url('http://a.com/#?x=2') == 'http://a.com/#?x=2'
+        assert qf.filter_url('http://a.com/') == 'http://a.com/'
+
+        f = furl.Furl('http://a.com/?page=1&x=2')
+        urls = qf.filter_many(['http://b.com/?x=1&id=2', f])
+        assert urls == ['http://b.com/?id=2', f]
+        assert str(f) == 'http://a.com/?page=1'
+
+    def test_canonical_profile(self):
+        profile = furl.CanonicalProfile(query_deny=['utm_*', 'fbclid'])
+        assert isinstance(profile.query_filter, furl.QueryFilter)
+        assert not profile.keeps_query_key('utm_source')
+        assert profile.keeps_query_key('id')
+
+
 class TestQueryCompositionInterface(unittest.TestCase):
     def test_interface(self):
         class tester(furl.QueryCompositionInterface):
@@ -866,6 +939,11 @@ class TestFurl(unittest.TestCase):
         thing = furl.Furl(u'http://example.com/كهربائي/?param=كهربائي')
         str(thing)
 
+        f = furl.Furl().load(u'http://example.com/é?é=é#é')
+        assert f.path.segments == ['é'] and f.query.params['é'] == 'é'
+        assert f.fragment.path.segments == ['é']
+        assert str(f) == 'http://example.com/%C3%A9?%C3%A9=%C3%A9#%C3%A9'
+
     def test_furl_recursive(self):
         instance = furl.Furl('/some/path?param=1')
         assert furl.Furl(instance) == '/some/path?param=1'
@@ -1170,6 +1248,58 @@ class TestFurl(unittest.TestCase):
         with self.assertRaises(ValueError):
             furl.Furl('http://0:0:0:0:0:0:0:1]/')
 
+    def test_origin(self):
+        f = furl.Furl('https://WWW.Pumps.com/a?b=c#d')
+        assert f.origin == ('https', 'www.pumps.com', 443)
+        assert f.origin is f.origin # Cached.
+        assert hash(f.origin) == hash(('https', 'www.pumps.com', 443))
+        assert furl.Furl('/a/b').origin == (None, None, None)
+
+        # Changing the scheme, host, or port invalidates the origin.
+        f.path = '/changed'
+        assert f.origin is f.origin
+        f.scheme = 'http'
+        assert f.origin == ('http', 'www.pumps.com', 443)
+        f.port = None
+        assert f.origin == ('http', 'www.pumps.com', 80)
+        f.host = 'pumps.com'
+        assert f.origin == ('http', 'pumps.com', 80)
+        f.netloc = 'pumps.com:81'
+        assert f.origin == ('http', 'pumps.com', 81)
+        f.load('ftp://pumps.com')
+        assert f.origin == ('ftp', 'pumps.com', 21)
+        assert f.copy().origin == f.origin
+
+        # The scheme is lowercase, and its default port is found, whatever case
+        # it's assigned in.
+        f.scheme = 'HTTP'
+        assert f.origin == ('http', 'pumps.com', 21)
+        f.port = None
+        assert f.origin == ('http', 'pumps.com', 80)
+        assert f.netloc == 'pumps.com'
+
+    def test_same_origin(self):
+        f = furl.Furl('http://www.pumps.com/a')
+        assert f.same_origin(furl.Furl('HTTP://WWW.PUMPS.COM:80/b?c=d'))
+        assert f.same_origin('http://www.pumps.com:80/b')
+        assert not f.same_origin('https://www.pumps.com/a')
+        assert not f.same_origin('http://www.pumps.com:81/a')
+        assert not f.same_origin(furl.Furl('http://pumps.com/a'))
+        assert furl.Furl('/a').same_origin('/b')
+        self.assertRaises(ValueError, f.same_origin, 'http://www.pumps.com:0/')
+
+        f.scheme = 'HTTP'
+        assert f.same_origin('http://www.pumps.com/b')
+        assert f.same_origin(furl.Furl('http://www.pumps.com/b'))
+
+        # The default ports of subclasses apply to URL strings too.
+        class Custom(furl.Furl):
+            DEFAULT_PORTS = dict(furl.Furl.DEFAULT_PORTS, custom=1234)
+        f = Custom('custom://pumps.com/a')
+        assert f.origin == ('custom', 'pumps.com', 1234)
+        assert f.same_origin('CUSTOM://pumps.com:1234/b')
+        assert f.same_origin('custom://pumps.com/b')
+
     def test_netlocs(self):
         f = furl.Furl('http://pumps.com/')
         netloc = '1.2.3.4.5.6:999'
@@ -1451,6 +1581,74 @@ class TestFurl(unittest.TestCase):
             tojoin = furl.Furl(join)
             assert f is f.join(tojoin) and f.url == result
 
+        # Reference resolution examples from RFC 3986 section 5.4. Queries without
+        # values, like 'q', are serialized as 'q='.
+        base = furl.Furl('http://a/b/c/d;p?q')
+        rfc_tests = [
+            ('g', 'http://a/b/c/g'), ('./g', 'http://a/b/c/g'),
+            ('g/', 'http://a/b/c/g/'), ('/g', 'http://a/g'), ('//g', 'http://g'),
+            ('?y', 'http://a/b/c/d;p?y='), ('g?y', 'http://a/b/c/g?y='),
+            ('#s', 'http://a/b/c/d;p?q=#s'), ('g#s', 'http://a/b/c/g#s'),
+            (';x', 'http://a/b/c/;x'), ('', 'http://a/b/c/d;p?q='),
+            ('.', 'http://a/b/c/'), ('./', 'http://a/b/c/'), ('..', 'http://a/b/'),
+            ('../g', 'http://a/b/g'), ('../..', 'http://a/'),
+            ('../../g', 'http://a/g'), ('../../../../g', 'http://a/g'),
+            ('/./g', 'http://a/g'), ('/../g', 'http://a/g'),
+            ('g.', 'http://a/b/c/g.'), ('..g', 'http://a/b/c/..g'),
+            ('./../g', 'http://a/b/g'), ('./g/.', 'http://a/b/c/g/'),
+            ('g/./h', 'http://a/b/c/g/h'), ('g/../h', 'http://a/b/c/h'),
+            ('g;x=1/../y', 'http://a/b/c/y'),
+            ('sup://b/./c/../d', 'sup://b/d'),
+            # A reference with the base's scheme but no authority is relative.
+            ('http:g', 'http://a/b/c/g'), ('HTTP:../g', 'http://a/b/g'),
+            # Encoded dots are literal segments, not dot segments.
+            ('%2e%2e/g', 'http://a/b/c/%2e%2e/g'), ('%2E/g', 'http://a/b/c/%2E/g'),
+            ('a/%2e%2e/../g', 'http://a/b/c/a/g'),
+        ]
+        for join, result in rfc_tests:
+            f = base.copy()
+            assert f is f.join(join) and f.url == result
+        assert base.url == 'http://a/b/c/d;p?q='
+
+        # Decoded segments of the base URL aren't decoded again, or removed as
+        # dot segments.
+        f = furl.Furl('http://a/')
+        f.path.segments = ['..', 'b%41', 'c']
+        assert f.join('d').path.segments == ['..', 'b%41', 'd']
+
+        # Relative references against a URL with a netloc but no path.
+        assert furl.Furl('http://a.com').join('b/c').url == 'http://a.com/b/c'
+
+    def test_join_many(self):
+        base = 'http://www.pumps.com/a/b?c=c#d'
+        refs = ['e', '../f?g=g', '#h', '//yahoo.com/i', 'sup://j/k']
+        joined = furl.join_many(base, refs)
+        assert all(isinstance(f, furl.Furl) for f in joined)
+        assert [f.url for f in joined] == [
+            'http://www.pumps.com/a/e', 'http://www.pumps.com/f?g=g',
+            'http://www.pumps.com/a/b?c=c#h', 'http://yahoo.com/i', 'sup://j/k']
+
+        # Furl bases are left unmodified.
+        f = furl.Furl(base)
+        assert [j.url for j in furl.join_many(f, refs)] == [j.url for j in joined]
+        assert f.url == base
+        assert furl.join_many(base, []) == []
+
+    def test_copy(self):
+        url = 'sup://u:p@host:99/a%20b/c/?d=d&d=e&f=#g/h?i=j'
+        f = furl.Furl(url)
+        f.fragment.separator = False
+        copy = f.copy()
+        assert copy is not f and copy.url == f.url
+        assert copy.path.segments == f.path.segments
+        assert copy.args.allitems() == f.args.allitems()
+
+        # Copies are independent of the original.
+        copy.path.segments.append('k')
+        copy.args['d'] = 'l'
+        copy.fragment.path.segments.append('m')
+        assert f.url == 'sup://u:p@host:99/a%20b/c/?d=d&d=e&f=#g/hi=j'
+
     def test_equality(self):
         assert furl.Furl() is not furl.Furl() and furl.Furl() == furl.Furl()
 
@@ -1566,6 +1764,13 @@ class TestFurl(unittest.TestCase):
         assert jps(['', 'a', '', 'b', ''], ['', 'c']) == ['', 'a', '', 'b', '', 'c']
         assert jps(['', 'a', ''], ['', 'b', ''], ['', 'c']) == ['', 'a', '', 'b', '', 'c']
 
+    def test_split_path(self):
+        assert furl.split_path('') == []
+        assert furl.split_path('/') == ['']
+        assert furl.split_path('/a/b%20c/') == ['a', 'b c', '']
+        assert furl.split_path('a/b%20c', unquote=False) == ['a', 'b%20c']
+        assert furl.split_path(u'/\xe9') == ['\xc3\xa9']
+
     def test_remove_path_segments(self):
         rps = furl.remove_path_segments
 
@@ -1633,6 +1838,27 @@ class TestFurl(unittest.TestCase):
         assert rps(['a'], ['a', 'b']) == ['a']
         assert rps(['a', 'a'], ['a', 'a', 'a']) == ['a', 'a']
 
+    def test_remove_dot_segments(self):
+        rds = furl.remove_dot_segments
+
+        assert rds([]) == []
+        assert rds(['a', 'b']) == ['a', 'b']
+        assert rds(['', 'a', 'b', 'c', '.', '..', '..', 'g']) == ['', 'a', 'g']
+        assert rds(['mid', 'content=5', '..', '6']) == ['mid', '6']
+
+        # Trailing '.' and '..' segments leave a trailing slash.
+        assert rds(['', 'a', 'b', '..']) == ['', 'a', '']
+        assert rds(['', 'a', 'b', '.']) == ['', 'a', 'b', '']
+        assert rds(['', 'a', '..']) == ['', '']
+
+        # '..' never climbs above the root of an absolute path.
+        assert rds(['', '..', 'g']) == ['', 'g']
+        assert rds(['', '..', '..', '..', 'g']) == ['', 'g']
+        assert rds(['..', 'g']) == ['g']
+
+        # Segments that merely contain dots are left alone.
+        assert rds(['', 'g.', '.g', '..g', 'g..']) == ['', 'g.', '.g', '..g', 'g..']
+
     def test_is_valid_port(self):
         valids = [1, 2, 3, 65535, 119, 2930]
         invalids = [-1, -9999, 0, 'a', [], (0,), {1: 1}, 65536, 99999, {}, None]
@@ -1682,3 +1908,119 @@ class TestFurl(unittest.TestCase):
         a = furl.Furl('http://test.com/some/test/path')
         a.url = 'http://something.else.com/another/path/'
         assert a == 'http://something.else.com/another/path/'
+
+
+class TestPackage(unittest.TestCase):
+    def _modules_after(self, statement):
+        # Run <statement> in a fresh interpreter and return the names of the
+        # modules it imported.
+        script = ('import sys; before = set(sys.modules); %s; '
+                  'print(" ".join(set(sys.modules) - before))' % statement)
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        output = subprocess.check_output([sys.executable, '-c', script], cwd=root)
+        return set(output.split())
+
+    def test_lazy_import(self):
+        imported = self._modules_after('import furl')
+        for module in ['furl.core', 'orderedmultidict', 'urllib', 'mmap']:
+            assert module not in imported
+
+        imported = self._modules_after('import furl; furl.Furl')
+        assert 'furl.core' in imported
+        for module in ['furl.canonical', 'furl.urlset', 'mmap', 'furl.suffixes',
+                       'threading', 'furl.ip', 'furl.idn', 'encodings.idna',
+                       'stringprep', 'unicodedata', 'furl.routing',
+                       'furl.patterns', 'furl.template', 'furl.hashing',
+                       'furl.index', 'furl.urlstore', 'furl.validation']:
+            assert module not in imported, module
+
+        # Nor are they imported by parsing, resolving and serializing URLs.
+        imported = self._modules_after(
+            "import furl; f = furl.Furl('http://a.com/b/../c?d=e#f'); "
+            "str(f.join('g')); f.origin; f == f.copy()")
+        for module in ['furl.canonical', 'furl.suffixes', 'furl.idn',
+                       'furl.routing', 'furl.patterns', 'furl.template']:
+            assert module not in imported, module
+
+    def test_exports(self):
+        for name in furl.__all__:
+            assert getattr(furl, name) is not None
+        assert furl.fingerprint is furl.hashing.fingerprint
+        assert furl.helpers.urlsplit is furl.urlsplit
+        assert 'Furl' in dir(furl) and 'urlset' in dir(furl)
+        self.assertRaises(AttributeError, getattr, furl, 'missing')
+
+
+class TestStrict(unittest.TestCase):
+    def test_warnings(self):
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            f = furl.Furl('http://a.com/a%20b?c=d&e=f#g/h?i=j', strict=True)
+            assert not caught
+
+            f = furl.Furl('http://a.com/a b/c?d=e f&g=h#i j?k=l m', strict=True)
+            assert len(caught) == 4
+            assert all(w.category is UserWarning for w in caught)
+            assert str(caught[0].message) == (
+                "Improperly encoded path string received: '/a b/c'. "
+                "Proceeding, but did you mean '/a%20b/c'?")
+            assert str(caught[1].message) == (
+                "Improperly encoded query string received: 'd=e f&g=h'. "
+                "Proceeding, but did you mean 'd=e+f&g=h'?")
+            assert str(f) == 'http://a.com/a%20b/c?d=e+f&g=h#i%20j?k=l+m'
+
+    def test_false_values_disable_strict_mode(self):
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            for strict in [False, None, 0, '']:
+                furl.Furl('http://a.com/a b?c=d e', strict=strict)
+            assert not caught
+
+            furl.Furl('http://a.com/a b?c=d e', strict=1)
+            assert len(caught) == 2
+        assert furl.is_strict([]) and furl.is_strict(True)
+        assert not furl.is_strict(None) and not furl.is_strict(False)
+
+    def test_warnings_point_at_the_caller(self):
+        # Violations are reported at different depths inside furl, but their
+        # warnings are all attributed to the code that called furl.
+        filename = os.path.splitext(__file__)[0] + '.py'
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            f = furl.Furl('http://a.com/a b?c=d e', strict=True)
+            f.path.add('f g')
+            f.query.add('h=i j')
+            f.load('http://a.com/k l')
+            furl.Path('m n', strict=True)
+        assert len(caught) == 6
+        for warning in caught:
+            assert os.path.splitext(warning.filename)[0] + '.py' == filename, (
+                warning.filename)
+
+    def test_ignored_warnings_are_not_formatted(self):
+        suggested = []
+        violation = furl.StrictViolation('path', 'a b', lambda: suggested.append(1))
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('ignore')
+            furl.report_violation(True, violation)
+        assert not caught and not suggested
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            furl.report_violation(True, violation)
+        assert len(caught) == 1 and suggested == [1]
+
+    def test_collect_violations(self):
+        violations = []
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            f = furl.Furl('http://a.com/a b?c=d e', strict=violations)
+            f.path.add('f g')
+            f.query.add('h=i j')
+            assert not caught
+
+        assert [(v.component, v.value) for v in violations] == [
+            ('path', '/a b'), ('query', 'c=d e'), ('path', 'f g'), ('query', 'h=i j')]
+        assert violations[0].suggestion == '/a%20b'
+        assert violations[1].suggestion == 'c=d+e'
+        assert 'did you mean' in str(violations[0])
@@ -0,0 +1,77 @@
+#
+# furl - URL manipulation made simple.
+#
+# Arthur Grunseid
+# grunseid.com
+# grunseid@gmail.com
+#
+# License: Build Amazing Things (Unlicense)
+
+import hashlib
+import unittest
+
+import furl
+
+
+class TestFingerprint(unittest.TestCase):
+    def test_stable(self):
+        # Fingerprints must never change between releases, processes, or
+        # platforms. Stored fingerprints depend on it.
+        url = 'http://www.google.com/a/b?c=d#e'
+        assert furl.fingerprint(url) == 0xceb9fedb5ba0ab74
+        assert furl.fingerprint(url, seed=1) == 0x8837bf8a349b5a4f
+
+    def test_canonical_urls_collide(self):
+        urls = ['HTTP://WWW.Google.com:80/a/./b?c=d#e', 'http://www.google.com/a/b?c=d#e',
+                furl.Furl('http://www.google.com/x/../a/b?c=d#e')]
+        fingerprints = set(furl.fingerprint(url) for url in urls)
+        assert len(fingerprints) == 1
+        assert furl.Furl(urls[0]).fingerprint() in fingerprints
+
+        assert furl.fingerprint('http://a.com/b') != furl.fingerprint('http://a.com/c')
+        assert furl.fingerprint('http://a.com/?ab=c') != furl.fingerprint('http://a.com/?a=bc')
+
+    def test_seed_and_bits(self):
+        url = 'http://www.google.com/'
+        assert furl.fingerprint(url, seed=1) != furl.fingerprint(url, seed=2)
+        assert furl.fingerprint(url) < 2 ** 64
+        assert furl.fingerprint(url, bits=128) >> 64 == furl.fingerprint(url)
+        self.assertRaises(ValueError, furl.fingerprint, url, bits=32)
+
+        profile = furl.CanonicalProfile(drop_fragment=True)
+        assert (furl.fingerprint('http://a.com/#b', profile=profile) ==
+                furl.fingerprint('http://a.com/', profile=profile))
+
+    def test_furl_cache(self):
+        f = furl.Furl('http://www.google.com/a/b?c=d#e')
+        fp = f.fingerprint()
+        assert fp == furl.fingerprint(str(f)) and f.fingerprint() == fp
+        assert f.fingerprint(seed=5) == furl.fingerprint(f, seed=5)
+        assert f.fingerprint(bits=128) == furl.fingerprint(f, bits=128)
+
+        # Any change to the URL invalidates the cached fingerprint.
+        changes = [lambda f: f.path.segments.append('x'),
+                   lambda f: f.args.add('c', 'e'),
+                   lambda f: setattr(f, 'host', 'yahoo.com'),
+                   lambda f: setattr(f, 'port', 99),
+                   lambda f: f.fragment.args.add('f', 'g'),
+                   lambda f: f.set(scheme='https'),
+                   lambda f: setattr(f, 'username', 'user'),
+                   lambda f: setattr(f, 'password', 'pass'),
+                   lambda f: f.load('http://bing.com/'),
+                   lambda f: f.args.__setitem__('q', 'r'),
+                   lambda f: f.args.__setitem__('q', 's'),
+                   lambda f: f.fragment.path.segments.append('h')]
+        for change in changes:
+            before = f.fingerprint()
+            change(f)
+            assert f.fingerprint() != before
+            assert f.fingerprint() == furl.fingerprint(str(f))
+
+    def test_hash_components(self):
+        hc = furl.hash_components
+        assert hc(['ab', 'c']) != hc(['a', 'bc'])
+        assert hc([]) == hc(()) != hc([''])
+        digest = hashlib.md5('\0' * 8).digest()
+        assert hc([], bits=128) == int(digest[7::-1].encode('hex') +
+                                       digest[:7:-1].encode('hex'), 16)
@@ -0,0 +1,62 @@
+#
+# furl - URL manipulation made simple.
+#
+# Arthur Grunseid
+# grunseid.com
+# grunseid@gmail.com
+#
+# License: Build Amazing Things (Unlicense)
+
+import unittest
+
+import furl
+from furl import idn
+
+
+class TestIDN(unittest.TestCase):
+    def test_host_to_ascii(self):
+        assert furl.host_to_ascii(None) is None
+        assert furl.host_to_ascii('www.google.com') == 'www.google.com'
+        assert furl.host_to_ascii(u'b\xfccher.example') == 'xn--bcher-kva.example'
+        assert furl.host_to_ascii(
+            u'www.b\xfccher.example.'.encode('utf-8')) == 'www.xn--bcher-kva.example.'
+        assert furl.host_to_ascii(
+            u'\u043f\u0440\u0430\u0432\u0438\u0442\u0435\u043b\u044c\u0441'
+            u'\u0442\u0432\u043e.\u0440\u0444') == 'xn--80aealotwbjpid2k.xn--p1ai'
+        # Ideographic full stops separate labels too.
+        assert furl.host_to_ascii(u'b\xfccher\u3002example') == 'xn--bcher-kva.example'
+
+        for host in [u'a..b\xfc', u'\xfc' * 64 + u'.com', u'.b\xfc']:
+            self.assertRaises(ValueError, furl.host_to_ascii, host)
+
+    def test_host_to_unicode(self):
+        assert furl.host_to_unicode(None) is None
+        assert furl.host_to_unicode('www.google.com') == 'www.google.com'
+        assert furl.host_to_unicode(
+            'www.XN--bcher-kva.example') == u'www.b\xfccher.example'.encode('utf-8')
+        assert furl.host_to_unicode('xn--p1ai') == u'\u0440\u0444'.encode('utf-8')
+        self.assertRaises(ValueError, furl.host_to_unicode, 'xn--zz.com')
+
+    def test_cache(self):
+        cache_size = idn.CACHE_SIZE
+        try:
+            idn.CACHE_SIZE = 2
+            for host in [u'a\xfc', u'b\xfc', u'c\xfc']:
+                furl.host_to_ascii(host)
+                assert len(idn._ascii_cache) <= 2
+            assert furl.host_to_ascii(u'c\xfc') is furl.host_to_ascii(u'c\xfc')
+        finally:
+            idn.CACHE_SIZE = cache_size
+
+    def test_furl(self):
+        f = furl.Furl(u'http://www.B\xfccher.example:8080/a')
+        assert f.host_ascii == 'www.xn--bcher-kva.example'
+        assert f.host_unicode == u'www.b\xfccher.example'.encode('utf-8')
+
+        f = furl.Furl('http://www.xn--bcher-kva.example/')
+        assert f.host_ascii == 'www.xn--bcher-kva.example'
+        assert f.host_unicode == u'www.b\xfccher.example'.encode('utf-8')
+
+        f = furl.Furl('/relative/path')
+        assert f.host_ascii is None and f.host_unicode is None
+        assert furl.Furl('http://[::1]/').host_ascii == '[::1]'
@@ -0,0 +1,93 @@
+#
+# furl - URL manipulation made simple.
+#
+# Arthur Grunseid
+# grunseid.com
+# grunseid@gmail.com
+#
+# License: Build Amazing Things (Unlicense)
+
+import random
+import unittest
+
+import furl
+
+
+class TestSortKey(unittest.TestCase):
+    def test_order(self):
+        urls = [
+            'http://1.2.3.4/', 'http://[::1]/', 'http://google.com/',
+            'http://google.com/a', 'http://google.com/a/b', 'http://google.com/a-b',
+            'http://google.com:8080/', 'http://a.google.com/', 'http://www.google.com/',
+            'http://googles.com/', 'http://google.org/',
+        ]
+        shuffled = list(urls)
+        random.Random(0).shuffle(shuffled)
+        assert sorted(shuffled, key=furl.sort_key) == urls
+
+    def test_strings_and_furls(self):
+        for url in ['http://WWW.Google.com./a/b?c=d#e', 'https://google.com:99/',
+                    '/relative/path', 'http://[::1]:99/a%20b']:
+            assert furl.sort_key(url) == furl.Furl(url).sort_key()
+        assert furl.sort_key('http://google.com/') == furl.sort_key(
+            'http://google.com:80/?a=b#c')
+        assert furl.sort_key('http://google.com/') != furl.sort_key(
+            'https://google.com/')
+
+
+class TestURLIndex(unittest.TestCase):
+    def setUp(self):
+        self.urls = [
+            'http://google.com/', 'http://google.com/docs', 'http://google.com:8080/',
+            'http://api.google.com/docs', 'http://www.google.com/',
+            'http://www.google.com/docs/', 'http://www.google.com/docs/a/b',
+            'http://www.google.com/docs-x', 'http://www.google.com:81/docs/x',
+            'http://googles.com/docs', 'http://google.org/docs',
+        ]
+        shuffled = list(self.urls)
+        random.Random(0).shuffle(shuffled)
+        self.index = furl.URLIndex(shuffled[:5])
+        self.index.update(shuffled[5:])
+
+    def test_iteration(self):
+        assert len(self.index) == len(self.urls)
+        assert sorted(self.index, key=furl.sort_key) == list(self.index)
+        assert set(self.index) == set(self.urls)
+
+    def test_scan_hosts(self):
+        assert self.index.scan('google.com') == [
+            'http://google.com/', 'http://google.com/docs', 'http://google.com:8080/']
+        assert self.index.scan('*.google.com') == [
+            'http://api.google.com/docs', 'http://www.google.com/',
+            'http://www.google.com/docs/', 'http://www.google.com/docs/a/b',
+            'http://www.google.com/docs-x', 'http://www.google.com:81/docs/x']
+        assert self.index.scan('bing.com') == []
+        assert len(self.index.scan()) == len(self.urls)
+
+    def test_scan_paths(self):
+        assert self.index.scan('*.google.com', '/docs/') == [
+            'http://api.google.com/docs', 'http://www.google.com/docs/',
+            'http://www.google.com/docs/a/b', 'http://www.google.com:81/docs/x']
+        assert self.index.scan('www.google.com', '/docs/a') == [
+            'http://www.google.com/docs/a/b']
+        assert self.index.scan('*', '/docs') == [
+            'http://google.com/docs', 'http://api.google.com/docs',
+            'http://www.google.com/docs/', 'http://www.google.com/docs/a/b',
+            'http://www.google.com:81/docs/x', 'http://googles.com/docs',
+            'http://google.org/docs']
+        assert self.index.scan('google.com', '/') == self.index.scan('google.com')
+
+        # Path segments can start with any byte once decoded, even '\xff'.
+        index = furl.URLIndex(['http://a.com/%FF', 'http://a.com/docs/x',
+                               'http://a.com:65535/%FF', 'http://b.com/'])
+        assert index.scan('a.com', '/docs') == ['http://a.com/docs/x']
+        assert index.scan('a.com', '/') == [
+            'http://a.com/docs/x', 'http://a.com/%FF', 'http://a.com:65535/%FF']
+        assert index.scan('*', '/%FF') == [
+            'http://a.com/%FF', 'http://a.com:65535/%FF']
+
+    def test_add(self):
+        f = furl.Furl('http://x.google.com/docs/y')
+        self.index.add(f)
+        assert self.index.scan('*.google.com', 'docs')[-1] is f
+        self.assertRaises(ValueError, self.index.add, 'http://[::1/')
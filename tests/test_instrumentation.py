@@ -0,0 +1,161 @@
+#
+# furl - URL manipulation made simple.
+#
+# Arthur Grunseid
+# grunseid.com
+# grunseid@gmail.com
+#
+# License: Build Amazing Things (Unlicense)
+
+import unittest
+import warnings
+
+import furl
+
+
+class TestInstrumentation(unittest.TestCase):
+    def setUp(self):
+        furl.reset_stats()
+
+    def tearDown(self):
+        furl.disable_instrumentation()
+        furl.reset_stats()
+
+    def test_disabled(self):
+        load = furl.Furl.__dict__['load']
+        furl.Furl('http://www.google.com/a?b=c#d')
+        assert furl.stats() == {'enabled': False, 'operations': {}, 'caches': {}}
+
+        furl.enable_instrumentation()
+        assert furl.instrumentation_enabled()
+        assert furl.Furl.__dict__['load'] is not load
+        furl.disable_instrumentation()
+        assert not furl.instrumentation_enabled()
+        assert furl.Furl.__dict__['load'] is load
+        assert furl.path.urllib is furl.instrumentation.urllib
+
+    def test_operations(self):
+        furl.enable_instrumentation()
+        furl.enable_instrumentation() # Enabling twice is harmless.
+        f = furl.Furl('http://www.google.com/a%20b?c=d#e')
+        assert str(f) == 'http://www.google.com/a%20b?c=d#e'
+
+        operations = furl.stats()['operations']
+        for operation in ['Furl.load', 'Path.load', 'Query.load', 'Fragment.load',
+                          'Furl.__str__', 'Path.__str__', 'Query.__str__',
+                          'Fragment.__str__', 'urllib.quote', 'urllib.unquote']:
+            assert operations[operation]['calls'] >= 1
+            assert operations[operation]['seconds'] >= 0
+        assert operations['Furl.load']['calls'] == 1
+        assert operations['Furl.__str__']['calls'] == 1
+        assert (operations['Furl.load']['seconds'] >=
+                operations['Path.load']['seconds'])
+
+        furl.disable_instrumentation()
+        str(f)
+        assert furl.stats()['operations'] == operations
+        furl.reset_stats()
+        assert furl.stats()['operations'] == {}
+
+    def test_caches(self):
+        furl.enable_instrumentation()
+        f = furl.Furl('http://www.google.com/')
+        value = f.fingerprint()
+        assert f.fingerprint() == value
+        assert f.fingerprint() == value
+        f.path = 'changed'
+        f.fingerprint()
+        assert furl.stats()['caches'] == {
+            'Furl.fingerprint': {'hits': 2, 'misses': 2}}
+
+    def test_property_and_keyed_caches(self):
+        host_to_ascii = furl.idn.host_to_ascii
+        furl.enable_instrumentation()
+        f = furl.Furl(u'http://www.b\xfccher-instrumented.example/')
+        f.origin, f.origin
+        f.packed_ip, f.is_private
+        f.host_ascii, f.host_ascii, furl.Furl('/').host_ascii
+        f.host_unicode
+        f.registered_domain, f.subdomain
+
+        qf = furl.QueryFilter(deny=['utm_*'])
+        qf.apply('a=1&utm_source=2&a=3')
+
+        caches = furl.stats()['caches']
+        assert caches['Furl.origin'] == {'hits': 1, 'misses': 1}
+        assert caches['Furl.packed_ip'] == {'hits': 1, 'misses': 1}
+        assert caches['idn.host_to_ascii'] == {'hits': 1, 'misses': 1}
+        assert caches['idn.host_to_unicode'] == {'hits': 0, 'misses': 1}
+        assert caches['QueryFilter.keeps'] == {'hits': 1, 'misses': 2}
+        assert caches['PublicSuffixList.split']['hits'] >= 1
+
+        furl.disable_instrumentation()
+        assert isinstance(furl.Furl.__dict__['origin'], property)
+        assert furl.Furl('http://a.com/').origin == ('http', 'a.com', 80)
+        assert furl.idn.host_to_ascii is host_to_ascii
+
+    def test_hooks(self):
+        events = []
+        hook = lambda operation, seconds: events.append((operation, seconds))
+        furl.add_hook(hook)
+        try:
+            furl.Furl('http://www.google.com/')
+            assert events == []
+
+            furl.enable_instrumentation()
+            f = furl.Furl('http://www.google.com/')
+            f.fingerprint()
+            f.fingerprint()
+            operations = [operation for operation, _ in events]
+            assert 'Furl.load' in operations and 'Path.load' in operations
+            assert ('Furl.fingerprint miss', None) in events
+            assert events[-1] == ('Furl.fingerprint hit', None)
+        finally:
+            furl.remove_hook(hook)
+
+
+class TestImplicitSerializations(unittest.TestCase):
+    def setUp(self):
+        furl.reset_implicit_serializations()
+
+    def tearDown(self):
+        furl.stop_detecting_implicit_serializations()
+        furl.reset_implicit_serializations()
+
+    def test_detection(self):
+        f = furl.Furl('http://www.google.com/a?b=c')
+        f.startswith('http')
+        assert furl.implicit_serializations() == []
+
+        eq = furl.StringLikeObject.__dict__['__eq__']
+        furl.detect_implicit_serializations()
+        assert furl.StringLikeObject.__dict__['__eq__'] is not eq
+        for _ in range(3):
+            f.startswith('http')
+        len(f.query)
+        f != 'http://www.google.com/' # __ne__() calls __eq__().
+        str(f) # Explicit serializations aren't recorded.
+
+        sites = furl.implicit_serializations()
+        assert sites[0]['method'] == '__getattr__'
+        assert sorted((s['method'], s['type'], s['count']) for s in sites) == [
+            ('__eq__', 'Furl', 1), ('__getattr__', 'Furl', 3), ('__len__', 'Query', 1)]
+        for site in sites:
+            assert site['file'] == __file__.rstrip('c')
+            assert site['function'] == 'test_detection'
+
+        furl.stop_detecting_implicit_serializations()
+        assert furl.StringLikeObject.__dict__['__eq__'] is eq
+        f.startswith('http')
+        assert sites[0]['count'] == 3
+        assert furl.implicit_serializations()[0]['count'] == 3
+
+    def test_threshold(self):
+        f = furl.Furl('http://www.google.com/')
+        furl.detect_implicit_serializations(threshold=2)
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            for _ in range(3):
+                f.endswith('/')
+        assert len(caught) == 1
+        assert issubclass(caught[0].category, furl.ImplicitSerializationWarning)
@@ -0,0 +1,59 @@
+#
+# furl - URL manipulation made simple.
+#
+# Arthur Grunseid
+# grunseid.com
+# grunseid@gmail.com
+#
+# License: Build Amazing Things (Unlicense)
+
+import unittest
+
+import furl
+
+
+class TestInterning(unittest.TestCase):
+    def tearDown(self):
+        furl.disable_interning()
+        furl.reset_interning_stats()
+
+    def test_disabled(self):
+        f = furl.Furl('http://www.google.com/path/seg?key=value')
+        g = furl.Furl('http://www.google.com/path/seg?key=value')
+        assert f.host == g.host and f.host is not g.host
+        assert not furl.interning_enabled()
+        assert furl.interning_stats()['lookups'] == 0
+
+    def test_shared_components(self):
+        furl.enable_interning()
+        assert furl.interning_enabled()
+        url = 'HTTP://www.google.com/path/seg%20ment?key=value1&other=value2#frag/ment?k=v'
+        f, g = furl.Furl(url), furl.Furl(url)
+        assert f.scheme is g.scheme
+        assert f.host is g.host
+        for a, b in zip(f.path.segments, g.path.segments):
+            assert a is b
+        for (a, _), (b, _) in zip(f.query.params.allitems(),
+                                  g.query.params.allitems()):
+            assert a is b
+        assert f.fragment.path.segments[0] is g.fragment.path.segments[0]
+        assert f.query.params['key'] is not g.query.params['key']
+        assert str(f) == str(g) == str(furl.Furl(url))
+
+        stats = furl.interning_stats()
+        assert stats['enabled'] and stats['hits'] > 0
+        assert stats['bytes_saved'] > 0 and stats['distinct'] > 0
+
+    def test_bounded(self):
+        furl.enable_interning(max_size=2)
+        for i in range(10):
+            furl.Furl('http://host%d.com/' % i)
+        assert furl.interning_stats()['distinct'] == 2
+
+        furl.disable_interning()
+        stats = furl.interning_stats()
+        assert not stats['enabled'] and stats['distinct'] == 0
+        assert stats['lookups'] > 0
+        furl.reset_interning_stats()
+        assert furl.interning_stats()['lookups'] == 0
+        self.assertRaises(ValueError, furl.enable_interning, 0)
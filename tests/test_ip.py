@@ -0,0 +1,91 @@
+#
+# furl - URL manipulation made simple.
+#
+# Arthur Grunseid
+# grunseid.com
+# grunseid@gmail.com
+#
+# License: Build Amazing Things (Unlicense)
+
+import unittest
+
+import furl
+
+
+class TestPackIP(unittest.TestCase):
+    def test_pack_ip(self):
+        assert furl.pack_ip('127.0.0.1') == '\x7f\x00\x00\x01'
+        assert furl.pack_ip('[::1]') == furl.pack_ip('::1') == '\x00' * 15 + '\x01'
+        assert furl.pack_ip('[FE80::1%25eth0]') == '\xfe\x80' + '\x00' * 13 + '\x01'
+        for host in [None, '', 'www.google.com', '1.2.3.256', '[::1', '[::g]',
+                     'localhost', '[]', '.', '1.2.3.4.5', '1..2', '08.0.0.1',
+                     '4294967296', '127.0.0.1 x', '0x7f.g', '1.com']:
+            assert furl.pack_ip(host) is None, host
+
+    def test_legacy_ipv4(self):
+        # Forms that inet_aton(), and so the system resolver, connect to.
+        for host in ['127.1', '127.0.1', '2130706433', '0x7f000001', '0X7F.1',
+                     '0177.0.0.1', '0x7f.0.0.01', '127.0.0.1.', '127.1.']:
+            assert furl.pack_ip(host) == '\x7f\x00\x00\x01', host
+        assert furl.pack_ip('1.2.3') == '\x01\x02\x00\x03'
+
+
+class TestIPNetworkSet(unittest.TestCase):
+    def test_membership(self):
+        networks = furl.IPNetworkSet(
+            ['10.0.0.0/8', '10.5.0.0/16', '192.168.1.1', '172.16.0.1/12', 'fc00::/7'])
+        assert len(networks) == 5
+        for address in ['10.0.0.0', '10.255.255.255', '192.168.1.1', '172.31.0.0',
+                        'fd00::1', '[fc00::]', '::ffff:10.0.0.1']:
+            assert address in networks, address
+        for address in ['9.255.255.255', '11.0.0.0', '192.168.1.2', '172.32.0.0',
+                        'fe00::', '::10.0.0.1', 'www.google.com', '']:
+            assert address not in networks, address
+
+        assert furl.Furl('http://[fd00::1]:99/') in networks
+        assert furl.Furl('http://10.1.2.3/') in networks
+        assert furl.Furl('http://www.google.com/') not in networks
+
+        assert '1.2.3.4' not in furl.IPNetworkSet()
+        assert '1.2.3.4' in furl.IPNetworkSet(['0.0.0.0/0'])
+        assert '::1' not in furl.IPNetworkSet(['0.0.0.0/0'])
+
+    def test_invalid(self):
+        for network in ['www.google.com', '10.0.0.0/33', '::/129', '10.0.0.0/a',
+                        '10.0.0.0/-8']:
+            self.assertRaises(ValueError, furl.IPNetworkSet, [network])
+
+
+class TestFurlIP(unittest.TestCase):
+    def test_classification(self):
+        cases = [
+            # URL, ip_version, is_private, is_loopback.
+            ('http://127.0.0.1/', 4, True, True),
+            ('http://10.1.2.3:8080/', 4, True, False),
+            ('http://8.8.8.8/', 4, False, False),
+            ('http://[::1]/', 6, True, True),
+            ('http://[fd00::1]/', 6, True, False),
+            ('http://[::ffff:127.0.0.1]/', 6, True, True),
+            ('http://[2001:4860::8888]/', 6, False, False),
+            ('http://www.google.com/', None, False, False),
+            ('http://127.1/', 4, True, True),
+            ('http://2130706433/', 4, True, True),
+            ('http://0x7f000001/', 4, True, True),
+            ('http://127.0.0.1./', 4, True, True),
+            ('http://0xa.1/', 4, True, False),
+            ('/relative', None, False, False),
+        ]
+        for url, version, private, loopback in cases:
+            f = furl.Furl(url)
+            assert f.is_ip == (version is not None), url
+            assert f.ip_version == version, url
+            assert f.is_private == private, url
+            assert f.is_loopback == loopback, url
+
+    def test_cache(self):
+        f = furl.Furl('http://127.0.0.1/')
+        assert f.packed_ip is f.packed_ip
+        f.host = '8.8.8.8'
+        assert f.packed_ip == '\x08\x08\x08\x08' and not f.is_private
+        f.load('http://www.google.com/')
+        assert f.packed_ip is None and not f.is_ip
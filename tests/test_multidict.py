@@ -168,3 +168,12 @@ class TestOmdict1D(unittest.TestCase):
         assert omd.getlist(_unique) == [1, 2, 3]
         omd[_unique] = []
         assert _unique not in omd
+
+    def test_snapshot(self):
+        omd = OneDimensionalOrderedMultidict()
+        assert omd.snapshot() == ()
+        omd.add(1, [1, 11]).add(2, 2).add(1, 111)
+        assert omd.snapshot() == ((1, 1), (1, 11), (2, 2), (1, 111))
+        omd[1] = [3]
+        assert omd.snapshot() == ((1, 3), (2, 2))
+        assert omd.snapshot() == tuple(omd.allitems())
@@ -0,0 +1,66 @@
+#
+# furl - URL manipulation made simple.
+#
+# Arthur Grunseid
+# grunseid.com
+# grunseid@gmail.com
+#
+# License: Build Amazing Things (Unlicense)
+
+import unittest
+
+import furl
+
+
+class TestPatternSet(unittest.TestCase):
+    def test_hosts(self):
+        patterns = furl.PatternSet(
+            ['google.com', '*.google.com', 'www.*.com', '*', 'bing.com'])
+        assert patterns.match('http://google.com/') == ['google.com', '*']
+        assert patterns.match('http://WWW.Google.com/') == [
+            '*.google.com', 'www.*.com', '*']
+        assert patterns.match('http://a.b.google.com/') == ['*.google.com', '*']
+        assert patterns.match('http://www.bing.com/') == ['www.*.com', '*']
+        assert patterns.match('http://notgoogle.com/') == ['*']
+        assert patterns.match('/relative/path') == []
+        assert len(patterns) == 5
+
+    def test_paths(self):
+        patterns = furl.PatternSet(
+            ['a.com/blog/*', 'a.com/blog', 'a.com/*/b', 'a.com/c*', 'a.com/a%20b'])
+        assert patterns.match('http://a.com/blog') == ['a.com/blog/*', 'a.com/blog']
+        assert patterns.match('http://a.com/blog/x/b') == ['a.com/blog/*']
+        assert patterns.match('http://a.com/blog/b') == ['a.com/blog/*', 'a.com/*/b']
+        assert patterns.match('http://a.com/cat') == ['a.com/c*']
+        assert patterns.match('http://a.com/cat/') == []
+        assert patterns.match('http://a.com/a b') == ['a.com/a%20b']
+
+    def test_schemes_ports_and_queries(self):
+        patterns = furl.PatternSet([
+            'https://a.com', '*://a.com:8080', 'a.com:80', 'a.com?utm_*',
+            'a.com/?q=a+b&r', 'a.com/?s=x*',
+        ])
+        assert patterns.match('HTTPS://a.com/') == ['https://a.com']
+        assert patterns.match('ftp://a.com:8080/') == ['*://a.com:8080']
+        assert patterns.match('http://a.com/') == ['a.com:80']
+        assert patterns.match('http://a.com:81/?utm_source=x') == ['a.com?utm_*']
+        assert patterns.match('http://a.com:81/?q=a%20b&r=') == ['a.com/?q=a+b&r']
+        assert patterns.match('http://a.com:81/?q=a%20b') == []
+        assert patterns.match('http://a.com:81/?s=xyz') == ['a.com/?s=x*']
+        assert patterns.match('http://a.com:81/?s=yz') == []
+
+    def test_furls_and_many(self):
+        patterns = furl.PatternSet(['*.google.com/blog/*?utm_*'])
+        patterns.add('google.com')
+        f = furl.Furl('http://www.google.com/blog/a?utm_source=x')
+        assert patterns.match(f) == ['*.google.com/blog/*?utm_*']
+        assert patterns.match_many([f, 'http://google.com', 'http://bing.com']) == [
+            ['*.google.com/blog/*?utm_*'], ['google.com'], []]
+        assert patterns.patterns == ['*.google.com/blog/*?utm_*', 'google.com']
+
+    def test_invalid(self):
+        patterns = furl.PatternSet()
+        self.assertRaises(ValueError, patterns.add, '/a/b')
+        self.assertRaises(ValueError, patterns.add, 'http://:80/')
+        self.assertRaises(ValueError, patterns.add, 'a.com:x')
+        self.assertRaises(ValueError, patterns.match, 'http://[::1/')
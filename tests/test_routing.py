@@ -0,0 +1,82 @@
+#
+# furl - URL manipulation made simple.
+#
+# Arthur Grunseid
+# grunseid.com
+# grunseid@gmail.com
+#
+# License: Build Amazing Things (Unlicense)
+
+import unittest
+
+import furl
+
+
+class TestRouter(unittest.TestCase):
+    def setUp(self):
+        self.router = furl.Router([
+            ('/', 'root'),
+            ('/users/{name}', 'user'),
+            ('/users/me/orders/{oid}', 'my order'),
+            ('/users/{id:\d+}/orders/{oid}', 'order'),
+            ('/users/{name}/orders/{oid:[a-z]+}', 'named order'),
+            ('/static/{file*}', 'static'),
+            ('/a/*', 'a'),
+            ('/a/b/c', 'abc'),
+        ])
+
+    def test_match(self):
+        match = self.router.match
+        assert match('/') == ('root', {})
+        assert match('/users/bob') == ('user', {'name': 'bob'})
+        assert match('/users/7/orders/a1') == ('order', {'id': '7', 'oid': 'a1'})
+        assert match('/users/bob/orders/x') == (
+            'named order', {'name': 'bob', 'oid': 'x'})
+        assert match('/static/css/a.css') == (
+            'static', {'file': ['css', 'a.css']})
+        assert match('/static') == ('static', {'file': []})
+        assert match('/a/b/c') == ('abc', {})
+        assert match('/a/b/c/d') == ('a', {})
+
+        assert match('') is None
+        assert match('/users') is None
+        assert match('/users/bob/') is None
+        assert match('/users/bob/orders/1') is None
+
+    def test_precedence(self):
+        match = self.router.match
+        # Literal segments before parameters, parameters with regular
+        # expressions before parameters without.
+        assert match('/users/me/orders/x') == ('my order', {'oid': 'x'})
+        assert match('/users/7/orders/x') == ('order', {'id': '7', 'oid': 'x'})
+        # Backtracks out of the literal 'me' branch.
+        assert match('/users/me/orders/x/y') is None
+        self.router.add('/users/{name}/{page*}', 'user page')
+        assert match('/users/me/orders/x/y') == (
+            'user page', {'name': 'me', 'page': ['orders', 'x', 'y']})
+
+    def test_paths(self):
+        match = self.router.match
+        assert match('/users/a%20b') == ('user', {'name': 'a b'})
+        assert match('/users/a%2Fb') == ('user', {'name': 'a/b'})
+        assert match(u'/users/\xe9') == ('user', {'name': '\xc3\xa9'})
+        assert match(['users', 'bob']) == ('user', {'name': 'bob'})
+        assert match(furl.Path('/users/a%20b')) == ('user', {'name': 'a b'})
+        f = furl.Furl('http://www.google.com/users/7/orders/1a?b=c')
+        assert match(f) == ('order', {'id': '7', 'oid': '1a'})
+        assert match(furl.Furl('http://www.google.com')) is None
+
+    def test_add(self):
+        router = furl.Router()
+        assert router.add('/a%20b/{c}', 1) is router
+        assert router.match('/a b/x') == (1, {'c': 'x'})
+        assert router.routes == [('/a%20b/{c}', 1)]
+
+        self.assertRaises(ValueError, router.add, '/a%20b/{c}', 2)
+        self.assertRaises(ValueError, router.add, '/a/*/b', 2)
+        self.assertRaises(ValueError, router.add, '/a/{b:(}', 2)
+        router.add('/a/*', 2)
+        self.assertRaises(ValueError, router.add, '/a/{rest*}', 3)
+        # Parameters with the same name and regular expression share a branch.
+        router.add('/d/{e:\d+}/f', 4).add('/d/{e:\d+}/g', 5)
+        assert router.match('/d/1/g') == (5, {'e': '1'})
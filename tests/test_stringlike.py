@@ -1,5 +1,6 @@
 # coding=utf-8
 """Test StringLike base and subclasses"""
+import abc
 import unittest
 
 import furl
@@ -30,12 +31,15 @@ class StringLikeObjectTestCase(unittest.TestCase):
             raise AssertionError()
 
     def test_enforces_itself_as_abstract_base_class(self):
-        self._assert_raises(lambda: furl.StringLikeObject())
+        # Abstract methods are enforced when a subclass is defined, not when it's
+        # instantiated.
+        self._assert_raises(lambda: str(furl.StringLikeObject()))
 
-        class TestClass(furl.StringLikeObject):
-            pass
-
-        self._assert_raises(lambda: TestClass())
+        def define_class():
+            class TestClass(furl.StringLikeObject):
+                def load(self, value):
+                    pass
+        self.assertRaises(TypeError, define_class)
 
         class TestClassTwo(furl.StringLikeObject):
             def __str__(self):
@@ -46,6 +50,25 @@ class StringLikeObjectTestCase(unittest.TestCase):
 
         self._assert_raises(lambda: str(TestClassTwo()))
 
+    def test_no_abc_overhead(self):
+        for cls in [furl.Furl, furl.Path, furl.Query, furl.Fragment]:
+            assert not isinstance(cls, abc.ABCMeta)
+
+        def define_interface():
+            class Interface(furl.StringLikeObject):
+                __abstract__ = True
+
+                @abc.abstractmethod
+                def method(self):
+                    pass
+            return Interface
+        Interface = define_interface()
+
+        def define_class():
+            class TestClass(Interface, StringLikeObjectTestClass):
+                pass
+        self.assertRaises(TypeError, define_class)
+
     def test_nonzero(self):
         assert not bool(self._get_test_class(''))
         assert bool(self._get_test_class('nonempty'))
@@ -0,0 +1,140 @@
+#
+# furl - URL manipulation made simple.
+#
+# Arthur Grunseid
+# grunseid.com
+# grunseid@gmail.com
+#
+# License: Build Amazing Things (Unlicense)
+
+import os
+import tempfile
+import unittest
+import warnings
+
+import furl
+from furl import suffixes
+
+RULES = """
+// ===BEGIN ICANN DOMAINS===
+com
+uk
+co.uk
+jp
+*.kawasaki.jp
+!city.kawasaki.jp // Exception.
+
+// ===BEGIN PRIVATE DOMAINS===
+blogspot.com
+""".splitlines()
+
+
+class TestPublicSuffixList(unittest.TestCase):
+    def test_split(self):
+        split = furl.PublicSuffixList(RULES).split
+        assert split('www.bbc.co.uk') == ('www', 'bbc.co.uk', 'co.uk')
+        assert split('a.b.bbc.co.uk') == ('a.b', 'bbc.co.uk', 'co.uk')
+        assert split('bbc.co.uk') == (None, 'bbc.co.uk', 'co.uk')
+        assert split('co.uk') == (None, None, 'co.uk')
+        assert split('WWW.Google.COM.') == ('www', 'google.com', 'com')
+        assert split('a.blogspot.com') == (None, 'a.blogspot.com', 'blogspot.com')
+        # Hosts no rule matches have their rightmost label as public suffix.
+        assert split('www.google.org') == ('www', 'google.org', 'org')
+        assert split('localhost') == (None, None, 'localhost')
+
+    def test_wildcards_and_exceptions(self):
+        split = furl.PublicSuffixList(RULES).split
+        assert split('a.b.kawasaki.jp') == (None, 'a.b.kawasaki.jp', 'b.kawasaki.jp')
+        assert split('b.kawasaki.jp') == (None, None, 'b.kawasaki.jp')
+        assert split('city.kawasaki.jp') == (None, 'city.kawasaki.jp', 'kawasaki.jp')
+        assert split('www.city.kawasaki.jp') == (
+            'www', 'city.kawasaki.jp', 'kawasaki.jp')
+
+    def test_no_domain(self):
+        split = furl.PublicSuffixList(RULES).split
+        for host in [None, '', '1.2.3.4', '[::1]', 'a..com']:
+            assert split(host) == (None, None, None)
+
+    def test_internationalized(self):
+        # Rules are written in unicode, like the list's '\u516c\u53f8.cn', or
+        # in ASCII, and match hosts in either form.
+        rules = ['cn', u'\u516c\u53f8.cn'.encode('utf-8'), 'xn--fiqs8s']
+        split = furl.PublicSuffixList(rules).split
+        assert split('www.a.xn--55qx5d.cn') == ('www', 'a.xn--55qx5d.cn',
+                                                'xn--55qx5d.cn')
+        assert split('a.XN--55QX5D.CN') == (None, 'a.xn--55qx5d.cn',
+                                            'xn--55qx5d.cn')
+        assert split(u'www.a.\u516c\u53f8.cn') == (
+            u'www', u'a.\u516c\u53f8.cn', u'\u516c\u53f8.cn')
+        assert split(u'a.\u516c\u53f8\u3002cn'.encode('utf-8')) == (
+            None, u'a.\u516c\u53f8.cn'.encode('utf-8'),
+            u'\u516c\u53f8.cn'.encode('utf-8'))
+        assert split(u'a.\u4e2d\u56fd') == (None, u'a.\u4e2d\u56fd', u'\u4e2d\u56fd')
+        assert split('a.xn--fiqs8s') == (None, 'a.xn--fiqs8s', 'xn--fiqs8s')
+        assert split('\xff.com') == (None, None, None)
+
+    def test_private_and_cache(self):
+        suffixes = furl.PublicSuffixList(RULES, private=False, cache_size=2)
+        assert suffixes.public_suffix('a.blogspot.com') == 'com'
+        assert suffixes.registered_domain('a.blogspot.com') == 'blogspot.com'
+        assert suffixes.subdomain('a.blogspot.com') == 'a'
+        suffixes.split('b.com')
+        assert len(suffixes._cache) == 2
+        suffixes.split('c.com')
+        assert len(suffixes._cache) == 1
+
+
+class TestFurlProperties(unittest.TestCase):
+    def setUp(self):
+        self.shared = suffixes._shared
+        fd, self.path = tempfile.mkstemp()
+        with os.fdopen(fd, 'w') as f:
+            f.write('\n'.join(RULES))
+
+    def tearDown(self):
+        suffixes._shared = self.shared
+        os.remove(self.path)
+
+    def test_properties(self):
+        loaded = furl.load_public_suffix_list(self.path)
+        assert furl.public_suffix_list() is loaded
+
+        f = furl.Furl('http://www.bbc.co.uk/news')
+        assert f.registered_domain == 'bbc.co.uk'
+        assert f.public_suffix == 'co.uk'
+        assert f.subdomain == 'www'
+
+        f.host = 'bbc.co.uk'
+        assert (f.subdomain, f.registered_domain, f.public_suffix) == (
+            None, 'bbc.co.uk', 'co.uk')
+        for url in ['/relative', 'http://127.0.0.1/']:
+            f = furl.Furl(url)
+            assert (f.subdomain, f.registered_domain, f.public_suffix) == (
+                None, None, None)
+
+    def test_shared_list(self):
+        suffixes._shared = None
+        os.environ['FURL_PUBLIC_SUFFIX_LIST'] = self.path
+        try:
+            shared = furl.public_suffix_list()
+        finally:
+            del os.environ['FURL_PUBLIC_SUFFIX_LIST']
+        assert furl.public_suffix_list() is shared
+        assert shared.split('a.b.kawasaki.jp')[2] == 'b.kawasaki.jp'
+
+    def test_missing_list(self):
+        suffixes._shared = None
+        paths = suffixes.PUBLIC_SUFFIX_LIST_PATHS
+        suffixes.PUBLIC_SUFFIX_LIST_PATHS = [self.path + '.missing']
+        try:
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter('always')
+                shared = furl.public_suffix_list()
+                furl.public_suffix_list()
+        finally:
+            suffixes.PUBLIC_SUFFIX_LIST_PATHS = paths
+        assert len(caught) == 1
+        assert caught[0].category is furl.MissingPublicSuffixListWarning
+        assert self.path + '.missing' in str(caught[0].message)
+        assert caught[0].filename.rstrip('c') == __file__.rstrip('c')
+        assert shared.split('www.bbc.co.uk') == ('www.bbc', 'co.uk', 'uk')
@@ -0,0 +1,110 @@
+# coding=utf-8
+#
+# furl - URL manipulation made simple.
+#
+# Arthur Grunseid
+# grunseid.com
+# grunseid@gmail.com
+#
+# License: Build Amazing Things (Unlicense)
+
+import unittest
+
+try:
+    from collections import OrderedDict  # Python 2.7+.
+except ImportError:
+    from ordereddict import OrderedDict  # Python 2.4-2.6.
+
+import furl
+
+
+# Variables and expansions from the examples in RFC 6570 section 3.2.
+VARIABLES = {
+    'count': ['one', 'two', 'three'],
+    'dom': ['example', 'com'],
+    'dub': 'me/too',
+    'hello': 'Hello World!',
+    'half': '50%',
+    'var': 'value',
+    'who': 'fred',
+    'base': 'http://example.com/home/',
+    'path': '/foo/bar',
+    'list': ['red', 'green', 'blue'],
+    'keys': OrderedDict([('semi', ';'), ('dot', '.'), ('comma', ',')]),
+    'v': '6',
+    'x': '1024',
+    'y': '768',
+    'empty': '',
+    'empty_keys': {},
+    'undef': None,
+}
+
+EXPANSIONS = [
+    # Level 1.
+    ('{var}', 'value'), ('{hello}', 'Hello%20World%21'), ('{half}', '50%25'),
+    ('O{empty}X', 'OX'), ('O{undef}X', 'OX'),
+    # Level 2.
+    ('{+var}', 'value'), ('{+hello}', 'Hello%20World!'), ('{+half}', '50%25'),
+    ('{base}index', 'http%3A%2F%2Fexample.com%2Fhome%2Findex'),
+    ('{+base}index', 'http://example.com/home/index'),
+    ('{+path}/here', '/foo/bar/here'), ('here?ref={+path}', 'here?ref=/foo/bar'),
+    ('X{#var}', 'X#value'), ('X{#hello}', 'X#Hello%20World!'),
+    # Level 3.
+    ('map?{x,y}', 'map?1024,768'), ('{x,hello,y}', '1024,Hello%20World%21,768'),
+    ('{+x,hello,y}', '1024,Hello%20World!,768'), ('{#x,hello,y}', '#1024,Hello%20World!,768'),
+    ('X{.var}', 'X.value'), ('X{.x,y}', 'X.1024.768'),
+    ('{/var}', '/value'), ('{/var,x}/here', '/value/1024/here'),
+    ('{;x,y}', ';x=1024;y=768'), ('{;x,y,empty}', ';x=1024;y=768;empty'),
+    ('{?x,y}', '?x=1024&y=768'), ('{?x,y,empty}', '?x=1024&y=768&empty='),
+    ('?fixed=yes{&x}', '?fixed=yes&x=1024'), ('{&x,y,empty}', '&x=1024&y=768&empty='),
+    # Level 4.
+    ('{var:3}', 'val'), ('{var:30}', 'value'), ('{list}', 'red,green,blue'),
+    ('{list*}', 'red,green,blue'), ('{keys}', 'semi,%3B,dot,.,comma,%2C'),
+    ('{keys*}', 'semi=%3B,dot=.,comma=%2C'), ('{+path:6}/here', '/foo/b/here'),
+    ('{+keys}', 'semi,;,dot,.,comma,,'), ('{+keys*}', 'semi=;,dot=.,comma=,'),
+    ('{#path:6}/here', '#/foo/b/here'), ('{#keys*}', '#semi=;,dot=.,comma=,'),
+    ('X{.list}', 'X.red,green,blue'), ('X{.list*}', 'X.red.green.blue'),
+    ('X{.keys*}', 'X.semi=%3B.dot=..comma=%2C'), ('{/list*,path:4}', '/red/green/blue/%2Ffoo'),
+    ('{/keys*}', '/semi=%3B/dot=./comma=%2C'), ('{;hello:5}', ';hello=Hello'),
+    ('{;list}', ';list=red,green,blue'), ('{;list*}', ';list=red;list=green;list=blue'),
+    ('{;keys*}', ';semi=%3B;dot=.;comma=%2C'), ('{?var:3}', '?var=val'),
+    ('{?list}', '?list=red,green,blue'), ('{?list*}', '?list=red&list=green&list=blue'),
+    ('{?keys}', '?keys=semi,%3B,dot,.,comma,%2C'), ('{?keys*}', '?semi=%3B&dot=.&comma=%2C'),
+    ('{&list*}', '&list=red&list=green&list=blue'), ('{?empty_keys}', ''),
+]
+
+
+class TestTemplate(unittest.TestCase):
+    def test_rfc_examples(self):
+        for template, expansion in EXPANSIONS:
+            assert furl.Template(template).expand(VARIABLES) == expansion
+
+    def test_expand(self):
+        t = furl.Template('https://api.example.com/users/{id}/items{?page,limit}')
+        assert t.variables == ['id', 'page', 'limit']
+        assert t.expand(id=7, page=2) == 'https://api.example.com/users/7/items?page=2'
+        assert t.expand({'id': 'a b', 'limit': 5}, id=u'é') == (
+            'https://api.example.com/users/%C3%A9/items?limit=5')
+        assert t.expand() == 'https://api.example.com/users//items'
+
+        f = t.expand_furl(id=7, page=2, limit=10)
+        assert isinstance(f, furl.Furl)
+        assert f.path.segments == ['users', '7', 'items']
+        assert f.args.allitems() == [('page', '2'), ('limit', '10')]
+
+    def test_literals(self):
+        # Literals are encoded once, when the template is compiled.
+        t = furl.Template('http://example.com/a b/%7E{/x}')
+        assert t.expand(x='c') == 'http://example.com/a%20b/%7E/c'
+        assert str(t) == 'http://example.com/a b/%7E{/x}'
+
+    def test_unicode_prefix(self):
+        t = furl.Template('{x:2}')
+        assert t.expand(x=u'éèê') == '%C3%A9%C3%A8'
+        assert t.expand(x='\xc3\xa9\xc3\xa8\xc3\xaa') == '%C3%A9%C3%A8'
+
+    def test_invalid_templates(self):
+        invalids = ['{', '}', 'a{b', '{}', '{=var}', '{var:0}', '{var:10000}',
+                    '{a b}', '{var*:3}', '{,}']
+        for template in invalids:
+            self.assertRaises(ValueError, furl.Template, template)
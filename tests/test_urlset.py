@@ -0,0 +1,94 @@
+#
+# furl - URL manipulation made simple.
+#
+# Arthur Grunseid
+# grunseid.com
+# grunseid@gmail.com
+#
+# License: Build Amazing Things (Unlicense)
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import furl
+
+
+class TestURLSet(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.urls = ['http://www.pumps.com/%d/?a=%d' % (i, i) for i in range(2000)]
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_exact(self):
+        urlset = furl.URLSet(capacity=10)
+        assert not urlset and len(urlset) == 0 and not urlset.approximate
+
+        urlset.add('http://www.google.com/a')
+        assert 'HTTP://WWW.Google.com:80/b/../a' in urlset
+        assert furl.Furl('http://www.google.com/a') in urlset
+        assert 'http://www.google.com/b' not in urlset
+        assert len(urlset) == 1
+
+        # Adding the same canonical URL again is a no-op.
+        urlset.add(furl.Furl('http://www.google.com:80/a'))
+        assert len(urlset) == 1
+
+        # The set grows past its initial capacity.
+        urlset.update(self.urls)
+        assert len(urlset) == len(self.urls) + 1
+        assert all(url in urlset for url in self.urls)
+        assert 'http://www.pumps.com/2000/?a=2000' not in urlset
+
+    def test_approximate(self):
+        urlset = furl.URLSet(capacity=len(self.urls), error_rate=0.01)
+        assert urlset.approximate and not urlset
+
+        urlset.update(self.urls)
+        urlset.add(furl.Furl(self.urls[0]))
+        assert all(url in urlset for url in self.urls)
+        assert furl.Furl(self.urls[0]) in urlset
+        assert len(urlset) <= len(self.urls)
+
+        others = ['http://www.dumps.com/%d' % i for i in range(2000)]
+        false_positives = sum(1 for url in others if url in urlset)
+        assert false_positives < 60
+
+    def test_profile_and_seed(self):
+        profile = furl.CanonicalProfile(drop_fragment=True)
+        urlset = furl.URLSet(profile=profile, seed=7)
+        urlset.add('http://a.com/#one')
+        assert 'http://a.com/#two' in urlset
+        assert 'http://a.com/#two' not in furl.URLSet(seed=7)
+
+    def test_save_and_load(self):
+        for error_rate in [None, 0.001]:
+            urlset = furl.URLSet(capacity=len(self.urls), error_rate=error_rate,
+                                 seed=3)
+            urlset.update(self.urls)
+            path = os.path.join(self.tmpdir, 'urls')
+            urlset.save(path)
+
+            for use_mmap in [True, False]:
+                loaded = furl.URLSet.load(path, use_mmap=use_mmap)
+                assert loaded.seed == 3 and len(loaded) == len(urlset)
+                assert loaded.approximate == urlset.approximate
+                assert all(url in loaded for url in self.urls)
+
+                # Loaded sets can be modified, but the file isn't.
+                loaded.update('http://new.com/%d' % i for i in range(2000))
+                assert 'http://new.com/1999' in loaded
+                assert 'http://new.com/1999' not in furl.URLSet.load(path)
+
+    def test_invalid(self):
+        self.assertRaises(ValueError, furl.URLSet, capacity=0)
+        self.assertRaises(ValueError, furl.URLSet, error_rate=1.5)
+        self.assertRaises(ValueError, furl.URLSet().add, 'http://a.com:0/')
+
+        path = os.path.join(self.tmpdir, 'invalid')
+        with open(path, 'wb') as f:
+            f.write('not a url set')
+        self.assertRaises(ValueError, furl.URLSet.load, path)
@@ -0,0 +1,85 @@
+#
+# furl - URL manipulation made simple.
+#
+# Arthur Grunseid
+# grunseid.com
+# grunseid@gmail.com
+#
+# License: Build Amazing Things (Unlicense)
+
+import os
+import random
+import shutil
+import tempfile
+import unittest
+
+import furl
+
+
+class TestURLStore(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.urls = sorted(['http://www.pumps.com/%d/?a=%d' % (i, i) for i in range(500)] +
+                           ['https://a.com/' + 'x' * 300 + str(i) for i in range(50)] +
+                           [u'http://\xe9.com/\xe9'.encode('utf8')])
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_store(self):
+        shuffled = list(self.urls) + self.urls[:10]
+        random.Random(0).shuffle(shuffled)
+        store = furl.URLStore(shuffled, block_size=7)
+        self.check(store)
+        assert store.nbytes < sum(len(url) for url in self.urls) / 2
+
+    def test_lookups(self):
+        store = furl.URLStore(self.urls)
+        assert furl.Furl(self.urls[0]) in store
+        assert store.index(furl.Furl(self.urls[3])) == 3
+        assert u'http://\xe9.com/\xe9' in store
+        for url in ['', 'a', 'http://www.pumps.com/', 'zzz']:
+            assert url not in store
+            self.assertRaises(ValueError, store.index, url)
+        self.assertRaises(IndexError, store.__getitem__, len(self.urls))
+        assert store[-1] == self.urls[-1]
+
+    def test_prefixes(self):
+        store = furl.URLStore(self.urls, block_size=5)
+        for prefix in ['http://www.pumps.com/1', 'http://www.pumps.com/49',
+                       'https://a.com/', 'http', '', 'zzz', 'a']:
+            expected = [url for url in self.urls if url.startswith(prefix)]
+            assert list(store.iterprefix(prefix)) == expected
+        furls = list(store.iterfurls('http://www.pumps.com/499'))
+        assert furls == [furl.Furl('http://www.pumps.com/499/?a=499')]
+
+    def test_save_and_load(self):
+        store = furl.URLStore(self.urls, block_size=3)
+        path = os.path.join(self.tmpdir, 'urls.store')
+        store.save(path)
+        for use_mmap in [True, False]:
+            loaded = furl.URLStore.load(path, use_mmap=use_mmap)
+            assert loaded.block_size == 3
+            self.check(loaded)
+
+        with open(path, 'wb') as f:
+            f.write('garbage')
+        self.assertRaises(ValueError, furl.URLStore.load, path)
+
+    def test_presorted_and_empty(self):
+        store = furl.URLStore(iter(self.urls), presorted=True)
+        assert list(store) == self.urls
+        self.assertRaises(ValueError, furl.URLStore, ['b', 'a'], presorted=True)
+        self.assertRaises(ValueError, furl.URLStore, [], block_size=0)
+
+        empty = furl.URLStore()
+        assert not empty and len(empty) == 0 and list(empty) == []
+        assert 'a' not in empty and list(empty.iterprefix('')) == []
+
+    def check(self, store):
+        assert len(store) == len(self.urls)
+        assert list(store) == self.urls
+        for i, url in enumerate(self.urls):
+            assert store[i] == url
+            assert store.index(url) == i
+            assert url in store